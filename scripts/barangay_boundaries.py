@@ -0,0 +1,112 @@
+"""
+Barangay boundary index for Basey, Samar
+Point-in-polygon lookups against Barangay.shp.json with a bbox prefilter
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from spatial_index import GridIndex
+
+BARANGAY_GEOJSON_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'Barangay.shp.json')
+
+# Rough bounding box for Basey (the bbox in lgus/basey.json, used by LGUConfig.within)
+BASEY_BBOX = {'lat_min': 11.2, 'lat_max': 11.6, 'lng_min': 124.9, 'lng_max': 125.4}
+# SERVICE_AREA in src/app/api/routes/calculate/route.ts (also fetch-roads/fetch-tiles)
+SERVICE_AREA_BBOX = {'lat_min': 11.1, 'lat_max': 11.5, 'lng_min': 124.8, 'lng_max': 125.3}
+
+Ring = List[Tuple[float, float]]
+
+
+@dataclass
+class Barangay:
+    name: str  # BARANGAY property as stored in the GeoJSON (upper case)
+    index: int
+    polygons: List[List[Ring]]  # [polygon][ring][(lng, lat)]
+    bbox: Tuple[float, float, float, float] = field(default=(0.0, 0.0, 0.0, 0.0))  # lng_min, lat_min, lng_max, lat_max
+
+    def contains(self, lng: float, lat: float) -> bool:
+        """Ray-casting test across all rings (mirrors barangayBoundaries.ts)"""
+        lng_min, lat_min, lng_max, lat_max = self.bbox
+        if not (lng_min <= lng <= lng_max and lat_min <= lat <= lat_max):
+            return False
+        for polygon in self.polygons:
+            if point_in_polygon(lng, lat, polygon):
+                return True
+        return False
+
+
+def point_in_polygon(x: float, y: float, polygon: List[Ring]) -> bool:
+    """Even-odd ray cast; holes toggle the result back"""
+    inside = False
+    for ring in polygon:
+        j = len(ring) - 1
+        for i in range(len(ring)):
+            xi, yi = ring[i]
+            xj, yj = ring[j]
+            if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+                inside = not inside
+            j = i
+    return inside
+
+
+def is_within_bbox(lat: float, lng: float, bbox: Optional[dict] = None) -> bool:
+    """Check if coordinates are within the Basey bounding box"""
+    bbox = bbox or BASEY_BBOX
+    return bbox['lat_min'] <= lat <= bbox['lat_max'] and bbox['lng_min'] <= lng <= bbox['lng_max']
+
+
+class BarangayIndex:
+    """All barangay polygons, loaded once and queried many times"""
+
+    def __init__(self, barangays: List[Barangay]):
+        self.barangays = barangays
+        # Bbox grid so a lookup only ray-casts the one or two nearby polygons;
+        # buckets keep list order, so the first match still wins
+        self.grid = GridIndex(cell_deg=0.01)
+        for barangay in barangays:
+            lng_min, lat_min, lng_max, lat_max = barangay.bbox
+            self.grid.insert(barangay, lat_min, lng_min, lat_max, lng_max)
+
+    @classmethod
+    def load(cls, filepath: str = BARANGAY_GEOJSON_PATH) -> 'BarangayIndex':
+        """Load barangay polygons from a GeoJSON FeatureCollection"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        barangays = []
+        for i, feature in enumerate(data.get('features', [])):
+            props = feature.get('properties') or {}
+            geom = feature.get('geometry') or {}
+            name = props.get('BARANGAY')
+            if not name or geom.get('type') not in ('Polygon', 'MultiPolygon'):
+                continue
+
+            raw = geom['coordinates'] if geom['type'] == 'MultiPolygon' else [geom['coordinates']]
+            polygons = [
+                [[(float(c[0]), float(c[1])) for c in ring] for ring in polygon]
+                for polygon in raw
+            ]
+            lngs = [p[0] for polygon in polygons for p in polygon[0]]
+            lats = [p[1] for polygon in polygons for p in polygon[0]]
+            barangays.append(Barangay(
+                name=name,
+                index=props.get('BRGY_INDEX') or i,
+                polygons=polygons,
+                bbox=(min(lngs), min(lats), max(lngs), max(lats)),
+            ))
+        return cls(barangays)
+
+    def find(self, lat: float, lng: float) -> Optional[Barangay]:
+        """Return the barangay containing the point, if any"""
+        for barangay in self.grid.at(lat, lng):
+            if barangay.contains(lng, lat):
+                return barangay
+        return None
+
+    def find_name(self, lat: float, lng: float) -> Optional[str]:
+        """Return the containing barangay's name, if any"""
+        barangay = self.find(lat, lng)
+        return barangay.name if barangay else None
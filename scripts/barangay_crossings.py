@@ -0,0 +1,272 @@
+"""
+Barangay adjacency and road border crossings, precomputed
+Neighbours come from the shared arcs of barangay_topology: an arc with a
+different barangay on each side is a stretch of common border. The source
+polygons are not cleanly noded everywhere, so barangays whose borders cross
+or run within a few metres of each other (the boundary_validation sweep's
+overlap and gap pairs) are neighbours too, with the length of border that
+runs within that tolerance. Every road
+segment in basey-roads.geojson is intersected once with those arcs, so the
+barangays a route passes through are lookups on (road feature, segment)
+rather than polygon tests.
+
+    topology = build_topology(geojson['features'])
+    crossings = CrossingIndex(names, build_adjacency(topology, names, geojson['features']),
+                              build_crossings(topology, names, roads),
+                              road_starts(roads, BarangayIndex.load(), names))
+    crossings.neighbours('SULOD')
+"""
+
+import json
+import math
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from barangay_boundaries import BarangayIndex
+from barangay_topology import Topology
+from boundary_validation import DEFAULT_GAP_TOLERANCE_M, validate_boundaries
+from spatial_index import METRES_PER_DEGREE, GridIndex, SegmentIndex
+
+ADJACENCY_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'barangay-adjacency.json')
+CROSSINGS_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'road-barangay-crossings.json')
+OUTSIDE = -1  # no barangay (sea, outside Basey, or the unnamed polygon)
+
+
+@dataclass
+class Crossing:
+    feature: int  # road feature in basey-roads.geojson
+    segment: int  # segment of its LineString (coordinates[segment] -> [segment + 1])
+    t: float  # position along the segment, 0..1
+    from_barangay: int  # position in names, or OUTSIDE
+    to_barangay: int
+
+
+def _ring_area(points) -> float:
+    return sum(points[i - 1][0] * points[i][1] - points[i][0] * points[i - 1][1] for i in range(len(points))) / 2
+
+
+def arc_sides(topology: Topology, feature_barangay: List[int]) -> List[Tuple[int, int]]:
+    """(barangay on the left, barangay on the right) of every arc, in its stored direction"""
+    sides = [[OUTSIDE, OUTSIDE] for _ in topology.arcs]
+    for feature, barangay in zip(topology.features, feature_barangay):
+        for polygon in feature.polygons:
+            for r, ring in enumerate(polygon):
+                # Interior is left of a counter-clockwise exterior and of a clockwise hole
+                interior_left = (_ring_area(topology.ring_coordinates(ring)) > 0) != (r > 0)
+                for ref in ring:
+                    forward = ref >= 0
+                    sides[ref if forward else ~ref][0 if forward == interior_left else 1] = barangay
+    return [(left, right) for left, right in sides]
+
+
+def feature_barangays(topology: Topology, names: List[str]) -> List[int]:
+    positions = {name: i for i, name in enumerate(names)}
+    return [positions.get(f.properties.get('BARANGAY'), OUTSIDE) for f in topology.features]
+
+
+def build_adjacency(topology: Topology, names: List[str], features: Optional[List[dict]] = None,
+                    tolerance_m: float = DEFAULT_GAP_TOLERANCE_M) -> Dict[Tuple[int, int], float]:
+    """{(a, b): shared border in metres} for a < b
+
+    Shared arcs give exact borders. With the source features, pairs whose
+    borders cross or come within tolerance_m without sharing an arc are
+    added with the length of border that runs within tolerance_m (0 where
+    they only touch or cross).
+    """
+    feature_barangay = feature_barangays(topology, names)
+    sides = arc_sides(topology, feature_barangay)
+    borders: Dict[Tuple[int, int], float] = defaultdict(float)
+    for (left, right), xy in zip(sides, topology.arcs_m):
+        if left == OUTSIDE or right == OUTSIDE or left == right:
+            continue
+        length = float(sum(math.dist(p, q) for p, q in zip(xy, xy[1:])))
+        borders[(min(left, right), max(left, right))] += length
+
+    if features is not None:
+        positions = {name: i for i, name in enumerate(names)}
+        report = validate_boundaries(features, tolerance_m)
+        contacts = {
+            tuple(sorted(positions[name] for name in defect.barangays))
+            for defect in report.defects
+            if defect.kind in ('overlap', 'gap', 'unnoded') and len(set(defect.barangays)) == 2
+            and all(name in positions for name in defect.barangays)
+        }
+        rings = _barangay_rings(topology, feature_barangay)
+        for a, b in contacts - set(borders):
+            borders[(a, b)] = max(_near_border_m(rings[a], rings[b], tolerance_m),
+                                  _near_border_m(rings[b], rings[a], tolerance_m))
+    return dict(borders)
+
+
+def _barangay_rings(topology: Topology, feature_barangay: List[int]) -> Dict[int, List[list]]:
+    rings: Dict[int, List[list]] = defaultdict(list)
+    for feature, barangay in zip(topology.features, feature_barangay):
+        for polygon in feature.polygons:
+            rings[barangay].extend(topology.ring_coordinates(ring) for ring in polygon)
+    return rings
+
+
+def _near_border_m(rings: List[list], other_rings: List[list], tolerance_m: float) -> float:
+    """Length (m) of the edges of `rings` with both ends within tolerance_m of `other_rings`"""
+    other = SegmentIndex(cell_deg=0.002)
+    for ring in other_rings:
+        other.add_linestring(ring, None)
+    length = 0.0
+    for ring in rings:
+        near = [other.nearest(lat, lng, tolerance_m) is not None for lng, lat in ring]
+        for (p, q), p_near, q_near in zip(zip(ring, ring[1:]), near, near[1:]):
+            if p_near and q_near:
+                dx = (q[0] - p[0]) * math.cos(math.radians(p[1]))
+                length += math.hypot(dx, q[1] - p[1]) * METRES_PER_DEGREE
+    return length
+
+
+def build_crossings(topology: Topology, names: List[str], roads: dict) -> List[Crossing]:
+    """Every point where a road segment crosses an arc, in road order"""
+    sides = arc_sides(topology, feature_barangays(topology, names))
+    grid = GridIndex(cell_deg=0.005)
+    for arc, (left, right) in zip(topology.arcs, sides):
+        if left == right:
+            continue
+        for (ax, ay), (bx, by) in zip(arc, arc[1:]):
+            grid.insert((ax, ay, bx, by, left, right), min(ay, by), min(ax, bx), max(ay, by), max(ax, bx))
+
+    crossings = []
+    for f, feature in enumerate(roads.get('features', [])):
+        geom = feature.get('geometry') or {}
+        if geom.get('type') != 'LineString':
+            continue
+        line = geom['coordinates']
+        for s, (p, q) in enumerate(zip(line, line[1:])):
+            (px, py), (qx, qy) = p[:2], q[:2]
+            rx, ry = qx - px, qy - py
+            hits = []
+            for ax, ay, bx, by, left, right in grid.within(min(py, qy), min(px, qx), max(py, qy), max(px, qx)):
+                ex, ey = bx - ax, by - ay
+                d = rx * ey - ry * ex
+                if d == 0:
+                    continue  # parallel: a road running along a border doesn't cross it
+                t = ((ax - px) * ey - (ay - py) * ex) / d
+                u = ((ax - px) * ry - (ay - py) * rx) / d
+                # Half-open on both, so a crossing at a shared vertex counts once
+                if 0 < t <= 1 and 0 <= u < 1:
+                    # Moving to the left of the arc means entering its left barangay
+                    entering_left = ex * ry - ey * rx > 0
+                    hits.append((t, right if entering_left else left, left if entering_left else right))
+            for t, from_barangay, to_barangay in sorted(hits):
+                crossings.append(Crossing(f, s, t, from_barangay, to_barangay))
+    return crossings
+
+
+def road_starts(roads: dict, index: BarangayIndex, names: List[str]) -> List[int]:
+    """Barangay at the first vertex of every road feature"""
+    positions = {name: i for i, name in enumerate(names)}
+    starts = []
+    for feature in roads.get('features', []):
+        geom = feature.get('geometry') or {}
+        if geom.get('type') != 'LineString' or not geom['coordinates']:
+            starts.append(OUTSIDE)
+            continue
+        lng, lat = geom['coordinates'][0][:2]
+        starts.append(positions.get(index.find_name(lat, lng), OUTSIDE))
+    return starts
+
+
+class CrossingIndex:
+    """Lookups over the two artifacts; no geometry at query time"""
+
+    def __init__(self, names: List[str], adjacency: Dict[Tuple[int, int], float], crossings: List[Crossing],
+                 starts: Optional[List[int]] = None):
+        self.names = names
+        self.neighbour_lists: Dict[int, Dict[int, float]] = defaultdict(dict)
+        for (a, b), metres in adjacency.items():
+            self.neighbour_lists[a][b] = metres
+            self.neighbour_lists[b][a] = metres
+        self.by_segment: Dict[Tuple[int, int], List[Crossing]] = defaultdict(list)
+        for crossing in crossings:
+            self.by_segment[(crossing.feature, crossing.segment)].append(crossing)
+        self.starts = starts or []
+
+    def name(self, barangay: int) -> Optional[str]:
+        return self.names[barangay] if barangay != OUTSIDE else None
+
+    def neighbours(self, name: str) -> List[Tuple[str, float]]:
+        """Bordering barangays with the shared border length (m), longest first"""
+        if name not in self.names:
+            raise KeyError(f"Unknown barangay {name!r}; expected one of {', '.join(sorted(self.names))}")
+        barangay = self.names.index(name)
+        return sorted(((self.names[b], m) for b, m in self.neighbour_lists[barangay].items()),
+                      key=lambda item: -item[1])
+
+    def route_crossings(self, steps: Iterable[Tuple[int, int, bool]]) -> List[Crossing]:
+        """Border crossings along a route given as (road feature, segment, forward) steps"""
+        result = []
+        for feature, segment, forward in steps:
+            hits = self.by_segment.get((feature, segment), [])
+            if forward:
+                result.extend(hits)
+            else:
+                result.extend(Crossing(c.feature, c.segment, c.t, c.to_barangay, c.from_barangay)
+                              for c in reversed(hits))
+        return result
+
+    def route_barangays(self, steps: Iterable[Tuple[int, int, bool]]) -> List[str]:
+        """Barangays a route passes through, in order (needs the road starts)"""
+        steps = list(steps)
+        if not steps:
+            return []
+        feature, segment, forward = steps[0]
+        current = self.barangay_at(feature, segment if forward else segment + 1)
+        sequence = [current]
+        for crossing in self.route_crossings(steps):
+            if crossing.to_barangay != sequence[-1]:
+                sequence.append(crossing.to_barangay)
+        return [self.names[b] for b in sequence if b != OUTSIDE]
+
+    def barangay_at(self, feature: int, vertex: int) -> int:
+        """Barangay at a road vertex: the feature's start plus the crossings before it"""
+        current = self.starts[feature]
+        for segment in range(vertex):
+            for crossing in self.by_segment.get((feature, segment), ()):
+                current = crossing.to_barangay
+        return current
+
+    def to_artifacts(self, roads: dict) -> Tuple[dict, dict]:
+        """(adjacency, crossings) artifacts; crossings hold [feature, segment, t, from, to] rows"""
+        edges = sorted({(min(a, b), max(a, b), round(m, 1))
+                        for a, others in self.neighbour_lists.items() for b, m in others.items()})
+        adjacency = {'barangays': self.names, 'edges': [list(edge) for edge in edges]}
+        rows = [[c.feature, c.segment, round(c.t, 4), c.from_barangay, c.to_barangay]
+                for key in sorted(self.by_segment) for c in self.by_segment[key]]
+        crossings = {
+            'barangays': self.names,
+            'outside': OUTSIDE,
+            'roads': {'features': len(roads.get('features', []))},
+            'starts': self.starts,
+            'crossings': rows,
+        }
+        return adjacency, crossings
+
+    @classmethod
+    def from_artifacts(cls, adjacency: dict, crossings: dict, roads: Optional[dict] = None) -> 'CrossingIndex':
+        """Rebuild the index; with roads, refuse crossings built from a different road network"""
+        if roads is not None:
+            expected = crossings.get('roads', {}).get('features')
+            actual = len(roads.get('features', []))
+            if expected != actual:
+                raise ValueError(f"Crossings were built for {expected} road features but the roads have {actual}; "
+                                 f"rerun build-barangay-crossings.py")
+        edges = {(a, b): m for a, b, m in adjacency['edges']}
+        rows = [Crossing(*row) for row in crossings['crossings']]
+        return cls(adjacency['barangays'], edges, rows, crossings['starts'])
+
+    @classmethod
+    def load(cls, adjacency_path: str = ADJACENCY_PATH, crossings_path: str = CROSSINGS_PATH,
+             roads: Optional[dict] = None) -> 'CrossingIndex':
+        with open(adjacency_path, 'r', encoding='utf-8') as f:
+            adjacency = json.load(f)
+        with open(crossings_path, 'r', encoding='utf-8') as f:
+            crossings = json.load(f)
+        return cls.from_artifacts(adjacency, crossings, roads)
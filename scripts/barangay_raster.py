@@ -0,0 +1,211 @@
+"""
+Precomputed point-to-barangay lookup raster
+Rasterises the barangay polygons onto a fixed grid over the service area
+(grown to cover the northern barangays that extend past it).
+Each cell holds the barangay (1-based position in the index, 0 = none) that
+contains the whole cell, or BOUNDARY when a polygon edge crosses it; only
+those cells need an exact polygon test, so most lookups are one array index.
+
+    raster = build_raster(BarangayIndex.load(), cell_m=20)
+    raster.find_name(11.2801, 125.0689)
+"""
+
+import base64
+import json
+import math
+import os
+import zlib
+from typing import List, Optional
+
+import numpy as np
+
+from barangay_boundaries import SERVICE_AREA_BBOX, Barangay, BarangayIndex
+from spatial_index import METRES_PER_DEGREE
+
+RASTER_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'barangay-raster.json')
+BOUNDARY = 255
+OUTSIDE = 0
+
+
+class BarangayRaster:
+    def __init__(self, grid: np.ndarray, bbox: dict, cell_m: float, names: List[str],
+                 index: Optional[BarangayIndex] = None):
+        self.grid = grid
+        self.bbox = bbox
+        self.cell_m = cell_m
+        self.names = names
+        self.index = index  # exact fallback for BOUNDARY cells
+        self.rows, self.cols = grid.shape
+        self.dlat = (bbox['lat_max'] - bbox['lat_min']) / self.rows
+        self.dlng = (bbox['lng_max'] - bbox['lng_min']) / self.cols
+
+    def cell(self, lat: float, lng: float) -> Optional[int]:
+        """Raw cell value, or None outside the raster"""
+        r = math.floor((lat - self.bbox['lat_min']) / self.dlat)
+        c = math.floor((lng - self.bbox['lng_min']) / self.dlng)
+        if 0 <= r < self.rows and 0 <= c < self.cols:
+            return int(self.grid[r, c])
+        return None
+
+    def find_name(self, lat: float, lng: float) -> Optional[str]:
+        value = self.cell(lat, lng)
+        if value is None or value == BOUNDARY:
+            return self.index.find_name(lat, lng) if self.index else None
+        return self.names[value - 1] if value else None
+
+    def find_positions(self, lats, lngs) -> np.ndarray:
+        """Vectorised lookup: 1-based barangay position per point, 0 outside every barangay"""
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+        r = np.floor((lats - self.bbox['lat_min']) / self.dlat).astype(int)
+        c = np.floor((lngs - self.bbox['lng_min']) / self.dlng).astype(int)
+        on_grid = (r >= 0) & (r < self.rows) & (c >= 0) & (c < self.cols)
+        values = np.full(len(lats), BOUNDARY, dtype=np.int32)
+        values[on_grid] = self.grid[r[on_grid], c[on_grid]]
+        positions = {name: i + 1 for i, name in enumerate(self.names)}
+        for i in np.nonzero(values == BOUNDARY)[0]:
+            name = self.index.find_name(lats[i], lngs[i]) if self.index else None
+            values[i] = positions.get(name, OUTSIDE)
+        return values
+
+    def to_artifact(self) -> dict:
+        """JSON-serialisable artifact: header plus zlib/base64 of the uint8 grid"""
+        return {
+            'bbox': self.bbox,
+            'cellM': self.cell_m,
+            'rows': self.rows,
+            'cols': self.cols,
+            'rowOrder': 'south-to-north',
+            'boundaryValue': BOUNDARY,
+            'barangays': self.names,
+            'encoding': 'zlib+base64 uint8 row-major',
+            'data': base64.b64encode(zlib.compress(self.grid.tobytes(), 9)).decode('ascii'),
+        }
+
+    @classmethod
+    def from_artifact(cls, artifact: dict, index: Optional[BarangayIndex] = None) -> 'BarangayRaster':
+        raw = zlib.decompress(base64.b64decode(artifact['data']))
+        grid = np.frombuffer(raw, dtype=np.uint8).reshape(artifact['rows'], artifact['cols'])
+        return cls(grid, artifact['bbox'], artifact['cellM'], artifact['barangays'], index)
+
+    @classmethod
+    def load(cls, path: str = RASTER_PATH, index: Optional[BarangayIndex] = None) -> 'BarangayRaster':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_artifact(json.load(f), index)
+
+    @classmethod
+    def load_or_build(cls, index: BarangayIndex, path: str = RASTER_PATH) -> 'BarangayRaster':
+        """The committed artifact when present, else a fresh 20 m build"""
+        if os.path.exists(path):
+            return cls.load(path, index)
+        return build_raster(index)[0]
+
+
+def grid_shape(bbox: dict, cell_m: float):
+    lat_mid = (bbox['lat_min'] + bbox['lat_max']) / 2
+    height_m = (bbox['lat_max'] - bbox['lat_min']) * METRES_PER_DEGREE
+    width_m = (bbox['lng_max'] - bbox['lng_min']) * METRES_PER_DEGREE * math.cos(math.radians(lat_mid))
+    return max(1, round(height_m / cell_m)), max(1, round(width_m / cell_m))
+
+
+def _fill_centres(barangay: Barangay, rows: int, cols: int, bbox: dict, dlat: float, dlng: float):
+    """Even-odd scanline fill over the barangay's bbox window
+
+    Returns (row slice, col slice, mask) with mask True where the cell
+    centre is inside the barangay.
+    """
+    lng_min, lat_min, lng_max, lat_max = barangay.bbox
+    r0 = max(0, math.floor((lat_min - bbox['lat_min']) / dlat))
+    r1 = min(rows, math.ceil((lat_max - bbox['lat_min']) / dlat) + 1)
+    c0 = max(0, math.floor((lng_min - bbox['lng_min']) / dlng))
+    c1 = min(cols, math.ceil((lng_max - bbox['lng_min']) / dlng) + 1)
+    height, width = max(0, r1 - r0), max(0, c1 - c0)
+    # Window origin, so the same centre formulas apply inside it
+    y0 = bbox['lat_min'] + r0 * dlat
+    x0 = bbox['lng_min'] + c0 * dlng
+
+    toggles = np.zeros((height, width + 1), dtype=np.int16)
+    for polygon in barangay.polygons:
+        for ring in polygon:
+            pts = np.asarray(ring, dtype=float)
+            x1, y1 = pts[:, 0], pts[:, 1]
+            x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+            # Row centres y with (y1 > y) != (y2 > y), i.e. min <= y < max
+            lo = np.ceil((np.minimum(y1, y2) - y0) / dlat - 0.5).astype(int)
+            hi = np.ceil((np.maximum(y1, y2) - y0) / dlat - 0.5).astype(int)
+            lo, hi = np.clip(lo, 0, height), np.clip(hi, 0, height)
+            for e in np.nonzero(hi > lo)[0]:
+                r = np.arange(lo[e], hi[e])
+                y = y0 + (r + 0.5) * dlat
+                x = x1[e] + (y - y1[e]) * (x2[e] - x1[e]) / (y2[e] - y1[e])
+                # First cell whose centre lies right of the crossing
+                c = np.clip(np.floor((x - x0) / dlng - 0.5).astype(int) + 1, 0, width)
+                np.add.at(toggles, (r, c), 1)
+    mask = (np.cumsum(toggles, axis=1)[:, :width] % 2).astype(bool)
+    return slice(r0, r1), slice(c0, c1), mask
+
+
+def _mark_edges(barangay: Barangay, boundary: np.ndarray, bbox: dict, dlat: float, dlng: float):
+    """Flag every cell a polygon edge passes through (grid traversal per edge)"""
+    rows, cols = boundary.shape
+    for polygon in barangay.polygons:
+        for ring in polygon:
+            for (lng1, lat1), (lng2, lat2) in zip(ring, ring[1:] + ring[:1]):
+                x1 = (lng1 - bbox['lng_min']) / dlng
+                y1 = (lat1 - bbox['lat_min']) / dlat
+                x2 = (lng2 - bbox['lng_min']) / dlng
+                y2 = (lat2 - bbox['lat_min']) / dlat
+                c, r = math.floor(x1), math.floor(y1)
+                c_end, r_end = math.floor(x2), math.floor(y2)
+                step_c = 1 if x2 > x1 else -1
+                step_r = 1 if y2 > y1 else -1
+                dx, dy = abs(x2 - x1), abs(y2 - y1)
+                t_dc = 1 / dx if dx else math.inf
+                t_dr = 1 / dy if dy else math.inf
+                t_c = ((c + 1 - x1) if step_c > 0 else (x1 - c)) * t_dc if dx else math.inf
+                t_r = ((r + 1 - y1) if step_r > 0 else (y1 - r)) * t_dr if dy else math.inf
+                for _ in range(abs(c_end - c) + abs(r_end - r) + 1):
+                    if 0 <= r < rows and 0 <= c < cols:
+                        boundary[r, c] = True
+                    if c == c_end and r == r_end:
+                        break
+                    if t_c < t_r:
+                        c += step_c
+                        t_c += t_dc
+                    else:
+                        r += step_r
+                        t_r += t_dr
+
+
+def raster_bbox(index: BarangayIndex) -> dict:
+    """The service area, grown to cover barangays that extend past it"""
+    return {
+        'lat_min': min([SERVICE_AREA_BBOX['lat_min']] + [b.bbox[1] for b in index.barangays]),
+        'lat_max': max([SERVICE_AREA_BBOX['lat_max']] + [b.bbox[3] for b in index.barangays]),
+        'lng_min': min([SERVICE_AREA_BBOX['lng_min']] + [b.bbox[0] for b in index.barangays]),
+        'lng_max': max([SERVICE_AREA_BBOX['lng_max']] + [b.bbox[2] for b in index.barangays]),
+    }
+
+
+def build_raster(index: BarangayIndex, cell_m: float = 20, bbox: Optional[dict] = None):
+    """Rasterise the index; returns (raster, centre-sampled grid without boundary marks)"""
+    bbox = bbox or raster_bbox(index)
+    rows, cols = grid_shape(bbox, cell_m)
+    dlat = (bbox['lat_max'] - bbox['lat_min']) / rows
+    dlng = (bbox['lng_max'] - bbox['lng_min']) / cols
+    if len(index.barangays) >= BOUNDARY:
+        raise ValueError(f"At most {BOUNDARY - 1} barangays fit in a uint8 raster")
+
+    centres = np.zeros((rows, cols), dtype=np.uint8)
+    boundary = np.zeros((rows, cols), dtype=bool)
+    # Paint in reverse so the first barangay wins overlaps, as BarangayIndex.find does
+    for position in range(len(index.barangays) - 1, -1, -1):
+        barangay = index.barangays[position]
+        row_slice, col_slice, mask = _fill_centres(barangay, rows, cols, bbox, dlat, dlng)
+        centres[row_slice, col_slice][mask] = position + 1
+        _mark_edges(barangay, boundary, bbox, dlat, dlng)
+
+    grid = centres.copy()
+    grid[boundary] = BOUNDARY
+    names = [b.name for b in index.barangays]
+    return BarangayRaster(grid, bbox, cell_m, names, index), centres
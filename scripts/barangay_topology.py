@@ -0,0 +1,347 @@
+"""
+Shared-arc topology and simplification for the barangay polygons
+Rings are cut at junctions (vertices where more than two boundaries meet)
+into arcs, and each arc shared by neighbouring barangays is stored once.
+Simplifying arcs instead of rings keeps adjacent boundaries identical, so
+no gaps or slivers open between barangays at any level of detail.
+
+    topology = build_topology(geojson['features'])
+    weights = vertex_weights(topology, method='visvalingam')
+    features = topology.to_features(topology.masks_within(weights, max_error_m=20))
+"""
+
+import heapq
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from spatial_index import METRES_PER_DEGREE
+
+Point = Tuple[float, float]
+REF_LAT = 11.39  # middle of the barangay extent, for the local projection
+METHODS = ('visvalingam', 'douglas-peucker')
+
+
+@dataclass
+class TopoFeature:
+    properties: dict
+    geometry_type: str  # Polygon or MultiPolygon
+    polygons: List[List[List[int]]]  # [polygon][ring][arc ref]; ~i means arc i reversed
+
+
+class Topology:
+    def __init__(self, arcs: List[List[Point]], features: List[TopoFeature]):
+        self.arcs = arcs
+        self.features = features
+        lng_scale = math.cos(math.radians(REF_LAT))
+        # Arcs in local metres for weights and error measurement
+        self.arcs_m = [
+            np.array([(lng * METRES_PER_DEGREE * lng_scale, lat * METRES_PER_DEGREE) for lng, lat in arc])
+            for arc in arcs
+        ]
+
+    def ring_arcs(self):
+        for feature in self.features:
+            for polygon in feature.polygons:
+                yield from polygon
+
+    def shared_arc_count(self) -> int:
+        uses = defaultdict(int)
+        for ring in self.ring_arcs():
+            for ref in ring:
+                uses[ref if ref >= 0 else ~ref] += 1
+        return sum(1 for count in uses.values() if count > 1)
+
+    def vertex_count(self, masks: Optional[List[np.ndarray]] = None) -> int:
+        """Vertices stored once per arc (what TopoJSON ships)"""
+        if masks is None:
+            return sum(len(arc) for arc in self.arcs)
+        return sum(int(mask.sum()) for mask in masks)
+
+    def masks_within(self, weights: List[np.ndarray], max_error_m: float) -> List[np.ndarray]:
+        """Per-arc masks that drop as many vertices as possible within max_error_m
+
+        Each arc gets the highest weight threshold whose simplified line stays
+        within max_error_m of every original vertex, so the level is a distance
+        bound whatever the weighting method.
+        """
+        masks = []
+        for xy, w in zip(self.arcs_m, weights):
+            thresholds = np.unique(w[np.isfinite(w)])
+            lo, hi = 0, len(thresholds) - 1  # thresholds[0] keeps every vertex
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if _arc_error(xy, w >= thresholds[mid]) <= max_error_m:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            # Error is not strictly monotone in the threshold; step down until it holds
+            while lo > 0 and _arc_error(xy, w >= thresholds[lo]) > max_error_m:
+                lo -= 1
+            masks.append(w >= thresholds[lo] if len(thresholds) else np.ones(len(w), dtype=bool))
+        return masks
+
+    def arc_errors(self, masks: List[np.ndarray]) -> np.ndarray:
+        """Largest distance (m) from a dropped vertex to its simplified arc, per arc
+
+        Kept vertices are a subset of the originals, so this is the
+        original-to-simplified half of the Hausdorff distance, which
+        dominates for vertex-subset simplification.
+        """
+        return np.array([_arc_error(xy, mask) for xy, mask in zip(self.arcs_m, masks)])
+
+    def feature_errors(self, arc_errors: np.ndarray) -> List[float]:
+        return [
+            max((arc_errors[ref if ref >= 0 else ~ref] for polygon in f.polygons for ring in polygon
+                 for ref in ring), default=0.0)
+            for f in self.features
+        ]
+
+    def ring_coordinates(self, ring: List[int], masks: Optional[List[np.ndarray]] = None) -> List[Point]:
+        coords: List[Point] = []
+        for ref in ring:
+            index = ref if ref >= 0 else ~ref
+            arc = self.arcs[index]
+            if masks is not None:
+                arc = [p for p, keep in zip(arc, masks[index]) if keep]
+            if ref < 0:
+                arc = arc[::-1]
+            coords.extend(arc if not coords else arc[1:])
+        return coords
+
+    def to_features(self, masks: Optional[List[np.ndarray]] = None, precision: int = 6) -> List[dict]:
+        """GeoJSON features (2D, rounded) rebuilt from the kept arc vertices"""
+        features = []
+        for feature in self.features:
+            polygons = [
+                [[[round(lng, precision), round(lat, precision)] for lng, lat in self.ring_coordinates(ring, masks)]
+                 for ring in polygon]
+                for polygon in feature.polygons
+            ]
+            features.append({
+                'type': 'Feature',
+                'properties': feature.properties,
+                'geometry': {
+                    'type': feature.geometry_type,
+                    'coordinates': polygons[0] if feature.geometry_type == 'Polygon' else polygons,
+                },
+            })
+        return features
+
+    def to_topojson(self, masks: Optional[List[np.ndarray]] = None, quantization: int = 100_000,
+                    object_name: str = 'barangays') -> dict:
+        """TopoJSON with quantised, delta-encoded arcs"""
+        arcs = [
+            [p for p, keep in zip(arc, mask) if keep] if masks is not None else arc
+            for arc, mask in zip(self.arcs, masks or [None] * len(self.arcs))
+        ]
+        lngs = [p[0] for arc in arcs for p in arc]
+        lats = [p[1] for arc in arcs for p in arc]
+        x0, y0 = min(lngs), min(lats)
+        kx = (max(lngs) - x0) / (quantization - 1) or 1
+        ky = (max(lats) - y0) / (quantization - 1) or 1
+
+        encoded = []
+        for arc in arcs:
+            out, px, py = [], 0, 0
+            for lng, lat in arc:
+                x, y = round((lng - x0) / kx), round((lat - y0) / ky)
+                if out and x == px and y == py:
+                    continue  # collapsed by quantisation
+                out.append([x - px, y - py])
+                px, py = x, y
+            if len(out) < 2:
+                out.append([0, 0])  # arcs need two positions
+            encoded.append(out)
+
+        geometries = [
+            {
+                'type': f.geometry_type,
+                'arcs': f.polygons[0] if f.geometry_type == 'Polygon' else f.polygons,
+                'properties': f.properties,
+            }
+            for f in self.features
+        ]
+        return {
+            'type': 'Topology',
+            'bbox': [x0, y0, max(lngs), max(lats)],
+            'transform': {'scale': [kx, ky], 'translate': [x0, y0]},
+            'objects': {object_name: {'type': 'GeometryCollection', 'geometries': geometries}},
+            'arcs': encoded,
+        }
+
+
+def _clean_ring(ring) -> List[Point]:
+    """2D points without the closing vertex or consecutive repeats"""
+    points: List[Point] = []
+    for c in ring:
+        p = (float(c[0]), float(c[1]))
+        if not points or points[-1] != p:
+            points.append(p)
+    if len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+    return points
+
+
+def build_topology(features: List[dict]) -> Topology:
+    """Cut every ring at junctions and deduplicate the resulting arcs"""
+    parsed = []
+    for feature in features:
+        geom = feature.get('geometry') or {}
+        if geom.get('type') not in ('Polygon', 'MultiPolygon'):
+            continue
+        raw = geom['coordinates'] if geom['type'] == 'MultiPolygon' else [geom['coordinates']]
+        parsed.append((feature, geom['type'], [[_clean_ring(ring) for ring in polygon] for polygon in raw]))
+
+    # A vertex is a junction when its boundaries arrive from more than two directions
+    neighbours: Dict[Point, set] = defaultdict(set)
+    for _, _, polygons in parsed:
+        for polygon in polygons:
+            for ring in polygon:
+                n = len(ring)
+                for i, p in enumerate(ring):
+                    neighbours[p].add(ring[i - 1])
+                    neighbours[p].add(ring[(i + 1) % n])
+    junctions = {p for p, adjacent in neighbours.items() if len(adjacent) > 2}
+
+    arcs: List[List[Point]] = []
+    arc_ids: Dict[tuple, int] = {}
+
+    def add_arc(points: List[Point]) -> int:
+        key = tuple(points)
+        if key in arc_ids:
+            return arc_ids[key]
+        if key[::-1] in arc_ids:
+            return ~arc_ids[key[::-1]]
+        arcs.append(points)
+        arc_ids[key] = len(arcs) - 1
+        return len(arcs) - 1
+
+    topo_features = []
+    for feature, geometry_type, polygons in parsed:
+        topo_polygons = []
+        for polygon in polygons:
+            topo_rings = []
+            for ring in polygon:
+                cuts = [i for i, p in enumerate(ring) if p in junctions]
+                if not cuts:
+                    # Junction-free ring (island or enclave): start at its smallest
+                    # vertex so a neighbour tracing it backwards finds the same arc
+                    start = ring.index(min(ring))
+                    rotated = ring[start:] + ring[:start]
+                    topo_rings.append([add_arc(rotated + rotated[:1])])
+                    continue
+                rotated = ring[cuts[0]:] + ring[:cuts[0]]
+                closed = rotated + rotated[:1]
+                refs, begin = [], 0
+                for i in range(1, len(closed)):
+                    if closed[i] in junctions:
+                        refs.append(add_arc(closed[begin:i + 1]))
+                        begin = i
+                topo_rings.append(refs)
+            topo_polygons.append(topo_rings)
+        topo_features.append(TopoFeature(feature.get('properties') or {}, geometry_type, topo_polygons))
+    return Topology(arcs, topo_features)
+
+
+def _triangle_area(xy: np.ndarray, a: int, b: int, c: int) -> float:
+    (ax, ay), (bx, by), (cx, cy) = xy[a], xy[b], xy[c]
+    return abs((bx - ax) * (cy - ay) - (cx - ax) * (by - ay)) / 2
+
+
+def visvalingam_weights(xy: np.ndarray) -> np.ndarray:
+    """Effective area of each vertex, as sqrt(m²) so it compares to a tolerance in metres"""
+    n = len(xy)
+    weights = np.full(n, np.inf)
+    if n < 3:
+        return weights
+    prev = list(range(-1, n - 1))
+    nxt = list(range(1, n + 1))
+    area = [0.0] * n
+    heap = []
+    for i in range(1, n - 1):
+        area[i] = _triangle_area(xy, i - 1, i, i + 1)
+        heap.append((area[i], i))
+    heapq.heapify(heap)
+
+    removed = [False] * n
+    floor = 0.0
+    while heap:
+        a, i = heapq.heappop(heap)
+        if removed[i] or a != area[i]:
+            continue  # stale entry
+        # A vertex never outranks one removed before it
+        floor = max(floor, a)
+        weights[i] = math.sqrt(floor)
+        removed[i] = True
+        p, q = prev[i], nxt[i]
+        nxt[p], prev[q] = q, p
+        for j in (p, q):
+            if 0 < j < n - 1:
+                area[j] = _triangle_area(xy, prev[j], j, nxt[j])
+                heapq.heappush(heap, (area[j], j))
+    return weights
+
+
+def douglas_peucker_weights(xy: np.ndarray) -> np.ndarray:
+    """Distance (m) at which each vertex would be dropped by Douglas-Peucker"""
+    n = len(xy)
+    weights = np.full(n, np.inf)
+    stack = [(0, n - 1, np.inf)]
+    while stack:
+        a, b, cap = stack.pop()
+        if b - a < 2:
+            continue
+        distances = _points_to_polyline(xy[a + 1:b], xy[[a, b]])
+        k = a + 1 + int(np.argmax(distances))
+        # Capped by the parent split so thresholds nest like a real DP run
+        weights[k] = min(float(distances[k - a - 1]), cap)
+        stack.append((a, k, weights[k]))
+        stack.append((k, b, weights[k]))
+    return weights
+
+
+def vertex_weights(topology: Topology, method: str = 'visvalingam') -> List[np.ndarray]:
+    """Per-arc vertex weights; a vertex survives while its weight >= the tolerance
+
+    Rings built from one or two arcs keep enough interior vertices to stay a
+    polygon at any tolerance.
+    """
+    weigh = visvalingam_weights if method == 'visvalingam' else douglas_peucker_weights
+    weights = [weigh(xy) for xy in topology.arcs_m]
+
+    min_interior = defaultdict(int)
+    for ring in topology.ring_arcs():
+        if len(ring) <= 2:
+            for ref in ring:
+                index = ref if ref >= 0 else ~ref
+                min_interior[index] = max(min_interior[index], 3 - len(ring))
+    for index, keep in min_interior.items():
+        interior = weights[index][1:-1]
+        for k in np.argsort(interior)[::-1][:keep]:
+            interior[k] = np.inf
+    return weights
+
+
+def _arc_error(xy: np.ndarray, mask: np.ndarray) -> float:
+    """Largest distance (m) from a dropped vertex to the kept vertices' polyline"""
+    if mask.all():
+        return 0.0
+    return float(_points_to_polyline(xy[~mask], xy[mask]).max())
+
+
+def _points_to_polyline(points: np.ndarray, line: np.ndarray) -> np.ndarray:
+    """Distance from each point to the nearest segment of a polyline"""
+    if len(line) == 1:
+        return np.hypot(*(points - line[0]).T)
+    a, b = line[:-1], line[1:]
+    ab = b - a
+    length2 = (ab ** 2).sum(axis=1)
+    length2[length2 == 0] = 1e-12
+    ap = points[:, None, :] - a[None, :, :]
+    t = np.clip((ap * ab[None]).sum(axis=2) / length2[None], 0, 1)
+    closest = a[None] + t[..., None] * ab[None]
+    return np.sqrt(((points[:, None, :] - closest) ** 2).sum(axis=2)).min(axis=1)
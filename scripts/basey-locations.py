@@ -0,0 +1,13 @@
+"""
+Basey location tools in one command: collect, find, find-osm, clean, verify, export
+
+Usage:
+    python scripts/basey-locations.py --help
+    python scripts/basey-locations.py find --provider fake --provider-url scripts/fixtures/geocoding-searches.json --dry-run
+    python scripts/basey-locations.py export locations.geojson
+"""
+
+from basey_locations.cli import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Basey location tools as a library
+
+    from basey_locations import fetch_osm_response, find_new_osm_locations, load_gazetteer
+    data = load_gazetteer()
+    new = find_new_osm_locations(fetch_osm_response(fixture='fixture.json'), data)
+
+Each submodule is imported on first use, so importing the package is free.
+The scripts/ directory must be on sys.path (it is when running anything in
+scripts/) because the package builds on the flat helper modules there.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'collect_locations': 'collect',
+    'find_new_locations': 'find',
+    'find_new_osm_locations': 'find',
+    'fetch_osm_response': 'find',
+    'clean_locations': 'clean',
+    'verify_locations': 'verify',
+    'export_locations': 'export',
+    'load_gazetteer': 'gazetteer',
+    'merge_locations': 'gazetteer',
+    'save_gazetteer': 'gazetteer',
+    'load_lgu': 'lgu',
+    'load_lgus': 'lgu',
+    'build_lgu': 'build',
+    'snapshot_dataset': 'snapshots',
+    'apply_patch': 'snapshots',
+    'update_plan': 'snapshots',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'basey_locations' has no attribute '{name}'")
+    return getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
@@ -0,0 +1,3 @@
+from basey_locations.cli import main
+
+main()
@@ -0,0 +1,274 @@
+"""
+Build the gazetteers of several LGUs in parallel
+Each LGU config (scripts/lgus/*.json; see lgu.py) is built in its own worker
+process: collect -> merge -> PSA check -> verify -> export, with the
+worker's output in the LGU's build log. The expensive shared input is read
+once in the parent: one Overpass query (or one pass over a .osm.pbf
+extract) covering every LGU's bbox, partitioned per LGU into
+.builds/cache/. The search query history (.collectors/query-history.json)
+is shared too; QueryScheduler.save locks it.
+
+    python scripts/basey-locations.py build --jobs 4
+    python scripts/basey-locations.py build --lgu scripts/lgus/basey.json --osm-fixture fixtures/overpass-basey-sample.json --dry-run
+
+Google Places searches are opt-in (--google) because every LGU spends the
+same API key and quota.
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional
+
+from barangay_boundaries import BarangayIndex
+from run_metrics import RunMetrics
+
+from .gazetteer import SCRIPTS_DIR, empty_gazetteer, load_gazetteer, merge_locations, save_gazetteer
+from .lgu import LGU_DIR, LGUConfig, load_lgus
+
+BUILD_DIR = os.path.join(SCRIPTS_DIR, '..', '.builds')
+CACHE_DIR = os.path.join(BUILD_DIR, 'cache')
+
+
+class LGUAreas:
+    """Which LGU a point falls in: its bbox, then its barangay polygons when it has them"""
+
+    def __init__(self, lgus: List[LGUConfig]):
+        self.lgus = lgus
+        self.indexes = {lgu.slug: BarangayIndex.load(lgu.boundary) if lgu.boundary else None for lgu in lgus}
+
+    def find(self, lat: float, lng: float) -> Optional[LGUConfig]:
+        for lgu in self.lgus:
+            index = self.indexes[lgu.slug]
+            if lgu.within(lat, lng) and (index is None or index.find(lat, lng) is not None):
+                return lgu
+        return None
+
+    def union_bbox(self) -> dict:
+        return {
+            'lat_min': min(lgu.bbox['lat_min'] for lgu in self.lgus),
+            'lat_max': max(lgu.bbox['lat_max'] for lgu in self.lgus),
+            'lng_min': min(lgu.bbox['lng_min'] for lgu in self.lgus),
+            'lng_max': max(lgu.bbox['lng_max'] for lgu in self.lgus),
+        }
+
+
+def _element_point(element: dict):
+    if 'lat' in element:
+        return element['lat'], element['lon']
+    center = element.get('center')
+    return (center['lat'], center['lon']) if center else (None, None)
+
+
+def fetch_shared_osm(areas: LGUAreas, fixture: Optional[str] = None, pbf: Optional[str] = None,
+                     refresh: bool = False, metrics: Optional[RunMetrics] = None) -> List[dict]:
+    """Every named POI element in the union of the LGUs' bboxes, read or fetched once
+
+    Overpass and extract results are cached under .builds/cache/ by source and
+    bbox; --refresh ignores the cache.
+    """
+    from osm_extract import build_query, fetch_overpass, load_response
+
+    metrics = metrics or RunMetrics('build')
+    bbox = areas.union_bbox()
+    if fixture:
+        print(f"🗺️  Reading OpenStreetMap response from {fixture}...")
+        with metrics.span('osm'):
+            return load_response(fixture).get('elements', [])
+
+    source = f"pbf:{os.path.abspath(pbf)}:{os.path.getmtime(pbf)}" if pbf else 'overpass'
+    key = hashlib.sha256(json.dumps([source, bbox, sorted(areas.indexes)]).encode()).hexdigest()[:12]
+    cache_path = os.path.join(CACHE_DIR, f"osm-{key}.json")
+    if not refresh and os.path.exists(cache_path):
+        print(f"🗺️  Using cached OpenStreetMap elements {os.path.relpath(cache_path)}")
+        with metrics.span('osm'), open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)['elements']
+
+    with metrics.span('osm'):
+        if pbf:
+            from osm_pbf import read_pbf
+
+            print(f"🗺️  Streaming OpenStreetMap extract {pbf} for {len(areas.lgus)} LGU(s)...")
+            elements, _ = read_pbf(pbf, areas, bbox=bbox, roads=False)
+        else:
+            print(f"🗺️  Querying OpenStreetMap (Overpass) once for {len(areas.lgus)} LGU(s)...")
+            elements = fetch_overpass(build_query(bbox)).get('elements', [])
+            metrics.count('queries')
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({'source': source, 'bbox': bbox, 'elements': elements}, f, ensure_ascii=False)
+    return elements
+
+
+def partition_elements(elements: List[dict], areas: LGUAreas) -> Dict[str, List[dict]]:
+    """{slug: elements inside that LGU}; elements outside every LGU are dropped"""
+    parts: Dict[str, List[dict]] = {lgu.slug: [] for lgu in areas.lgus}
+    for element in elements:
+        lat, lng = _element_point(element)
+        if lat is None:
+            continue
+        lgu = areas.find(lat, lng)
+        if lgu is not None:
+            parts[lgu.slug].append(element)
+    return parts
+
+
+def missing_psa_barangays(data: dict, lgu: LGUConfig) -> List[str]:
+    """PSA barangays with no gazetteer entry of the same canonical name"""
+    from location_names import AliasTable
+
+    aliases = AliasTable.load()
+    known = {aliases.canonical_id(loc['name']) for locs in data.get('locations', {}).values() for loc in locs}
+    return [name for name in lgu.psa_barangays if aliases.canonical_id(name) not in known]
+
+
+def build_lgu(lgu: LGUConfig, osm_path: str, google: bool = False, dry_run: bool = False,
+              scheduler_options: Optional[dict] = None) -> dict:
+    """Build one LGU (runs in a worker process); returns its summary row"""
+    log_path = lgu.output('log') or os.path.join(BUILD_DIR, lgu.slug, 'build.log')
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    started = time.perf_counter()
+    summary = {'lgu': lgu.municipality, 'slug': lgu.slug, 'log': log_path}
+    with open(log_path, 'w', encoding='utf-8') as log, redirect_stdout(log):
+        try:
+            summary.update(_build(lgu, osm_path, google, dry_run, scheduler_options))
+        except BaseException as error:  # SystemExit included: one LGU failing must not stop the others
+            print(f"❌ {type(error).__name__}: {error}")
+            summary['error'] = str(error) or type(error).__name__
+    summary['seconds'] = round(time.perf_counter() - started, 2)
+    return summary
+
+
+def _build(lgu: LGUConfig, osm_path: str, google: bool, dry_run: bool,
+           scheduler_options: Optional[dict]) -> dict:
+    from geocoding import GooglePlacesProvider
+
+    from .collect import collect_locations
+    from .export import export_locations
+    from .verify import print_summary, verify_locations
+
+    print("=" * 60)
+    print(f"Basey Fare Check - BUILD {lgu.municipality.upper()}, {lgu.province.upper()}")
+    print("=" * 60)
+
+    metrics = RunMetrics(f'build-{lgu.slug}')
+    gazetteer_path = lgu.output('gazetteer') or os.path.join(BUILD_DIR, lgu.slug, 'locations.json')
+    with metrics.span('load'):
+        data = load_gazetteer(gazetteer_path, missing_ok=True)
+        if not data['locations']:
+            data = empty_gazetteer()
+            data['metadata'].update({'municipality': lgu.municipality, 'province': lgu.province})
+        with open(osm_path, 'r', encoding='utf-8') as f:
+            elements = json.load(f)
+
+    api_key = os.environ.get('GOOGLE_MAPS_API_KEY') if google else None
+    new_locations = collect_locations(GooglePlacesProvider(api_key) if api_key else None, None, None,
+                                      scheduler_options, data, metrics, lgu, elements)
+    merged = merge_locations(data, new_locations)
+    print(f"\n✨ {len(new_locations)} new locations")
+    if not dry_run:
+        os.makedirs(os.path.dirname(os.path.abspath(gazetteer_path)), exist_ok=True)
+        with metrics.span('write'):
+            save_gazetteer(merged, gazetteer_path)
+        print(f"💾 {gazetteer_path}")
+
+    missing = missing_psa_barangays(merged, lgu)
+    for name in missing:
+        print(f"  ⚠️  Missing PSA barangay: {name}")
+
+    results = verify_locations(merged, metrics, boundaries=lgu.boundary, bbox=lgu.bbox)
+    issues = print_summary(results)
+
+    exported = None
+    if not dry_run and lgu.output('export'):
+        os.makedirs(os.path.dirname(lgu.output('export')), exist_ok=True)
+        with metrics.span('export'):
+            export_locations(merged, lgu.output('export'))
+        exported = lgu.output('export')
+    metrics.report()
+    return {
+        'new': len(new_locations),
+        'total': merged['metadata']['total_locations'],
+        'missing_psa': len(missing),
+        'issues': len(issues),
+        'boundary_errors': sum(1 for d in results.get('boundaries', []) if d.is_error),
+        'export': exported,
+    }
+
+
+def add_arguments(parser):
+    from query_scheduler import add_scheduler_arguments
+
+    parser.add_argument('--lgu', action='append', default=[], metavar='PATH',
+                        help='LGU config file or directory (repeatable; default: scripts/lgus)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='LGUs built at once')
+    parser.add_argument('--pbf', default=os.environ.get('OSM_PBF'),
+                        help='read OpenStreetMap from one local .osm.pbf extract (env OSM_PBF)')
+    parser.add_argument('--osm-fixture', help='read a saved Overpass response instead of querying')
+    parser.add_argument('--refresh', action='store_true', help='ignore the cached OpenStreetMap elements')
+    parser.add_argument('--google', action='store_true',
+                        help='also search Google Places for every LGU (needs GOOGLE_MAPS_API_KEY)')
+    parser.add_argument('--dry-run', action='store_true', help='build and verify without writing gazetteers')
+    add_scheduler_arguments(parser)
+
+
+def run(args):
+    from query_scheduler import scheduler_options
+
+    print("=" * 60)
+    print("Basey Fare Check - LGU BUILD")
+    print("=" * 60)
+
+    metrics = RunMetrics('build')
+    lgus = [lgu for path in args.lgu or [LGU_DIR] for lgu in load_lgus(path)]
+    slugs = [lgu.slug for lgu in lgus]
+    if not lgus:
+        raise SystemExit("❌ No LGU configs found")
+    if len(set(slugs)) != len(slugs):
+        raise SystemExit(f"❌ Duplicate LGU slugs: {', '.join(sorted({s for s in slugs if slugs.count(s) > 1}))}")
+    print(f"🏘️  {len(lgus)} LGU(s): {', '.join(lgu.municipality for lgu in lgus)}\n")
+
+    areas = LGUAreas(lgus)
+    elements = fetch_shared_osm(areas, args.osm_fixture, args.pbf, args.refresh, metrics)
+    with metrics.span('partition'):
+        parts = partition_elements(elements, areas)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    osm_paths = {}
+    for lgu in lgus:
+        osm_paths[lgu.slug] = os.path.join(CACHE_DIR, f"{lgu.slug}-osm.json")
+        with open(osm_paths[lgu.slug], 'w', encoding='utf-8') as f:
+            json.dump(parts[lgu.slug], f, ensure_ascii=False)
+        print(f"  {lgu.slug}: {len(parts[lgu.slug])} of {len(elements)} OSM elements")
+    outside = len(elements) - sum(len(part) for part in parts.values())
+    metrics.count('osm_elements', len(elements))
+    metrics.count('osm_outside', outside)
+
+    # The budget is per LGU, so each worker starts its own clock
+    options = scheduler_options(args)
+    jobs = max(1, min(args.jobs, len(lgus)))
+    print(f"\n🚀 Building with {jobs} worker(s)...")
+    summaries = []
+    with metrics.span('build'), ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(build_lgu, lgu, osm_paths[lgu.slug], args.google, args.dry_run, options)
+                   for lgu in lgus]
+        for future in as_completed(futures):
+            summary = future.result()
+            summaries.append(summary)
+            status = '❌' if 'error' in summary else '✅'
+            print(f"  {status} {summary['lgu']} ({summary['seconds']:.1f}s) -> {summary['log']}")
+
+    print(f"\n{'LGU':<20} {'new':>5} {'total':>6} {'PSA?':>5} {'issues':>7}")
+    for summary in sorted(summaries, key=lambda s: s['slug']):
+        if 'error' in summary:
+            print(f"{summary['lgu']:<20} failed: {summary['error']}")
+            continue
+        print(f"{summary['lgu']:<20} {summary['new']:>5} {summary['total']:>6} "
+              f"{summary['missing_psa']:>5} {summary['issues']:>7}")
+    if args.dry_run:
+        print("\n🔍 Dry run - no gazetteers written")
+    metrics.report()
+    if any('error' in summary for summary in summaries):
+        raise SystemExit(1)
@@ -0,0 +1,237 @@
+"""
+Clean and Verify Location Data
+Helps review unverified locations and mark them as verified or remove them
+
+Usage:
+    python scripts/clean-locations.py                                          # interactive menu
+    python scripts/clean-locations.py --rules scripts/location-rules.json --dry-run
+    python scripts/clean-locations.py --rules scripts/location-rules.json      # apply and save
+"""
+
+from .gazetteer import LOCATIONS_PATH, load_gazetteer, save_gazetteer
+
+def load_locations(filepath=LOCATIONS_PATH):
+    """Load location data"""
+    return load_gazetteer(filepath), filepath
+
+def save_locations(data, filepath):
+    """Save location data"""
+    save_gazetteer(data, filepath)
+
+def verify_all_osm_locations(data):
+    """Mark all OSM locations as verified"""
+    count = 0
+    for loc_type in data['locations'].values():
+        for loc in loc_type:
+            if loc.get('source') == 'osm' and not loc.get('verified'):
+                loc['verified'] = True
+                count += 1
+    return count
+
+def remove_barangay_halls_from_sitios(data):
+    """Move barangay halls from sitios to landmarks"""
+    if 'sitio' not in data['locations']:
+        return 0
+    
+    def is_hall(loc):
+        name = loc['name'].lower()
+        return 'hall' in name or 'barangay' in name
+
+    # Partition once instead of list.remove per hall (quadratic on big imports)
+    sitios = data['locations']['sitio']
+    to_move = [loc for loc in sitios if is_hall(loc)]
+    data['locations']['sitio'] = [loc for loc in sitios if not is_hall(loc)]
+
+    for loc in to_move:
+        loc['type'] = 'landmark'
+    data['locations'].setdefault('landmark', []).extend(to_move)
+    moved = len(to_move)
+    
+    # Remove sitio category if empty
+    if not data['locations']['sitio']:
+        del data['locations']['sitio']
+    
+    return moved
+
+def list_unverified_by_category(data):
+    """Show unverified locations grouped by category"""
+    print("\n📋 Unverified Locations by Category:\n")
+    
+    categories = {
+        'Schools': ['school', 'elementary', 'high school', 'learning'],
+        'Churches': ['church', 'chapel', 'cathedral', 'parish'],
+        'Government': ['hall', 'town hall', 'barangay'],
+        'Health': ['hospital', 'clinic', 'health'],
+        'Tourism': ['cave', 'waterfall', 'beach', 'resort', 'park'],
+        'Infrastructure': ['bridge', 'terminal', 'wharf', 'gymnasium'],
+        'Other': []
+    }
+    
+    unverified = []
+    for loc_type in data['locations'].values():
+        for loc in loc_type:
+            if not loc.get('verified'):
+                unverified.append(loc)
+    
+    categorized = {cat: [] for cat in categories}
+    
+    for loc in unverified:
+        name_lower = loc['name'].lower()
+        matched = False
+        
+        for cat, keywords in categories.items():
+            if cat == 'Other':
+                continue
+            if any(kw in name_lower for kw in keywords):
+                categorized[cat].append(loc)
+                matched = True
+                break
+        
+        if not matched:
+            categorized['Other'].append(loc)
+    
+    for cat, locs in categorized.items():
+        if locs:
+            print(f"  {cat} ({len(locs)}):")
+            for loc in sorted(locs, key=lambda x: x['name'])[:15]:
+                print(f"    • {loc['name']}")
+            if len(locs) > 15:
+                print(f"    ... and {len(locs) - 15} more")
+            print()
+
+def clean_locations(data, rules_path):
+    """Apply a rules file to data; returns (cleaned copy, [Change], rules)"""
+    # location_rules pulls in NumPy; only pay for it when rules actually run
+    from location_rules import RuleError, apply_rules, load_rules
+
+    try:
+        rules = load_rules(rules_path)
+    except RuleError as e:
+        raise SystemExit(f"❌ Invalid rules file: {e}")
+    cleaned, changes = apply_rules(data, rules)
+    return cleaned, changes, rules
+
+def run_rules(rules_path, input_path, output_path=None, dry_run=False):
+    """Apply a rules file in one pass, print the changes, save unless dry_run"""
+    from location_rules import format_change
+
+    data, filepath = load_locations(input_path)
+    cleaned, changes, rules = clean_locations(data, rules_path)
+
+    print(f"\n📋 {len(rules)} rules from {rules_path}\n")
+    for change in changes:
+        print(f"  {format_change(change)}")
+    by_action = {}
+    for change in changes:
+        by_action[change.action] = by_action.get(change.action, 0) + 1
+    summary = ', '.join(f"{action}: {count}" for action, count in by_action.items()) or 'no changes'
+    print(f"\n📊 {summary}; {data['metadata']['total_locations']} -> "
+          f"{cleaned['metadata']['total_locations']} locations")
+
+    if dry_run:
+        print("\n🔍 Dry run - nothing saved")
+    elif changes:
+        save_locations(cleaned, output_path or filepath)
+        print(f"\n💾 Saved to {output_path or filepath}")
+    return changes
+
+def interactive_menu(data, filepath):
+    print("=" * 70)
+    print("BASEY LOCATION DATA - CLEANING & VERIFICATION")
+    print("=" * 70)
+    
+    print("\n📊 Current Status:")
+    print(f"  Total Locations: {data['metadata']['total_locations']}")
+    
+    total_verified = sum(
+        1 for loc_type in data['locations'].values() 
+        for loc in loc_type if loc.get('verified')
+    )
+    total_unverified = data['metadata']['total_locations'] - total_verified
+    
+    print(f"  Verified: {total_verified}")
+    print(f"  Unverified: {total_unverified}")
+    
+    # Show unverified by category
+    list_unverified_by_category(data)
+    
+    # Options
+    print("=" * 70)
+    print("OPTIONS:")
+    print("=" * 70)
+    print("1. Verify ALL OSM locations (mark all 101 as verified)")
+    print("2. Fix sitios category (move barangay halls to landmarks)")
+    print("3. Show detailed verification report")
+    print("4. Exit without changes")
+    print()
+    
+    choice = input("Select option (1-4): ").strip()
+    
+    if choice == '1':
+        count = verify_all_osm_locations(data)
+        print(f"\n✅ Marked {count} OSM locations as verified")
+        
+        # Update metadata
+        data['metadata']['total_locations'] = sum(
+            len(locs) for locs in data['locations'].values()
+        )
+        
+        # Save
+        save_locations(data, filepath)
+        print(f"💾 Saved to {filepath}")
+        
+    elif choice == '2':
+        moved = remove_barangay_halls_from_sitios(data)
+        print(f"\n✅ Moved {moved} barangay halls from sitios to landmarks")
+        
+        # Update metadata
+        data['metadata']['total_locations'] = sum(
+            len(locs) for locs in data['locations'].values()
+        )
+        
+        # Save
+        save_locations(data, filepath)
+        print(f"💾 Saved to {filepath}")
+        
+    elif choice == '3':
+        print("\n📊 Detailed Verification Report:\n")
+        
+        for loc_type, locs in sorted(data['locations'].items()):
+            verified = [loc for loc in locs if loc.get('verified')]
+            unverified = [loc for loc in locs if not loc.get('verified')]
+            
+            print(f"  {loc_type.upper()}S:")
+            print(f"    Total: {len(locs)}")
+            print(f"    Verified: {len(verified)}")
+            print(f"    Unverified: {len(unverified)}")
+            
+            if unverified:
+                print("    Sources: ", end='')
+                sources = {}
+                for loc in unverified:
+                    source = loc.get('source', 'unknown')
+                    sources[source] = sources.get(source, 0) + 1
+                print(', '.join(f"{k}: {v}" for k, v in sources.items()))
+            print()
+        
+    else:
+        print("\n👋 No changes made")
+    
+    print()
+
+def add_arguments(parser):
+    parser.add_argument('--rules', help='apply a rules file without prompting (e.g. scripts/location-rules.json)')
+    parser.add_argument('--dry-run', action='store_true', help='with --rules: print the changes, save nothing')
+    parser.add_argument('--input', default=LOCATIONS_PATH, help='gazetteer to clean')
+    parser.add_argument('--output', help='where to save (default: overwrite --input)')
+
+def run(args):
+    if args.rules:
+        print("=" * 70)
+        print("BASEY LOCATION DATA - RULE-BASED CLEANING")
+        print("=" * 70)
+        run_rules(args.rules, args.input, args.output, args.dry_run)
+        return
+
+    data, filepath = load_locations(args.input)
+    interactive_menu(data, filepath)
@@ -0,0 +1,52 @@
+"""
+One command line for the location tools
+
+    python scripts/basey-locations.py find --provider fake --dry-run
+    python scripts/basey-locations.py verify
+    cd scripts && python -m basey_locations export locations.geojson
+
+Only the chosen subcommand's module is imported, and only when its
+arguments are built, so `--help` and cheap commands don't pay for
+requests, NumPy or osmium.
+"""
+
+import argparse
+import importlib
+import sys
+from typing import List, Optional
+
+# name -> (module, add-arguments function, run function, summary)
+COMMANDS = {
+    'collect': ('collect', 'add_arguments', 'run', 'collect locations from GeoJSON, Google Places and OSM'),
+    'find': ('find', 'add_arguments', 'run', 'find new locations with a geocoding provider'),
+    'find-osm': ('find', 'add_osm_arguments', 'run_osm', 'find new locations in one OpenStreetMap query'),
+    'clean': ('clean', 'add_arguments', 'run', 'apply cleaning rules (or the interactive menu)'),
+    'verify': ('verify', 'add_arguments', 'run', 'check for duplicates, crowding, bounds and verification'),
+    'export': ('export', 'add_arguments', 'run', 'write the gazetteer as GeoJSON, CSV or JSON'),
+    'stream': ('pipeline', 'add_arguments', 'run', 'fetch, normalise, dedupe, verify and merge as an NDJSON stream'),
+    'build': ('build', 'add_arguments', 'run', 'build every LGU config in parallel from one shared OpenStreetMap read'),
+    'snapshot': ('snapshots', 'add_arguments', 'run', 'write versioned data snapshots, patches and a manifest for offline clients'),
+}
+
+
+def _command(name: str, part: int):
+    module, *functions = COMMANDS[name]
+    return getattr(importlib.import_module(f'basey_locations.{module}'), functions[part])
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Parser with every subcommand listed; only `command` gets its full arguments"""
+    parser = argparse.ArgumentParser(prog='basey-locations', description='Basey location data tools')
+    subparsers = parser.add_subparsers(dest='command', metavar='command', required=True)
+    for name, (_, _, _, summary) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=summary, description=summary)
+        if name == command:
+            _command(name, 0)(sub)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = next((arg for arg in argv if not arg.startswith('-')), None)
+    args = build_parser(command if command in COMMANDS else None).parse_args(argv)
+    return _command(args.command, 1)(args)
@@ -0,0 +1,415 @@
+"""
+Comprehensive Location Data Collector for Basey, Samar
+Uses Google Maps API, OpenStreetMap, and PSA data to gather all known locations
+
+Municipality-specific data (bbox, PSA barangays, query templates, landmarks,
+paths) comes from an LGU config (lgu.py; scripts/lgus/basey.json by default).
+
+Google and OSM queries are scheduled by past yield under one shared budget
+(--budget-seconds / --max-queries; see query_scheduler.py) and run through
+geocoding.py providers. --osm-provider-url points the OSM searches at a
+self-hosted Nominatim or Photon, which is not held to the public 1 req/s.
+"""
+
+import json
+import time
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+import os
+from barangay_boundaries import BarangayIndex
+from geocoding import GeocodingProvider, GooglePlacesProvider, NominatimProvider, Place
+from location_names import AliasTable
+from osm_extract import extract_candidates
+from osm_pbf import read_pbf
+from query_scheduler import QueryScheduler
+from run_metrics import RunMetrics
+
+from .gazetteer import LOCATIONS_PATH, load_gazetteer, merge_locations, print_new_locations, save_gazetteer
+from .lgu import BASEY_CONFIG, LGUConfig, load_lgu
+
+@dataclass
+class Location:
+    name: str
+    type: str  # barangay, sitio, landmark, poi
+    lat: float
+    lng: float
+    source: str  # google, osm, geojson, psa
+    address: str = ""
+    place_id: str = ""
+    verified: bool = False
+
+class BaseyLocationCollector:
+    def __init__(self, google_provider: Optional[GeocodingProvider] = None,
+                 osm_provider: Optional[GeocodingProvider] = None, metrics: Optional[RunMetrics] = None,
+                 scheduler_options: Optional[dict] = None, lgu: Optional[LGUConfig] = None):
+        self.google_provider = google_provider
+        self.osm_provider = osm_provider
+        self.locations: Dict[str, Location] = {}
+        self.existing_keys: set = set()  # already in the gazetteer; count as duplicates
+        self.scheduler_options = scheduler_options or {}
+        self.aliases = AliasTable.load()
+        self.metrics = metrics or RunMetrics('collect-basey-locations')
+        self.lgu = lgu or load_lgu()
+        self.center = self.lgu.center
+        self.search_radius = self.lgu.search_radius_m
+        
+        # Official PSA barangay list (2020 Census) from the LGU config
+        self.psa_barangays = self.lgu.psa_barangays
+        
+    def load_existing_geojson(self, filepath: str):
+        """Load locations from existing GeoJSON file"""
+        print("Loading existing GeoJSON data...")
+        try:
+            with self.metrics.span('parse'), open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                
+            for feature in data.get('features', []):
+                props = feature.get('properties', {})
+                geom = feature.get('geometry', {})
+                
+                geom_type = geom.get('type')
+                if (geom_type == 'Polygon' or geom_type == 'MultiPolygon') and props.get('BARANGAY'):
+                    # Calculate centroid from polygon coordinates
+                    coords = []
+                    if geom_type == 'Polygon':
+                        coords = geom.get('coordinates', [])[0]
+                    elif geom_type == 'MultiPolygon':
+                        # For MultiPolygon, get the first polygon's outer ring
+                        multi_coords = geom.get('coordinates', [])
+                        if multi_coords and len(multi_coords) > 0:
+                            coords = multi_coords[0][0]
+                    
+                    if coords:
+                        lats = [c[1] for c in coords]
+                        lngs = [c[0] for c in coords]
+                        centroid_lat = sum(lats) / len(lats)
+                        centroid_lng = sum(lngs) / len(lngs)
+                        
+                        name = props['BARANGAY'].title()
+                        key = self._normalize_name(name)
+                        
+                        if key not in self.locations:
+                            self.locations[key] = Location(
+                                name=name,
+                                type='barangay',
+                                lat=centroid_lat,
+                                lng=centroid_lng,
+                                source='geojson',
+                                address=self.lgu.address(name),
+                                verified=True
+                            )
+            print(f"Loaded {len(self.locations)} locations from GeoJSON")
+        except Exception as e:
+            print(f"Error loading GeoJSON: {e}")
+    
+    def _normalize_name(self, name: str) -> str:
+        """Resolve a location name to its canonical ID for comparison"""
+        return self.aliases.canonical_id(name)
+    
+    def _scheduled(self, provider: str, queries: List[str]) -> QueryScheduler:
+        scheduler = QueryScheduler.load(provider, queries, **self.scheduler_options)
+        scheduler.plan()
+        if scheduler.skipped_backoff:
+            print(f"  📅 {len(scheduler.skipped_backoff)} queries backed off after returning nothing")
+        return scheduler
+    
+    def search_google_places(self):
+        """Search Google Places API for locations in the municipality"""
+        if not self.google_provider:
+            print("⚠️  Google API key not provided, skipping Google search")
+            return
+            
+        print("\n🔍 Searching Google Places API...")
+        
+        # Expanded search types - focus on sitios and landmarks
+        self._run_searches(self.google_provider, self.lgu.queries.get('google', []))
+    
+    def search_openstreetmap(self, pbf_path: Optional[str] = None):
+        """Search OpenStreetMap via Nominatim/Photon, or a local .osm.pbf extract if given"""
+        if pbf_path:
+            self.load_osm_extract(pbf_path)
+            return
+        
+        print("\n🗺️  Searching OpenStreetMap...")
+        
+        self._run_searches(self.osm_provider or NominatimProvider(), self.lgu.queries.get('osm', []))
+    
+    def _run_searches(self, provider: GeocodingProvider, queries: List[str]):
+        """Run scheduled queries through a provider at its own concurrency and rate limit"""
+        print(f"  🌐 {provider.describe()}")
+        scheduler = self._scheduled(provider.name, queries)
+        for outcome in provider.search_many(scheduler):
+            self.metrics.count('queries')
+            if outcome.error:
+                print(f"Error searching {provider.name} for '{outcome.query}': {outcome.error}")
+                scheduler.record(outcome.query, seconds=outcome.seconds, failed=True)
+                continue
+            
+            counts = {'new': 0, 'duplicate': 0, 'out_of_bounds': 0}
+            for place in outcome.places:
+                self.metrics.count('results')
+                result = self._add_place(place)
+                if result:
+                    counts[result] += 1
+            scheduler.record(outcome.query, seconds=outcome.seconds, **counts)
+        
+        scheduler.save()
+        print(f"  📅 {scheduler.summary()}")
+    
+    def _add_place(self, place: Place) -> Optional[str]:
+        """Add one search hit; returns 'new', 'duplicate', 'out_of_bounds' or None if not a location"""
+        if place.type is None:
+            return None
+        if not self.lgu.within(place.lat, place.lng):
+            self.metrics.count('out_of_bounds')
+            return 'out_of_bounds'
+        
+        with self.metrics.span('dedupe'):
+            key = self._normalize_name(place.name)
+            is_new = key not in self.locations and key not in self.existing_keys
+        if not is_new:
+            self.metrics.count('duplicates')
+            return 'duplicate'
+        
+        self.metrics.count('new')
+        self.locations[key] = Location(
+            name=place.name,
+            type=place.type,
+            lat=place.lat,
+            lng=place.lng,
+            source=place.source,
+            address=place.address,
+            place_id=place.place_id,
+            verified=place.verified
+        )
+        print(f"  ✓ Added: {place.name} ({place.type})")
+        return 'new'
+    
+    def load_osm_extract(self, pbf_path: str):
+        """Add named POIs inside the municipality from a local .osm.pbf extract (no network)"""
+        print(f"\n🗺️  Reading OpenStreetMap extract {pbf_path}...")
+        
+        with self.metrics.span('parse'):
+            index = BarangayIndex.load(self.lgu.boundary) if self.lgu.boundary else None
+            elements, _ = read_pbf(pbf_path, index, bbox=self.lgu.bbox, roads=False)
+        self.load_osm_elements(elements)
+    
+    def load_osm_elements(self, elements: List[dict]):
+        """Add named POIs from Overpass-shaped elements (an extract or a shared cache)"""
+        with self.metrics.span('parse'):
+            candidates = extract_candidates({'elements': elements}, locality=self.lgu.locality)
+        
+        for candidate in candidates:
+            self.metrics.count('results')
+            with self.metrics.span('dedupe'):
+                key = self._normalize_name(candidate['name'])
+                is_new = key not in self.locations
+            if not is_new:
+                self.metrics.count('duplicates')
+                continue
+            
+            self.metrics.count('new')
+            self.locations[key] = Location(
+                name=candidate['name'],
+                type=candidate['type'],
+                lat=candidate['coordinates']['lat'],
+                lng=candidate['coordinates']['lng'],
+                source='osm',
+                address=candidate['address'],
+                verified=False
+            )
+            print(f"  ✓ Added: {candidate['name']} ({candidate['type']})")
+    
+    def verify_psa_barangays(self):
+        """Ensure all PSA official barangays are in the collection"""
+        print("\n📋 Verifying PSA Official Barangays...")
+        
+        missing = []
+        with self.metrics.span('verify'):
+            for barangay in self.psa_barangays:
+                key = self._normalize_name(barangay)
+                if key not in self.locations:
+                    missing.append(barangay)
+                    print(f"  ⚠️  Missing: {barangay}")
+        
+        if not missing:
+            print("  ✓ All PSA barangays are present!")
+        else:
+            print(f"\n  Found {len(missing)} missing barangays")
+            print("  These need to be geocoded manually or with additional API calls")
+        
+        return missing
+    
+    def add_known_landmarks(self):
+        """Add the LGU config's well-known landmarks"""
+        print(f"\n🏛️  Adding known {self.lgu.municipality} landmarks...")
+        
+        landmarks = self.lgu.landmarks
+        
+        for landmark in landmarks:
+            key = self._normalize_name(landmark['name'])
+            if key not in self.locations:
+                self.locations[key] = Location(
+                    name=landmark['name'],
+                    type=landmark['type'],
+                    lat=landmark['lat'],
+                    lng=landmark['lng'],
+                    source='manual',
+                    address=self.lgu.address(landmark['name']),
+                    verified=True
+                )
+                print(f"  ✓ Added: {landmark['name']}")
+    
+    def export_to_json(self, output_file: str):
+        """Export collected locations to JSON file"""
+        print(f"\n💾 Exporting to {output_file}...")
+        
+        # Convert to dict and organize by type
+        organized = {
+            'metadata': {
+                'municipality': self.lgu.municipality,
+                'province': self.lgu.province,
+                'total_locations': len(self.locations),
+                'last_updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'sources': ['geojson', 'google', 'osm', 'psa', 'manual']
+            },
+            'locations': {}
+        }
+        
+        for key, loc in self.locations.items():
+            if loc.type not in organized['locations']:
+                organized['locations'][loc.type] = []
+            
+            organized['locations'][loc.type].append({
+                'name': loc.name,
+                'coordinates': {
+                    'lat': round(loc.lat, 6),
+                    'lng': round(loc.lng, 6)
+                },
+                'source': loc.source,
+                'address': loc.address,
+                'verified': loc.verified
+            })
+        
+        # Sort each type by name
+        for loc_type in organized['locations']:
+            organized['locations'][loc_type].sort(key=lambda x: x['name'])
+        
+        with self.metrics.span('write'), open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(organized, f, indent=2, ensure_ascii=False)
+        
+        # Print summary
+        print("\n📊 Collection Summary:")
+        print(f"  Total Locations: {len(self.locations)}")
+        for loc_type in organized['locations']:
+            count = len(organized['locations'][loc_type])
+            print(f"  {loc_type.title()}s: {count}")
+        
+        print(f"\n✅ Successfully exported to {output_file}")
+
+def collect_locations(google_provider=None, osm_provider=None, pbf_path: Optional[str] = None,
+            scheduler_options: Optional[dict] = None, data: Optional[dict] = None,
+            metrics: Optional[RunMetrics] = None, lgu: Optional[LGUConfig] = None,
+            osm_elements: Optional[List[dict]] = None) -> List[dict]:
+    """Run every source and return the locations not already in the gazetteer (nothing is written)
+
+    osm_elements (an already-extracted OpenStreetMap cache) replaces the OSM searches.
+    """
+    collector = BaseyLocationCollector(google_provider, osm_provider, metrics=metrics,
+                                       scheduler_options=scheduler_options, lgu=lgu)
+    
+    # Load existing locations from JSON to skip them
+    if data is None:
+        with collector.metrics.span('load'):
+            data = load_gazetteer(collector.lgu.output('gazetteer') or LOCATIONS_PATH, missing_ok=True)
+    existing_locations = set()
+    for loc_type in data.get('locations', {}).values():
+        for loc in loc_type:
+            existing_locations.add(collector._normalize_name(loc['name']))
+    if existing_locations:
+        print(f"📋 Found {len(existing_locations)} existing locations to skip")
+    else:
+        print("📋 No existing locations file found, will collect all locations")
+    collector.existing_keys = existing_locations
+    
+    # Load GeoJSON data (but only add if not in existing)
+    if collector.lgu.boundary:
+        collector.load_existing_geojson(collector.lgu.boundary)
+    
+    # Search external sources for NEW locations only
+    print("\n🔍 Searching for NEW sitios and landmarks...")
+    if google_provider:
+        collector.search_google_places()
+    if osm_elements is not None:
+        collector.load_osm_elements(osm_elements)
+    else:
+        collector.search_openstreetmap(pbf_path)
+    
+    # Filter out existing locations
+    return [
+        {
+            'name': loc.name,
+            'type': loc.type,
+            'coordinates': {'lat': loc.lat, 'lng': loc.lng},
+            'source': loc.source,
+            'address': loc.address,
+            'verified': loc.verified,
+        }
+        for key, loc in collector.locations.items()
+        if key not in existing_locations
+    ]
+
+def add_arguments(parser):
+    from geocoding import add_provider_arguments
+    from query_scheduler import add_scheduler_arguments
+    
+    add_scheduler_arguments(parser)
+    add_provider_arguments(parser, default='nominatim', choices=('nominatim', 'photon', 'fake'), prefix='osm')
+    parser.add_argument('--pbf', default=os.environ.get('OSM_PBF'),
+                        help='read OpenStreetMap from a local .osm.pbf extract instead of searching (env OSM_PBF)')
+    parser.add_argument('--lgu', default=BASEY_CONFIG, help='LGU config (municipality, bbox, queries, paths)')
+    parser.add_argument('--output', help="gazetteer to compare and add to (default: the LGU's)")
+    parser.add_argument('--dry-run', action='store_true', help='list new locations without writing')
+
+def run(args):
+    from geocoding import provider_from_args
+    from query_scheduler import scheduler_options
+    
+    # Check for Google API key
+    google_api_key = os.environ.get('GOOGLE_MAPS_API_KEY')
+    
+    if not google_api_key:
+        print("⚠️  No Google Maps API key found in environment variable GOOGLE_MAPS_API_KEY")
+        print("   The script will still work with GeoJSON, OSM, and manual data")
+        print("   To enable Google Places search, set the API key:")
+        print("   $env:GOOGLE_MAPS_API_KEY='your-api-key-here'\n")
+    
+    metrics = RunMetrics('collect-basey-locations')
+    lgu = load_lgu(args.lgu)
+    args.output = args.output or lgu.output('gazetteer') or LOCATIONS_PATH
+    with metrics.span('load'):
+        data = load_gazetteer(args.output, missing_ok=True)
+    # One clock for every provider, so --budget-seconds covers the whole run
+    new_locations = collect_locations(GooglePlacesProvider(google_api_key) if google_api_key else None,
+                                      provider_from_args(args, prefix='osm'), args.pbf,
+                                      scheduler_options(args, started=time.perf_counter()), data, metrics, lgu)
+    
+    print(f"\n✨ Found {len(new_locations)} NEW locations!")
+    
+    # Show new locations by type
+    if new_locations:
+        print()
+        print_new_locations(new_locations)
+        
+        if args.dry_run:
+            print("\n🔍 Dry run - nothing written")
+        else:
+            print(f"\n💾 Ready to add {len(new_locations)} new locations to {args.output}")
+            merged = merge_locations(data, new_locations)
+            with metrics.span('write'):
+                save_gazetteer(merged, args.output)
+            print(f"✅ Successfully added new locations! Total now: {merged['metadata']['total_locations']}")
+    else:
+        print("\n✅ No new locations found - your database is already complete!")
+    
+    metrics.report()
@@ -0,0 +1,75 @@
+"""
+Export the gazetteer for other tools
+GeoJSON (one Point feature per location, for QGIS / geojson.io), CSV (one
+row per location, for spreadsheets) or the collector's organised JSON. The
+format follows the output file's extension unless --format is given.
+"""
+
+import csv
+import json
+import os
+from typing import Iterator, Optional
+
+from .gazetteer import LOCATIONS_PATH, load_gazetteer
+
+FORMATS = ('geojson', 'csv', 'json')
+CSV_COLUMNS = ['name', 'type', 'lat', 'lng', 'source', 'address', 'verified', 'osm_id', 'osm_tag']
+
+
+def iter_locations(data: dict, types=None) -> Iterator[dict]:
+    """Every entry with its category filled in, optionally limited to some categories"""
+    for loc_type, locs in data.get('locations', {}).items():
+        if types and loc_type not in types:
+            continue
+        for loc in locs:
+            yield {**loc, 'type': loc.get('type') or loc_type}
+
+
+def to_geojson(data: dict, types=None) -> dict:
+    features = []
+    for loc in iter_locations(data, types):
+        properties = {k: v for k, v in loc.items() if k != 'coordinates'}
+        coords = loc['coordinates']
+        features.append({
+            'type': 'Feature',
+            'properties': properties,
+            'geometry': {'type': 'Point', 'coordinates': [coords['lng'], coords['lat']]},
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def export_locations(data: dict, path: str, fmt: Optional[str] = None, types=None) -> int:
+    """Write data to path; returns the number of locations written"""
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt not in FORMATS:
+        raise SystemExit(f"❌ Unknown export format '{fmt}' (choose from {', '.join(FORMATS)})")
+
+    locations = list(iter_locations(data, types))
+    with open(path, 'w', encoding='utf-8', newline='' if fmt == 'csv' else None) as f:
+        if fmt == 'geojson':
+            json.dump(to_geojson(data, types), f, ensure_ascii=False)
+        elif fmt == 'csv':
+            writer = csv.DictWriter(f, CSV_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            for loc in locations:
+                writer.writerow({**loc, 'lat': loc['coordinates']['lat'], 'lng': loc['coordinates']['lng']})
+        else:
+            organised = {'metadata': dict(data.get('metadata', {})), 'locations': {}}
+            for loc in locations:
+                organised['locations'].setdefault(loc['type'], []).append(loc)
+            organised['metadata']['total_locations'] = len(locations)
+            json.dump(organised, f, indent=2, ensure_ascii=False)
+    return len(locations)
+
+
+def add_arguments(parser):
+    parser.add_argument('output', help='file to write (.geojson, .csv or .json)')
+    parser.add_argument('--format', choices=FORMATS, help='default: from the output extension')
+    parser.add_argument('--type', action='append', dest='types', help='only this category (repeatable)')
+    parser.add_argument('--input', default=LOCATIONS_PATH, help='gazetteer to export')
+
+
+def run(args):
+    data = load_gazetteer(args.input)
+    count = export_locations(data, args.output, args.format, args.types)
+    print(f"💾 {count} locations -> {args.output}")
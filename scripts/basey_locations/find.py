@@ -0,0 +1,158 @@
+"""
+Find NEW sitios and landmarks not in the existing gazetteer
+find_new_locations runs the LGU config's "search" query templates
+(scripts/lgus/basey.json) through a geocoding provider (Google Places by
+default) in order of past yield (query_scheduler.py);
+find_new_osm_locations reads one Overpass response, saved fixture or local
+.osm.pbf extract. Both are the pipeline.py stages collected into a list of
+gazetteer-shaped entries and write nothing; run()/run_osm() add the CLI's
+reporting and merge.
+"""
+
+from typing import List, Optional
+
+from run_metrics import RunMetrics
+
+from .gazetteer import (
+    LOCATIONS_PATH,
+    count_locations,
+    load_gazetteer,
+    merge_locations,
+    print_new_locations,
+    save_gazetteer,
+)
+from .lgu import BASEY_CONFIG, LGUConfig, load_lgu
+from .pipeline import dedupe, normalise, osm_records, search_records
+
+
+def search_queries(lgu: Optional[LGUConfig] = None) -> List[str]:
+    """The LGU's text-search queries ("search" templates, filled in)"""
+    return (lgu or load_lgu()).queries.get('search', [])
+
+
+def find_new_locations(provider, queries: Optional[List[str]] = None, data: Optional[dict] = None,
+                       scheduler_options: Optional[dict] = None,
+                       metrics: Optional[RunMetrics] = None) -> List[dict]:
+    """Search every scheduled query (default: Basey's) and return the hits not already in the gazetteer"""
+    metrics = metrics or RunMetrics('find-new-locations')
+    if data is None:
+        with metrics.span('load'):
+            data = load_gazetteer()
+    if queries is None:
+        queries = search_queries()
+    records = search_records(provider, queries, data, scheduler_options, metrics)
+    return list(dedupe(normalise(records, metrics), data, metrics))
+
+
+def fetch_osm_response(fixture: Optional[str] = None, pbf: Optional[str] = None,
+                       metrics: Optional[RunMetrics] = None) -> dict:
+    """One Overpass request (or one pass over a saved response / local extract) for every named POI"""
+    from osm_extract import build_query, fetch_overpass, load_response
+
+    metrics = metrics or RunMetrics('find-new-osm-locations')
+    if fixture:
+        print(f"🗺️ Reading OpenStreetMap response from {fixture}...\n")
+        with metrics.span('parse'):
+            return load_response(fixture)
+    if pbf:
+        from barangay_boundaries import BarangayIndex
+        from osm_pbf import read_pbf
+
+        print(f"🗺️ Streaming OpenStreetMap extract {pbf}...\n")
+        with metrics.span('parse'):
+            elements, _ = read_pbf(pbf, BarangayIndex.load(), roads=False)
+        return {'elements': elements}
+
+    print("🗺️ Querying OpenStreetMap (Overpass)...\n")
+    with metrics.span('fetch'):
+        response = fetch_overpass(build_query())
+    metrics.count('queries')
+    return response
+
+
+def find_new_osm_locations(response: dict, data: Optional[dict] = None,
+                           metrics: Optional[RunMetrics] = None) -> List[dict]:
+    """Gazetteer candidates from an Overpass-shaped response that are not already known"""
+    metrics = metrics or RunMetrics('find-new-osm-locations')
+    if data is None:
+        with metrics.span('load'):
+            data = load_gazetteer()
+    records = osm_records(response, metrics)
+    return list(dedupe(normalise(records, metrics), data, metrics, log=lambda line: None))
+
+
+def _report_and_merge(new_locations: List[dict], data: dict, output: str, dry_run: bool,
+                      metrics: RunMetrics, limit: Optional[int] = None) -> bool:
+    print(f"\n✨ Found {len(new_locations)} NEW locations!\n")
+    if not new_locations:
+        return False
+
+    print_new_locations(new_locations, limit)
+    if dry_run:
+        print("\n🔍 Dry run - nothing written")
+        return False
+
+    print(f"\n💾 Adding to {output}...")
+    merged = merge_locations(data, new_locations)
+    with metrics.span('write'):
+        save_gazetteer(merged, output)
+    print(f"✅ Success! Total locations now: {merged['metadata']['total_locations']}")
+    return True
+
+
+def add_arguments(parser):
+    from geocoding import add_provider_arguments
+    from query_scheduler import add_scheduler_arguments
+
+    add_scheduler_arguments(parser)
+    add_provider_arguments(parser, default='google', choices=('google', 'nominatim', 'photon', 'fake'))
+    parser.add_argument('--lgu', default=BASEY_CONFIG, help='LGU config whose search queries to run')
+    parser.add_argument('--input', default=LOCATIONS_PATH, help='gazetteer to compare and add to')
+    parser.add_argument('--dry-run', action='store_true', help='list new locations without writing')
+
+
+def run(args):
+    from geocoding import provider_from_args
+    from query_scheduler import scheduler_options
+
+    metrics = RunMetrics('find-new-locations')
+    with metrics.span('load'):
+        data = load_gazetteer(args.input)
+    print(f"📋 Loaded {count_locations(data)} existing locations to skip\n")
+
+    provider = provider_from_args(args)
+    print(f"🔍 Searching with {provider.describe()}...\n")
+    new_locations = find_new_locations(provider, search_queries(load_lgu(args.lgu)), data,
+                                       scheduler_options(args), metrics)
+    if not _report_and_merge(new_locations, data, args.input, args.dry_run, metrics) and not new_locations:
+        print("✅ No new locations found - database is complete!")
+    metrics.report()
+
+
+def add_osm_arguments(parser):
+    parser.add_argument('--fixture', help='read a saved Overpass response instead of querying')
+    parser.add_argument('--pbf', help='read a local .osm.pbf extract instead of querying')
+    parser.add_argument('--save-response', help='also save the raw Overpass response here')
+    parser.add_argument('--input', default=LOCATIONS_PATH, help='gazetteer to compare and add to')
+    parser.add_argument('--dry-run', action='store_true', help='list new locations without writing')
+
+
+def run_osm(args):
+    import json
+
+    metrics = RunMetrics('find-new-osm-locations')
+    with metrics.span('load'):
+        data = load_gazetteer(args.input)
+    print(f"📋 Loaded {count_locations(data)} existing locations to skip\n")
+
+    response = fetch_osm_response(args.fixture, args.pbf, metrics)
+    if args.save_response:
+        with open(args.save_response, 'w', encoding='utf-8') as f:
+            json.dump(response, f, indent=2, ensure_ascii=False)
+
+    new_locations = find_new_osm_locations(response, data, metrics)
+    if _report_and_merge(new_locations, data, args.input, args.dry_run, metrics, limit=10):
+        print("\n⚠️ Note: New locations from OSM should be verified for accuracy")
+    elif not new_locations:
+        print("✅ No new locations found")
+    metrics.report()
@@ -0,0 +1,89 @@
+"""
+Reading, merging and saving src/data/basey-locations.json
+load_gazetteer parses the file once per process and re-reads it only when
+it changes on disk, so several steps in one process share one parse.
+merge_locations is the append/sort/metadata step every collector used to
+repeat.
+"""
+
+import json
+import os
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), '..')
+LOCATIONS_PATH = os.path.join(SCRIPTS_DIR, '..', 'src', 'data', 'basey-locations.json')
+
+_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+
+
+def empty_gazetteer() -> dict:
+    return {
+        'metadata': {
+            'municipality': 'Basey',
+            'province': 'Samar',
+            'total_locations': 0,
+            'sources': [],
+        },
+        'locations': {},
+    }
+
+
+def load_gazetteer(path: str = LOCATIONS_PATH, missing_ok: bool = False) -> dict:
+    """Parsed gazetteer, shared within the process; save (or copy) before mutating"""
+    key = os.path.abspath(path)
+    try:
+        stat = os.stat(key)
+    except FileNotFoundError:
+        if missing_ok:
+            return empty_gazetteer()
+        raise
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    with open(key, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    _cache[key] = (stamp, data)
+    return data
+
+
+def save_gazetteer(data: dict, path: str = LOCATIONS_PATH):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    _cache.pop(os.path.abspath(path), None)
+
+
+def count_locations(data: dict) -> int:
+    return sum(len(locs) for locs in data.get('locations', {}).values())
+
+
+def merge_locations(data: dict, new_locations: Iterable[dict]) -> dict:
+    """A copy of data with new_locations added by type, each type sorted by name"""
+    merged = dict(data)
+    merged['locations'] = {loc_type: list(locs) for loc_type, locs in data.get('locations', {}).items()}
+    for loc in new_locations:
+        merged['locations'].setdefault(loc['type'], []).append(loc)
+    for locs in merged['locations'].values():
+        locs.sort(key=lambda x: x['name'])
+
+    merged['metadata'] = dict(data.get('metadata', {}))
+    merged['metadata']['total_locations'] = count_locations(merged)
+    merged['metadata']['last_updated'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    return merged
+
+
+def print_new_locations(new_locations, limit: Optional[int] = None):
+    """The collectors' "New Locations by Type" listing"""
+    by_type = {}
+    for loc in new_locations:
+        by_type.setdefault(loc['type'], []).append(loc['name'])
+
+    print("📍 New Locations by Type:\n")
+    for loc_type, names in sorted(by_type.items()):
+        print(f"  {loc_type.upper()}S ({len(names)}):")
+        shown = sorted(names) if limit is None else sorted(names)[:limit]
+        for name in shown:
+            print(f"    • {name}")
+        if limit is not None and len(names) > limit:
+            print(f"    ... and {len(names) - limit} more")
@@ -0,0 +1,126 @@
+"""
+Per-municipality (LGU) configuration
+Everything the collectors used to hard-wire for Basey lives in one JSON file
+per LGU (scripts/lgus/basey.json): bbox, centre, barangay boundary polygons,
+the PSA barangay list, query templates, known landmarks and output paths.
+A file may also hold a whole province:
+
+    {"defaults": {"province": "Samar", "queries": {...}}, "lgus": [{"municipality": "Basey", ...}, ...]}
+
+Each LGU is merged over the defaults. Relative paths resolve against the
+config file, and "{slug}" in output paths becomes the LGU's slug.
+Query templates may use {municipality} and {province}.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from barangay_boundaries import is_within_bbox
+
+from .gazetteer import SCRIPTS_DIR
+
+LGU_DIR = os.path.join(SCRIPTS_DIR, 'lgus')
+BASEY_CONFIG = os.path.join(LGU_DIR, 'basey.json')
+BBOX_KEYS = ('lat_min', 'lat_max', 'lng_min', 'lng_max')
+
+
+@dataclass
+class LGUConfig:
+    municipality: str
+    province: str
+    slug: str
+    bbox: dict
+    center: Tuple[float, float]
+    boundary: Optional[str] = None  # barangay polygons (GeoJSON)
+    search_radius_m: float = 15000
+    psa_barangays: List[str] = field(default_factory=list)
+    queries: Dict[str, List[str]] = field(default_factory=dict)  # provider kind -> formatted queries
+    landmarks: List[dict] = field(default_factory=list)
+    outputs: Dict[str, str] = field(default_factory=dict)  # gazetteer, export, log
+
+    @property
+    def locality(self) -> str:
+        return f"{self.municipality}, {self.province}"
+
+    def address(self, name: str) -> str:
+        return f"{name}, {self.locality}"
+
+    def within(self, lat: float, lng: float) -> bool:
+        return is_within_bbox(lat, lng, self.bbox)
+
+    def output(self, name: str) -> Optional[str]:
+        return self.outputs.get(name)
+
+
+def _slugify(name: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def _merge(defaults: dict, overrides: dict) -> dict:
+    merged = dict(defaults)
+    for key, value in overrides.items():
+        merged[key] = _merge(merged[key], value) if isinstance(value, dict) and isinstance(merged.get(key), dict) \
+            else value
+    return merged
+
+
+def parse_lgu(raw: dict, base_dir: str) -> LGUConfig:
+    """One LGU from its (already merged) JSON object"""
+    missing = [key for key in ('municipality', 'province', 'bbox') if key not in raw]
+    if missing:
+        raise SystemExit(f"❌ LGU config {raw.get('municipality', '?')} is missing {', '.join(missing)}")
+    bbox = raw['bbox']
+    if any(key not in bbox for key in BBOX_KEYS):
+        raise SystemExit(f"❌ LGU {raw['municipality']}: bbox needs {', '.join(BBOX_KEYS)}")
+
+    slug = raw.get('slug') or _slugify(raw['municipality'])
+    names = {'municipality': raw['municipality'], 'province': raw['province']}
+
+    def resolve(path: Optional[str]) -> Optional[str]:
+        if not path:
+            return None
+        return os.path.normpath(os.path.join(base_dir, path.replace('{slug}', slug)))
+
+    center = raw.get('center') or [(bbox['lat_min'] + bbox['lat_max']) / 2, (bbox['lng_min'] + bbox['lng_max']) / 2]
+    return LGUConfig(
+        municipality=raw['municipality'],
+        province=raw['province'],
+        slug=slug,
+        bbox={key: float(bbox[key]) for key in BBOX_KEYS},
+        center=(float(center[0]), float(center[1])),
+        boundary=resolve(raw.get('boundary')),
+        search_radius_m=float(raw.get('searchRadiusM', 15000)),
+        psa_barangays=list(raw.get('psaBarangays', [])),
+        queries={kind: [template.format(**names) for template in templates]
+                 for kind, templates in raw.get('queries', {}).items()},
+        landmarks=list(raw.get('landmarks', [])),
+        outputs={name: resolve(path) for name, path in raw.get('outputs', {}).items()},
+    )
+
+
+def load_lgus(path: str) -> List[LGUConfig]:
+    """Every LGU in a config file, or in every *.json file of a directory"""
+    if os.path.isdir(path):
+        lgus = []
+        for name in sorted(os.listdir(path)):
+            if name.endswith('.json'):
+                lgus.extend(load_lgus(os.path.join(path, name)))
+        return lgus
+
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(path))
+    if 'lgus' not in raw:
+        return [parse_lgu(raw, base_dir)]
+    defaults = raw.get('defaults', {})
+    return [parse_lgu(_merge(defaults, entry), base_dir) for entry in raw['lgus']]
+
+
+def load_lgu(path: str = BASEY_CONFIG) -> LGUConfig:
+    lgus = load_lgus(path)
+    if len(lgus) != 1:
+        raise SystemExit(f"❌ {path} holds {len(lgus)} LGUs; pick one")
+    return lgus[0]
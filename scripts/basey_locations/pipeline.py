@@ -0,0 +1,263 @@
+"""
+Streaming location pipeline: fetch -> normalise -> dedupe -> verify -> merge
+Every stage is a generator over gazetteer-shaped records, so the stages
+chain in one process or across processes as newline-delimited JSON:
+
+    python scripts/basey-locations.py stream --source osm --fixture sample.json --dry-run
+    python scripts/basey-locations.py stream --stages fetch --source search --provider nominatim \\
+      | python scripts/basey-locations.py stream --stages normalise,dedupe \\
+      | python scripts/basey-locations.py stream --stages verify,merge
+
+A record is dropped as soon as a stage rejects it, and later stages see
+each one while the fetch is still running. Only merge holds records: the
+new ones it will write into the gazetteer. With NDJSON on stdout, progress
+and timings go to stderr.
+"""
+
+import json
+import sys
+from contextlib import nullcontext, redirect_stdout
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO
+
+from barangay_boundaries import is_within_bbox
+from location_names import AliasTable
+from run_metrics import RunMetrics
+
+from .gazetteer import LOCATIONS_PATH, load_gazetteer, merge_locations, save_gazetteer
+from .lgu import BASEY_CONFIG, load_lgu
+
+STAGES = ('fetch', 'normalise', 'dedupe', 'verify', 'merge')
+SOURCES = ('osm', 'search')
+CATEGORIES = ('barangay', 'sitio', 'landmark', 'poi')
+
+# Names too generic to be a location of their own
+GENERIC_IDS = {'basey', 'samar', 'eastern-samar'}
+
+Log = Callable[[str], None]
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[dict]:
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+
+
+def write_ndjson(records: Iterable[dict], out: TextIO) -> int:
+    """One JSON object per line, flushed so a downstream process sees it immediately"""
+    count = 0
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        out.flush()
+        count += 1
+    return count
+
+
+def osm_records(response: dict, metrics: Optional[RunMetrics] = None, log: Log = print) -> Iterator[dict]:
+    """Fetch stage for an Overpass-shaped response (see find.fetch_osm_response)"""
+    from osm_extract import extract_candidates
+
+    metrics = metrics or RunMetrics('stream')
+    with metrics.span('parse'):
+        candidates = extract_candidates(response)
+    metrics.count('results', len(candidates))
+    log(f"Received {len(response.get('elements', []))} elements, {len(candidates)} candidate locations")
+    yield from candidates
+
+
+def search_records(provider, queries: List[str], data: dict, scheduler_options: Optional[dict] = None,
+                   metrics: Optional[RunMetrics] = None, log: Log = print) -> Iterator[dict]:
+    """Fetch stage for geocoding-provider text searches, in QueryScheduler order
+
+    Each query's yield is recorded for the scheduler here, from a bounds and
+    known-name check, so the history stays right even when dedupe runs in
+    another process.
+    """
+    from query_scheduler import QueryScheduler
+
+    metrics = metrics or RunMetrics('stream')
+    aliases = AliasTable.load()
+    existing_ids = aliases.index_locations(data)
+    seen_ids = set()
+
+    scheduler = QueryScheduler.load(provider.name, queries, **(scheduler_options or {}))
+    planned = scheduler.plan()
+    log(f"📅 {len(planned)} of {len(queries)} queries scheduled "
+        f"({len(scheduler.skipped_backoff)} backed off after returning nothing)\n")
+    try:
+        for i, result in enumerate(provider.search_many(scheduler), 1):
+            log(f"[{i}/{len(planned)}] {result.query}")
+            metrics.count('queries')
+            if result.error:
+                log(f"  Error: {result.error}")
+                # Quota/auth/network errors say nothing about the query
+                scheduler.record(result.query, seconds=result.seconds, failed=True)
+                continue
+            if not result.places:
+                log("  No results")
+            metrics.count('results', len(result.places))
+
+            outcome = {'new': 0, 'duplicate': 0, 'out_of_bounds': 0}
+            for place in result.places:
+                if place.type is None:
+                    continue
+                key = aliases.canonical_id(place.name)
+                if not is_within_bbox(place.lat, place.lng):
+                    outcome['out_of_bounds'] += 1
+                elif key in existing_ids or key in seen_ids:
+                    outcome['duplicate'] += 1
+                else:
+                    outcome['new'] += 1
+                    seen_ids.add(key)
+                yield place.to_location()
+            scheduler.record(result.query, seconds=result.seconds, **outcome)
+    finally:
+        scheduler.save()
+        log(f"\n📅 {scheduler.summary()}")
+
+
+def normalise(records: Iterable[dict], metrics: Optional[RunMetrics] = None,
+              bbox: Optional[dict] = None) -> Iterator[dict]:
+    """Tidy names and coordinates, fill defaults, and drop unusable or out-of-bounds records"""
+    metrics = metrics or RunMetrics('stream')
+    for record in records:
+        name = ' '.join(str(record.get('name') or '').split())
+        coords = record.get('coordinates') or {}
+        lat = coords.get('lat', record.get('lat'))
+        lng = coords.get('lng', record.get('lng', record.get('lon')))
+        if not name or lat is None or lng is None or record.get('type') not in CATEGORIES:
+            metrics.count('unusable')
+            continue
+        lat, lng = round(float(lat), 6), round(float(lng), 6)
+        if not is_within_bbox(lat, lng, bbox):
+            metrics.count('out_of_bounds')
+            continue
+
+        normalised = {k: v for k, v in record.items() if k not in ('lat', 'lng', 'lon')}
+        normalised.update({
+            'name': name,
+            'coordinates': {'lat': lat, 'lng': lng},
+            'source': record.get('source') or 'unknown',
+            'address': record.get('address') or '',
+            'verified': bool(record.get('verified')),
+        })
+        yield normalised
+
+
+def dedupe(records: Iterable[dict], data: dict, metrics: Optional[RunMetrics] = None,
+           log: Log = print) -> Iterator[dict]:
+    """Drop records whose name (or an alias of it) is in the gazetteer or already passed"""
+    metrics = metrics or RunMetrics('stream')
+    aliases = AliasTable.load()
+    existing_ids = aliases.index_locations(data)
+    seen_ids = set()
+    for record in records:
+        with metrics.span('dedupe'):
+            key = aliases.canonical_id(record['name'])
+            duplicate = key in existing_ids or key in seen_ids
+        if duplicate:
+            metrics.count('duplicates')
+            continue
+        # Skip generic names
+        if key in GENERIC_IDS:
+            continue
+        seen_ids.add(key)
+        metrics.count('new')
+        log(f"  ✓ NEW: {record['name']} ({record['type']})")
+        yield record
+
+
+def verify(records: Iterable[dict], metrics: Optional[RunMetrics] = None, log: Log = print) -> Iterator[dict]:
+    """The local checks from location_validation; records with errors are dropped"""
+    from barangay_boundaries import BarangayIndex
+    from location_validation import LOCATION_TYPES, validate_location
+
+    metrics = metrics or RunMetrics('stream')
+    index = BarangayIndex.load()
+    for record in records:
+        coords = record['coordinates']
+        with metrics.span('verify'):
+            result = validate_location(record['name'], LOCATION_TYPES.get(record['type'], 'LANDMARK'),
+                                       coords['lat'], coords['lng'], index)
+        if result.errors:
+            metrics.count('invalid')
+            log(f"  ✗ {record['name']}: {'; '.join(result.errors)}")
+            continue
+        if result.warnings:
+            metrics.count('warnings')
+        yield record
+
+
+def merge(records: Iterable[dict], data: dict, output: str, dry_run: bool = False,
+          metrics: Optional[RunMetrics] = None) -> List[dict]:
+    """Add the records to the gazetteer in one write; returns the records added"""
+    metrics = metrics or RunMetrics('stream')
+    new_locations = [{k: v for k, v in record.items() if not k.startswith('_')} for record in records]
+    if new_locations and not dry_run:
+        with metrics.span('write'):
+            save_gazetteer(merge_locations(data, new_locations), output)
+    return new_locations
+
+
+def add_arguments(parser):
+    from geocoding import add_provider_arguments
+    from query_scheduler import add_scheduler_arguments
+
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help=f"comma-separated, in order (default: all of {','.join(STAGES)}); "
+                             "without fetch records come from stdin, without merge they go to stdout")
+    parser.add_argument('--source', choices=SOURCES, default='osm',
+                        help='fetch from OpenStreetMap (Overpass/--fixture/--pbf) or provider text searches')
+    parser.add_argument('--fixture', help='osm: read a saved Overpass response instead of querying')
+    parser.add_argument('--pbf', help='osm: read a local .osm.pbf extract instead of querying')
+    add_provider_arguments(parser, default='google', choices=('google', 'nominatim', 'photon', 'fake'))
+    add_scheduler_arguments(parser)
+    parser.add_argument('--lgu', default=BASEY_CONFIG, help='search: LGU config whose search queries to run')
+    parser.add_argument('--input', default=LOCATIONS_PATH, help='gazetteer to dedupe against and merge into')
+    parser.add_argument('--dry-run', action='store_true', help='merge: report without writing')
+
+
+def run(args):
+    stages = [stage.strip() for stage in args.stages.split(',') if stage.strip()]
+    if not stages or any(stage not in STAGES for stage in stages) or stages != sorted(stages, key=STAGES.index):
+        raise SystemExit(f"❌ --stages must be a subsequence of {','.join(STAGES)}")
+
+    # NDJSON owns stdout when the chain doesn't end in merge
+    out = sys.stdout
+    to_stdout = stages[-1] != 'merge'
+    with redirect_stdout(sys.stderr) if to_stdout else nullcontext():
+        metrics = RunMetrics(f"stream {','.join(stages)}")
+        with metrics.span('load'):
+            data = load_gazetteer(args.input)
+
+        if stages[0] != 'fetch':
+            records = read_ndjson(sys.stdin)
+        elif args.source == 'search':
+            from geocoding import provider_from_args
+            from query_scheduler import scheduler_options
+
+            from .find import search_queries
+
+            provider = provider_from_args(args)
+            print(f"🔍 Searching with {provider.describe()}...\n")
+            records = search_records(provider, search_queries(load_lgu(args.lgu)), data,
+                                     scheduler_options(args), metrics)
+        else:
+            from .find import fetch_osm_response
+
+            records = osm_records(fetch_osm_response(args.fixture, args.pbf, metrics), metrics)
+
+        if 'normalise' in stages:
+            records = normalise(records, metrics)
+        if 'dedupe' in stages:
+            records = dedupe(records, data, metrics)
+        if 'verify' in stages:
+            records = verify(records, metrics)
+
+        if to_stdout:
+            count = write_ndjson(records, out)
+            print(f"\n📤 {count} records")
+        else:
+            new_locations = merge(records, data, args.input, args.dry_run, metrics)
+            print(f"\n✨ {len(new_locations)} NEW locations "
+                  f"{'found (dry run - nothing written)' if args.dry_run else f'added to {args.input}'}")
+        metrics.report()
@@ -0,0 +1,328 @@
+"""
+Versioned, content-hashed data snapshots with per-version patches
+Each run hashes the canonical JSON of every offline dataset (the gazetteer
+basey-roads.geojson and, once precompute-routes.py has run, the warm route
+cache by default). A dataset whose hash changed gets a new
+version: a full snapshot plus a patch from the previous version. Patches are
+record-level edit scripts (keep n / delete n / insert records) over each
+record list, so a client on an older version downloads only the patch
+chain. The manifest says which patches to fetch, or when the full snapshot
+is smaller.
+
+    public/data/snapshots/manifest.json
+    public/data/snapshots/roads/3-1f0c2a9b7d41.json      latest full snapshot
+    public/data/snapshots/roads/2-3.patch.json           one per version step
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .gazetteer import LOCATIONS_PATH, SCRIPTS_DIR
+
+REPO_DIR = os.path.join(SCRIPTS_DIR, '..')
+ROADS_PATH = os.path.join(REPO_DIR, 'public', 'data', 'basey-roads.geojson')
+WARM_ROUTES_PATH = os.path.join(REPO_DIR, 'public', 'data', 'warm-routes.json')
+SNAPSHOT_DIR = os.path.join(REPO_DIR, 'public', 'data', 'snapshots')
+MANIFEST_NAME = 'manifest.json'
+FORMAT = 1
+DEFAULT_KEEP = 10  # patches kept per dataset; older clients take the full snapshot
+
+Lists = Dict[str, list]
+
+
+def canonical_json(doc) -> bytes:
+    """Sorted keys, no whitespace: the bytes that are hashed and published"""
+    return json.dumps(doc, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def content_hash(doc) -> str:
+    return hashlib.sha256(canonical_json(doc)).hexdigest()
+
+
+def split_collection(doc: dict) -> Tuple[dict, Lists]:
+    """GeoJSON FeatureCollection: the features are the records"""
+    return {k: v for k, v in doc.items() if k != 'features'}, {'features': doc.get('features', [])}
+
+
+def join_collection(header: dict, lists: Lists) -> dict:
+    return {**header, 'features': lists['features']}
+
+
+def split_gazetteer(doc: dict) -> Tuple[dict, Lists]:
+    """Gazetteer: one record list per location type"""
+    header = {k: v for k, v in doc.items() if k != 'locations'}
+    return header, {f'locations.{t}': locs for t, locs in doc.get('locations', {}).items()}
+
+
+def join_gazetteer(header: dict, lists: Lists) -> dict:
+    return {**header, 'locations': {name.split('.', 1)[1]: locs for name, locs in lists.items()}}
+
+
+def split_routes(doc: dict) -> Tuple[dict, Lists]:
+    """Warm route cache: the routes are the records"""
+    return {k: v for k, v in doc.items() if k != 'routes'}, {'routes': doc.get('routes', [])}
+
+
+def join_routes(header: dict, lists: Lists) -> dict:
+    return {**header, 'routes': lists['routes']}
+
+
+# name -> (source, split, join); other FeatureCollections can be added with --dataset
+DATASETS: Dict[str, Tuple[str, Callable, Callable]] = {
+    'locations': (LOCATIONS_PATH, split_gazetteer, join_gazetteer),
+    'roads': (ROADS_PATH, split_collection, join_collection),
+    'routes': (WARM_ROUTES_PATH, split_routes, join_routes),
+}
+
+
+def diff_records(old: list, new: list) -> Tuple[list, Dict[str, int]]:
+    """Edit script turning old into new, and its added/removed/changed counts"""
+    old_hashes = [content_hash(r) for r in old]
+    new_hashes = [content_hash(r) for r in new]
+    matcher = difflib.SequenceMatcher(None, old_hashes, new_hashes, autojunk=False)
+    ops, counts = [], {'added': 0, 'removed': 0, 'changed': 0}
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append(['=', i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append(['-', i2 - i1])
+        if j2 > j1:
+            ops.append(['+', new[j1:j2]])
+        changed = min(i2 - i1, j2 - j1)
+        counts['changed'] += changed
+        counts['removed'] += (i2 - i1) - changed
+        counts['added'] += (j2 - j1) - changed
+    return ops, counts
+
+
+def apply_ops(old: list, ops: list) -> list:
+    result, position = [], 0
+    for op, arg in ops:
+        if op == '=':
+            result.extend(old[position:position + arg])
+            position += arg
+        elif op == '-':
+            position += arg
+        else:
+            result.extend(arg)
+    return result
+
+
+def make_patch(dataset: str, old_doc: dict, new_doc: dict, old_version: int, new_version: int) -> dict:
+    _, split, _ = DATASETS[dataset]
+    old_header, old_lists = split(old_doc)
+    new_header, new_lists = split(new_doc)
+    patch = {
+        'dataset': dataset,
+        'from': old_version,
+        'to': new_version,
+        'fromHash': content_hash(old_doc),
+        'toHash': content_hash(new_doc),
+        'lists': {},
+        'added': 0, 'removed': 0, 'changed': 0,
+    }
+    if new_header != old_header:
+        patch['header'] = new_header
+    for name, records in new_lists.items():
+        ops, counts = diff_records(old_lists.get(name, []), records)
+        if ops != [['=', len(records)]]:
+            patch['lists'][name] = ops
+        for key, count in counts.items():
+            patch[key] += count
+    patch['dropLists'] = sorted(set(old_lists) - set(new_lists))
+    for name in patch['dropLists']:
+        patch['removed'] += len(old_lists[name])
+    return patch
+
+
+def apply_patch(dataset: str, doc: dict, patch: dict) -> dict:
+    """The next version of doc; raises ValueError if the patch is for another version"""
+    _, split, join = DATASETS[dataset]
+    if content_hash(doc) != patch['fromHash']:
+        raise ValueError(f"patch {patch['from']}->{patch['to']} does not apply to this {dataset} snapshot")
+    header, lists = split(doc)
+    for name, ops in patch['lists'].items():
+        lists[name] = apply_ops(lists.get(name, []), ops)
+    for name in patch.get('dropLists', []):
+        lists.pop(name, None)
+    doc = join(patch.get('header', header), lists)
+    if content_hash(doc) != patch['toHash']:
+        raise ValueError(f"{dataset} patch {patch['from']}->{patch['to']} produced the wrong content")
+    return doc
+
+
+def load_manifest(directory: str = SNAPSHOT_DIR) -> dict:
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'format': FORMAT, 'datasets': {}}
+
+
+def _write(directory: str, relative: str, data: bytes) -> int:
+    path = os.path.join(directory, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+def snapshot_dataset(manifest: dict, dataset: str, doc: dict, directory: str = SNAPSHOT_DIR,
+                     keep: int = DEFAULT_KEEP, source: Optional[str] = None) -> Optional[dict]:
+    """Add a version if doc changed; returns the new manifest entry, or None if unchanged"""
+    entry = manifest['datasets'].get(dataset)
+    digest = content_hash(doc)
+    if entry and entry['hash'] == digest:
+        return None
+
+    version = entry['version'] + 1 if entry else 1
+    snapshot = f"{dataset}/{version}-{digest[:12]}.json"
+    size = _write(directory, snapshot, canonical_json(doc))
+    new_entry = {
+        'version': version,
+        'hash': digest,
+        'snapshot': snapshot,
+        'size': size,
+        'source': os.path.relpath(source, REPO_DIR).replace(os.sep, '/') if source else None,
+        'versions': (entry['versions'] if entry else []) + [
+            {'version': version, 'hash': digest, 'created': time.strftime('%Y-%m-%d %H:%M:%S')}],
+        'patches': list(entry['patches']) if entry else [],
+    }
+
+    if entry:
+        with open(os.path.join(directory, entry['snapshot']), 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+        patch = make_patch(dataset, previous, doc, entry['version'], version)
+        apply_patch(dataset, previous, patch)  # round-trip before publishing
+        name = f"{dataset}/{entry['version']}-{version}.patch.json"
+        new_entry['patches'].append({
+            'from': entry['version'], 'to': version, 'file': name,
+            'size': _write(directory, name, canonical_json(patch)),
+            **{k: patch[k] for k in ('added', 'removed', 'changed')},
+        })
+
+    # Retire old patches; clients older than the oldest one take the full snapshot.
+    # Files are only deleted by save_manifest, once the new manifest is in place.
+    new_entry['patches'] = new_entry['patches'][-keep:] if keep else []
+    oldest = new_entry['patches'][0]['from'] if new_entry['patches'] else version
+    new_entry['versions'] = [v for v in new_entry['versions'] if v['version'] >= oldest]
+
+    manifest['datasets'][dataset] = new_entry
+    return new_entry
+
+
+def save_manifest(manifest: dict, directory: str = SNAPSHOT_DIR):
+    """Replace manifest.json atomically, then delete the files it no longer references
+
+    Until the replace, the old manifest and every file it points at stay
+    intact, so a run that fails part-way leaves a consistent snapshot set.
+    """
+    manifest['format'] = FORMAT
+    manifest['generated'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, MANIFEST_NAME)
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(temp, path)
+    prune_unreferenced(manifest, directory)
+
+
+def prune_unreferenced(manifest: dict, directory: str = SNAPSHOT_DIR) -> List[str]:
+    """Delete snapshots and patches in each dataset's folder that the manifest does not list"""
+    removed = []
+    for dataset, entry in manifest['datasets'].items():
+        folder = os.path.join(directory, dataset)
+        if not os.path.isdir(folder):
+            continue
+        keep = {entry['snapshot']} | {p['file'] for p in entry['patches']}
+        for filename in os.listdir(folder):
+            relative = f"{dataset}/{filename}"
+            if filename.endswith('.json') and relative not in keep:
+                os.remove(os.path.join(folder, filename))
+                removed.append(relative)
+    return removed
+
+
+def update_plan(manifest: dict, dataset: str, version: Optional[int]) -> Tuple[List[str], int]:
+    """(files to fetch, bytes) to bring a client at version up to date: the patch
+    chain when it exists and is smaller than the snapshot, else the snapshot"""
+    entry = manifest['datasets'][dataset]
+    if version == entry['version']:
+        return [], 0
+    by_start = {p['from']: p for p in entry['patches']}
+    chain, current = [], version
+    while current in by_start and current != entry['version']:
+        chain.append(by_start[current])
+        current = by_start[current]['to']
+    chain_size = sum(p['size'] for p in chain)
+    if current != entry['version'] or chain_size >= entry['size']:
+        return [entry['snapshot']], entry['size']
+    return [p['file'] for p in chain], chain_size
+
+
+def add_arguments(parser):
+    parser.add_argument('--dataset', action='append', default=[], metavar='NAME[=PATH]',
+                        help=f"dataset to snapshot (repeatable; default: {', '.join(DATASETS)}); "
+                             "NAME=PATH adds another GeoJSON FeatureCollection")
+    parser.add_argument('--output', default=SNAPSHOT_DIR, help='snapshot directory (holds manifest.json)')
+    parser.add_argument('--keep', type=int, default=DEFAULT_KEEP, help='patches kept per dataset')
+    parser.add_argument('--plan', type=int, metavar='VERSION',
+                        help='only show what a client at VERSION would download')
+
+
+def run(args):
+    from run_metrics import RunMetrics
+
+    metrics = RunMetrics('snapshot')
+    manifest = load_manifest(args.output)
+    sources = {}
+    for spec in args.dataset or list(DATASETS):
+        name, _, path = spec.partition('=')
+        if not path and name not in DATASETS:
+            # Added earlier with NAME=PATH: the manifest remembers where it came from
+            stored = manifest['datasets'].get(name, {}).get('source')
+            if not stored:
+                raise SystemExit(f"❌ Unknown dataset '{name}' (use NAME=PATH for a new one)")
+            path = os.path.join(REPO_DIR, stored)
+        if path:
+            DATASETS.setdefault(name, (path, split_collection, join_collection))
+        sources[name] = path or DATASETS[name][0]
+
+    if args.plan is not None:
+        for name in sources:
+            if name not in manifest['datasets']:
+                print(f"  {name}: no snapshots yet")
+                continue
+            files, size = update_plan(manifest, name, args.plan)
+            print(f"📦 {name} v{args.plan} -> v{manifest['datasets'][name]['version']}: "
+                  f"{size / 1024:.1f} KB in {len(files)} file(s)")
+            for file in files:
+                print(f"    {file}")
+        return
+
+    for name, path in sources.items():
+        if not args.dataset and not os.path.exists(path):
+            print(f"⏭️  {name}: no {os.path.relpath(path, REPO_DIR)} yet")
+            continue
+        with metrics.span('load'):
+            with open(path, 'r', encoding='utf-8') as f:
+                doc = json.load(f)
+        with metrics.span('snapshot'):
+            entry = snapshot_dataset(manifest, name, doc, args.output, args.keep, path)
+        if entry is None:
+            print(f"✅ {name}: unchanged (v{manifest['datasets'][name]['version']})")
+            continue
+        print(f"📦 {name}: v{entry['version']} {entry['hash'][:12]} ({entry['size'] / 1024:.1f} KB)")
+        if entry['patches'] and entry['patches'][-1]['to'] == entry['version']:
+            patch = entry['patches'][-1]
+            print(f"    patch v{patch['from']}->v{patch['to']}: +{patch['added']} -{patch['removed']} "
+                  f"~{patch['changed']} ({patch['size'] / 1024:.1f} KB)")
+    save_manifest(manifest, args.output)
+    print(f"💾 {os.path.join(args.output, MANIFEST_NAME)}")
+    metrics.report()
@@ -0,0 +1,271 @@
+"""
+Location Verification for Basey Fare Check
+Verifies coordinates, checks for duplicates, and validates location data
+"""
+
+from math import radians, cos, sin, asin, sqrt
+from barangay_boundaries import BARANGAY_GEOJSON_PATH, BASEY_BBOX
+from location_names import AliasTable
+from run_metrics import RunMetrics
+
+from .gazetteer import LOCATIONS_PATH, count_locations, load_gazetteer
+
+def haversine(lat1, lon1, lat2, lon2):
+    """Calculate distance between two points in kilometers"""
+    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
+    c = 2 * asin(sqrt(a))
+    km = 6371 * c
+    return km * 1000  # Return in meters
+
+def load_locations(filepath=LOCATIONS_PATH):
+    """Load location data"""
+    return load_gazetteer(filepath)
+
+def check_duplicates(data):
+    """Check for duplicate location names (including alias/spelling variants)"""
+    print("🔍 Checking for duplicates...\n")
+    
+    all_locations = []
+    for loc_type in data['locations'].values():
+        all_locations.extend(loc_type)
+    
+    # Check by canonical ID
+    aliases = AliasTable.load()
+    names = {}
+    for loc in all_locations:
+        names.setdefault(aliases.canonical_id(loc['name']), []).append(loc)
+    
+    duplicates = {k: v for k, v in names.items() if len(v) > 1}
+    
+    if duplicates:
+        print(f"⚠️ Found {len(duplicates)} duplicate names:\n")
+        for locs in duplicates.values():
+            print(f"  '{locs[0]['name']}' appears {len(locs)} times:")
+            for loc in locs:
+                print(f"    - Name: {loc['name']}, Type: {loc.get('type', 'n/a')}, Source: {loc['source']}, "
+                      f"Coords: ({loc['coordinates']['lat']:.6f}, {loc['coordinates']['lng']:.6f})")
+            print()
+    else:
+        print("✅ No duplicate names found\n")
+    
+    return duplicates
+
+def check_proximity(data):
+    """Check for locations that are suspiciously close to each other"""
+    print("📍 Checking for locations too close together...\n")
+    
+    all_locations = []
+    for loc_type in data['locations'].values():
+        all_locations.extend(loc_type)
+    
+    too_close = []
+    threshold = 10  # meters
+    
+    for i, loc1 in enumerate(all_locations):
+        for loc2 in all_locations[i+1:]:
+            if loc1['name'] == loc2['name']:
+                continue
+            
+            dist = haversine(
+                loc1['coordinates']['lat'], loc1['coordinates']['lng'],
+                loc2['coordinates']['lat'], loc2['coordinates']['lng']
+            )
+            
+            if dist < threshold:
+                too_close.append((loc1, loc2, dist))
+    
+    if too_close:
+        print(f"⚠️ Found {len(too_close)} pairs of locations within {threshold}m:\n")
+        for loc1, loc2, dist in too_close:
+            print(f"  {loc1['name']} & {loc2['name']}: {dist:.1f}m apart")
+    else:
+        print(f"✅ No locations within {threshold}m of each other\n")
+    
+    return too_close
+
+def check_bounds(data, bbox=None):
+    """Check if all locations are within the municipality bounds (default: Basey)"""
+    print("🗺️ Checking location bounds...\n")
+    
+    # Approximate bounds (an LGU config bbox, or Basey's)
+    bbox = bbox or BASEY_BBOX
+    lat_min, lat_max = bbox['lat_min'], bbox['lat_max']
+    lng_min, lng_max = bbox['lng_min'], bbox['lng_max']
+    
+    out_of_bounds = []
+    
+    for loc_type in data['locations'].values():
+        for loc in loc_type:
+            lat = loc['coordinates']['lat']
+            lng = loc['coordinates']['lng']
+            
+            if not (lat_min <= lat <= lat_max and lng_min <= lng <= lng_max):
+                out_of_bounds.append(loc)
+    
+    if out_of_bounds:
+        print(f"⚠️ Found {len(out_of_bounds)} locations outside the municipality bounds:\n")
+        for loc in out_of_bounds:
+            print(f"  {loc['name']}: ({loc['coordinates']['lat']:.6f}, {loc['coordinates']['lng']:.6f})")
+            print(f"    Address: {loc.get('address', 'N/A')}")
+    else:
+        print("✅ All locations within Basey bounds\n")
+    
+    return out_of_bounds
+
+def check_unverified(data):
+    """List unverified locations"""
+    print("🔎 Checking verification status...\n")
+    
+    unverified = []
+    
+    for loc_type in data['locations'].values():
+        for loc in loc_type:
+            if not loc.get('verified', False):
+                unverified.append(loc)
+    
+    if unverified:
+        print(f"⚠️ Found {len(unverified)} unverified locations:\n")
+        
+        by_type = {}
+        for loc in unverified:
+            by_type.setdefault(loc['type'], []).append(loc['name'])
+        
+        for loc_type, names in sorted(by_type.items()):
+            print(f"  {loc_type.upper()}S ({len(names)}):")
+            for name in sorted(names)[:10]:
+                print(f"    • {name}")
+            if len(names) > 10:
+                print(f"    ... and {len(names) - 10} more")
+        print()
+    else:
+        print("✅ All locations are verified\n")
+    
+    return unverified
+
+def check_boundaries(path=BARANGAY_GEOJSON_PATH, gap_tolerance_m=None):
+    """Sweep the barangay polygons for self-intersections, overlaps, gaps and winding"""
+    from boundary_validation import DEFAULT_GAP_TOLERANCE_M, KINDS, validate_boundaries_file
+
+    print("🧭 Checking barangay boundaries...\n")
+    report = validate_boundaries_file(
+        path, DEFAULT_GAP_TOLERANCE_M if gap_tolerance_m is None else gap_tolerance_m
+    )
+    print(f"  {report.rings} rings, {report.segments} segments ({report.shared_segments} shared), "
+          f"{report.events} sweep events\n")
+    
+    if report.defects:
+        print(f"⚠️ Found {len(report.defects)} boundary defects:\n")
+        for kind, defects in report.by_kind().items():
+            print(f"  {kind.upper()} ({len(defects)}) - {KINDS[kind]}:")
+            for defect in defects[:10]:
+                detail = f" - {defect.detail}" if defect.detail else ''
+                print(f"    • {' / '.join(defect.barangays)} at ({defect.lat:.6f}, {defect.lng:.6f}){detail}")
+            if len(defects) > 10:
+                print(f"    ... and {len(defects) - 10} more")
+        print()
+    else:
+        print("✅ Barangay boundaries are clean\n")
+    
+    return report.defects
+
+def show_statistics(data):
+    """Show location statistics"""
+    print("📊 Location Statistics:\n")
+    
+    metadata = data['metadata']
+    print(f"  Municipality: {metadata['municipality']}")
+    print(f"  Province: {metadata['province']}")
+    print(f"  Total Locations: {metadata['total_locations']}")
+    print(f"  Last Updated: {metadata['last_updated']}\n")
+    
+    print("  By Type:")
+    for loc_type, locs in sorted(data['locations'].items()):
+        verified_count = sum(1 for loc in locs if loc.get('verified', False))
+        print(f"    {loc_type.title()}s: {len(locs)} ({verified_count} verified)")
+    
+    print("\n  By Source:")
+    sources = {}
+    for loc_type in data['locations'].values():
+        for loc in loc_type:
+            source = loc.get('source', 'unknown')
+            sources[source] = sources.get(source, 0) + 1
+    
+    for source, count in sorted(sources.items()):
+        print(f"    {source}: {count}")
+    print()
+
+def verify_locations(data, metrics=None, boundaries=BARANGAY_GEOJSON_PATH, gap_tolerance_m=None, bbox=None):
+    """Run every check; returns {check: findings} (boundaries=None skips the polygon sweep)"""
+    metrics = metrics or RunMetrics('verify-locations')
+    show_statistics(data)
+    results = {}
+    with metrics.span('duplicates'):
+        results['duplicates'] = check_duplicates(data)
+    with metrics.span('proximity'):
+        results['proximity'] = check_proximity(data)
+    with metrics.span('bounds'):
+        results['out_of_bounds'] = check_bounds(data, bbox)
+    with metrics.span('unverified'):
+        results['unverified'] = check_unverified(data)
+    if boundaries:
+        with metrics.span('boundaries'):
+            results['boundaries'] = check_boundaries(boundaries, gap_tolerance_m)
+    return results
+
+def print_summary(results):
+    print("=" * 60)
+    print("VERIFICATION SUMMARY")
+    print("=" * 60)
+    
+    issues = []
+    if results['duplicates']:
+        issues.append(f"❌ {len(results['duplicates'])} duplicate names")
+    if results['proximity']:
+        issues.append(f"⚠️ {len(results['proximity'])} location pairs too close")
+    if results['out_of_bounds']:
+        issues.append(f"❌ {len(results['out_of_bounds'])} locations out of bounds")
+    if results['unverified']:
+        issues.append(f"⚠️ {len(results['unverified'])} unverified locations")
+    boundary_errors = [d for d in results.get('boundaries', []) if d.is_error]
+    if boundary_errors:
+        issues.append(f"❌ {len(boundary_errors)} barangay boundary errors")
+    if len(results.get('boundaries', [])) > len(boundary_errors):
+        issues.append(f"⚠️ {len(results['boundaries']) - len(boundary_errors)} barangay boundary warnings")
+    
+    if issues:
+        print("\nIssues found:")
+        for issue in issues:
+            print(f"  {issue}")
+        print("\nRecommendation: Review and clean up the data")
+    else:
+        print("\n✅ All checks passed! Location data is clean and verified.")
+    return issues
+
+def add_arguments(parser):
+    parser.add_argument('--input', default=LOCATIONS_PATH, help='gazetteer to verify')
+    parser.add_argument('--boundaries', default=BARANGAY_GEOJSON_PATH, help='barangay polygons to check')
+    parser.add_argument('--skip-boundaries', action='store_true', help='skip the barangay geometry checks')
+    parser.add_argument('--gap-tolerance', type=float, metavar='METRES',
+                        help='report neighbouring borders closer than this without meeting (default: 5)')
+
+def run(args):
+    print("=" * 60)
+    print("Basey Fare Check - LOCATION VERIFICATION")
+    print("=" * 60)
+    print()
+    
+    metrics = RunMetrics('verify-locations')
+    
+    # Load data
+    with metrics.span('load'):
+        data = load_locations(args.input)
+    metrics.count('locations', count_locations(data))
+    
+    boundaries = None if args.skip_boundaries else args.boundaries
+    print_summary(verify_locations(data, metrics, boundaries, args.gap_tolerance))
+    
+    metrics.report()
+    print()
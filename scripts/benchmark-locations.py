@@ -0,0 +1,269 @@
+"""
+Benchmark the location tools on seeded synthetic data
+Times the verify-locations checks and the collector's GeoJSON load and
+JSON export on gazetteers of 1k to 1M points, plus road graph loading,
+Dijkstra and contraction hierarchy build/query on synthetic road networks of
+the same number of intersections, and compares the medians against a stored
+baseline so a slowdown fails the run. Without a local baseline the committed
+reference (scripts/benchmark-baseline.json) is used with a wider tolerance.
+
+Usage:
+    python scripts/benchmark-locations.py --save-baseline
+    python scripts/benchmark-locations.py                      # exit 1 on regression
+    python scripts/benchmark-locations.py --require-baseline   # CI: also exit 1 if nothing to compare
+    python scripts/benchmark-locations.py --sizes 1000000 --only check_bounds
+"""
+
+import argparse
+import importlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from contraction_hierarchy import build_hierarchy
+from road_graph import RoadGraph
+from synthetic_data import synthetic_barangay_geojson, synthetic_gazetteer, synthetic_road_network
+
+SCRIPTS_DIR = os.path.dirname(__file__)
+BASELINE_PATH = os.path.join(SCRIPTS_DIR, '..', '.benchmarks', 'locations.json')
+# Committed medians from one reference machine; other machines differ, so only
+# a slowdown past REFERENCE_TOLERANCE (an algorithmic regression) fails
+REFERENCE_BASELINE_PATH = os.path.join(SCRIPTS_DIR, 'benchmark-baseline.json')
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_TOLERANCE = 0.25
+REFERENCE_TOLERANCE = 2.0
+ROUTE_QUERIES = 100  # node pairs per dijkstra/hierarchy_query round
+# Slowdowns smaller than this are timer noise, whatever the ratio
+MIN_REGRESSION_SECONDS = 0.005
+
+
+class Benchmarks:
+    """Each bench_* method prepares its input and returns the timed callable"""
+
+    # check_proximity compares every pair; beyond this it measures nothing useful.
+    # Road benchmarks take `size` intersections; contraction is the slow one.
+    MAX_SIZE = {
+        'check_proximity': 5_000,
+        'dijkstra': 100_000,
+        'hierarchy_build': 2_000,
+        'hierarchy_query': 2_000,
+    }
+
+    def __init__(self, seed, workdir):
+        self.seed = seed
+        self.workdir = workdir
+        self.verify = importlib.import_module('basey_locations.verify')
+        self.collect = importlib.import_module('basey_locations.collect')
+        self._gazetteers = {}
+        self._graphs = {}
+
+    def names(self):
+        return [name.removeprefix('bench_') for name in dir(self) if name.startswith('bench_')]
+
+    def gazetteer(self, size):
+        if size not in self._gazetteers:
+            self._gazetteers = {size: synthetic_gazetteer(size, seed=self.seed)}
+        return self._gazetteers[size]
+
+    def graph(self, size):
+        if size not in self._graphs:
+            self._graphs = {size: RoadGraph.from_geojson(synthetic_road_network(size, seed=self.seed))}
+        return self._graphs[size]
+
+    def route_pairs(self, size):
+        rng = random.Random(self.seed)
+        n = self.graph(size).node_count
+        return [(rng.randrange(n), rng.randrange(n)) for _ in range(ROUTE_QUERIES)]
+
+    def bench_check_duplicates(self, size):
+        data = self.gazetteer(size)
+        return lambda: self.verify.check_duplicates(data)
+
+    def bench_check_proximity(self, size):
+        data = self.gazetteer(size)
+        return lambda: self.verify.check_proximity(data)
+
+    def bench_check_bounds(self, size):
+        data = self.gazetteer(size)
+        return lambda: self.verify.check_bounds(data)
+
+    def bench_load_existing_geojson(self, size):
+        # `size` boundary vertices spread over a square grid of barangays
+        vertices_per_edge = 20
+        side = max(1, int((size / (4 * vertices_per_edge)) ** 0.5))
+        path = os.path.join(self.workdir, f"barangays-{size}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(synthetic_barangay_geojson(side, side, seed=self.seed,
+                                                 vertices_per_edge=vertices_per_edge), f)
+
+        def run():
+            collector = self.collect.BaseyLocationCollector()
+            collector.load_existing_geojson(path)
+        return run
+
+    def bench_export_to_json(self, size):
+        collector = self.collect.BaseyLocationCollector()
+        for loc_type, locs in self.gazetteer(size)['locations'].items():
+            for i, loc in enumerate(locs):
+                collector.locations[f"{loc_type}-{i}"] = self.collect.Location(
+                    name=loc['name'],
+                    type=loc_type,
+                    lat=loc['coordinates']['lat'],
+                    lng=loc['coordinates']['lng'],
+                    source=loc['source'],
+                    address=loc['address'],
+                    verified=loc['verified'],
+                )
+        path = os.path.join(self.workdir, f"export-{size}.json")
+        return lambda: collector.export_to_json(path)
+
+    def bench_road_graph_load(self, size):
+        network = synthetic_road_network(size, seed=self.seed)
+        return lambda: RoadGraph.from_geojson(network)
+
+    def bench_dijkstra(self, size):
+        graph = self.graph(size)
+        pairs = self.route_pairs(size)[:10]  # full searches; ten keep large sizes affordable
+        return lambda: [graph.dijkstra({a: 0.0}, target=b) for a, b in pairs]
+
+    def bench_hierarchy_build(self, size):
+        graph = self.graph(size)
+        return lambda: build_hierarchy(graph)
+
+    def bench_hierarchy_query(self, size):
+        hierarchy = build_hierarchy(self.graph(size))
+        pairs = self.route_pairs(size)
+        return lambda: [hierarchy.query(a, b) for a, b in pairs]
+
+
+def time_callable(fn, rounds):
+    """Run fn `rounds` times with its console output swallowed"""
+    timings = []
+    for _ in range(rounds):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+    return {
+        'rounds': rounds,
+        'min': round(min(timings), 6),
+        'median': round(statistics.median(timings), 6),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return (key, baseline median, current median) for every regression"""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get('results', {}).get(key)
+        if not previous:
+            continue
+        slower = result['median'] - previous['median']
+        if result['median'] > previous['median'] * (1 + tolerance) and slower > MIN_REGRESSION_SECONDS:
+            regressions.append((key, previous['median'], result['median']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the location tools on synthetic data')
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='comma-separated gazetteer sizes (up to 1000000)')
+    parser.add_argument('--only', action='append', help='run only this benchmark (repeatable)')
+    parser.add_argument('--repeat', type=int, default=5, help='rounds per benchmark (fewer for large sizes)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--baseline', help='baseline JSON to save or compare against (default: '
+                                           '.benchmarks/locations.json, else scripts/benchmark-baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='write these results as the new baseline')
+    parser.add_argument('--require-baseline', action='store_true',
+                        help='fail when there is no baseline, or it has no entry for a benchmark that ran')
+    parser.add_argument('--tolerance', type=float,
+                        help=f'allowed slowdown of the median before failing (default {DEFAULT_TOLERANCE:.2f}, '
+                             f'{REFERENCE_TOLERANCE:.1f} against the committed reference)')
+    args = parser.parse_args()
+
+    reference = False
+    if args.baseline is None:
+        reference = not args.save_baseline and not os.path.exists(BASELINE_PATH)
+        args.baseline = REFERENCE_BASELINE_PATH if reference else BASELINE_PATH
+    if args.tolerance is None:
+        args.tolerance = REFERENCE_TOLERANCE if reference else DEFAULT_TOLERANCE
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+
+    print("=" * 60)
+    print("Basey Fare Check - LOCATION BENCHMARKS")
+    print("=" * 60)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        benchmarks = Benchmarks(args.seed, workdir)
+        names = args.only or benchmarks.names()
+        unknown = set(names) - set(benchmarks.names())
+        if unknown:
+            raise SystemExit(f"❌ Unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+        for size in sizes:
+            for name in names:
+                if size > Benchmarks.MAX_SIZE.get(name, size):
+                    continue
+                fn = getattr(benchmarks, f"bench_{name}")(size)
+                rounds = max(1, min(args.repeat, 1_000_000 // size))
+                key = f"{name}[{size}]"
+                results[key] = time_callable(fn, rounds)
+                print(f"  {key:<32} median {results[key]['median'] * 1000:10.2f} ms  "
+                      f"min {results[key]['min'] * 1000:10.2f} ms  ({rounds} rounds)")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    if args.save_baseline:
+        merged = dict(baseline.get('results', {}))
+        merged.update(results)
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'seed': args.seed,
+                'results': dict(sorted(merged.items())),
+            }, f, indent=2)
+        print(f"\n💾 Baseline saved to {args.baseline}")
+        return
+
+    if not baseline:
+        if args.require_baseline:
+            raise SystemExit(f"❌ No baseline at {args.baseline}; run with --save-baseline to create one")
+        print(f"\n⚠️ No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    if reference:
+        print(f"\n📏 Comparing with the reference baseline ({baseline.get('machine')}, "
+              f"Python {baseline.get('python')}); save a local one for a tighter check")
+    missing = sorted(set(results) - set(baseline.get('results', {})))
+    if missing:
+        print(f"\n⚠️ Not in the baseline: {', '.join(missing)}")
+        if args.require_baseline:
+            sys.exit(1)
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) slower than baseline by more than {args.tolerance:.0%}:")
+        for key, before, after in regressions:
+            print(f"  {key}: {before * 1000:.2f} ms -> {after * 1000:.2f} ms ({after / before - 1:+.0%})")
+        sys.exit(1)
+
+    print(f"\n✅ No regressions beyond {args.tolerance:.0%} of the baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,375 @@
+"""
+Geometry checks for the barangay polygons (Barangay.shp.json)
+A Bentley-Ottmann sweep visits every point where boundary segments meet,
+using exact arithmetic on 1 cm integer coordinates. For n segments and k
+meeting points it makes O((n + k) log n) comparisons, but the status line is
+a sorted list updated by slice assignment, so each event can also shift
+O(n) entries: O((n + k) n) in the worst case. Only the segments crossing the
+sweep line are in the list, so the shifts are short memmoves on real
+boundaries. From those points it reports self-intersecting rings and
+barangays whose borders cross. Shared borders are matched edge for edge, and
+a bbox index pairs up neighbouring barangays for the sliver (gap/overlap)
+and containment tests. Wrong winding is checked per ring.
+
+    report = validate_boundaries(geojson['features'])
+    for defect in report.defects:
+        print(defect.kind, defect.lat, defect.lng, defect.barangays)
+"""
+
+import heapq
+import json
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from barangay_boundaries import BARANGAY_GEOJSON_PATH, point_in_polygon
+from spatial_index import GridIndex, SegmentIndex
+
+QUANTUM = 10 ** 7  # integer coordinate units per degree (~1 cm)
+DEFAULT_GAP_TOLERANCE_M = 5.0  # neighbours' borders this close without meeting are a sliver
+SNAP_M = 0.05  # closer than this counts as on the border
+
+# kind -> what it means; errors break point-in-polygon / area maths, the rest are warnings
+KINDS = {
+    'degenerate': 'ring with fewer than three distinct vertices',
+    'self-intersection': 'ring crosses or touches itself',
+    'ring-intersection': 'rings of one barangay cross each other',
+    'overlap': 'barangays overlap (borders cross, one lies inside the other, or a shared edge has both on one side)',
+    'winding': 'ring orientation is not RFC 7946 (exteriors counter-clockwise, holes clockwise)',
+    'unnoded': "a vertex lies on a neighbour's edge without a matching vertex",
+    'gap': "a stretch of border runs near a neighbour's without meeting it",
+}
+ERROR_KINDS = ('degenerate', 'self-intersection', 'ring-intersection', 'overlap')
+
+Point = Tuple[int, int]  # (x, y) = (lng, lat) in QUANTUM units; intersections may be Fractions
+RingKey = Tuple[int, int, int]  # (feature, polygon, ring)
+
+
+@dataclass
+class Defect:
+    kind: str
+    lat: float
+    lng: float
+    barangays: Tuple[str, ...]
+    detail: str = ''
+
+    @property
+    def is_error(self) -> bool:
+        return self.kind in ERROR_KINDS
+
+
+@dataclass
+class BoundaryReport:
+    defects: List[Defect] = field(default_factory=list)
+    rings: int = 0
+    segments: int = 0
+    shared_segments: int = 0
+    events: int = 0
+
+    def by_kind(self) -> Dict[str, List[Defect]]:
+        grouped: Dict[str, List[Defect]] = {}
+        for defect in self.defects:
+            grouped.setdefault(defect.kind, []).append(defect)
+        return grouped
+
+    @property
+    def errors(self) -> List[Defect]:
+        return [d for d in self.defects if d.is_error]
+
+
+class _Segment:
+    __slots__ = ('left', 'right', 'owners', 'order')
+
+    def __init__(self, left: Point, right: Point):
+        self.left = left
+        self.right = right
+        # (ring, interior on the left going left -> right)
+        self.owners: List[Tuple[RingKey, bool]] = []
+        dx, dy = right[0] - left[0], right[1] - left[1]
+        # Order just past a shared point: by slope, verticals last
+        self.order = (1, 0) if dx == 0 else (0, Fraction(dy, dx))
+
+    def y_at(self, x, y):
+        """Height where the sweep line at x meets this segment (verticals: y, clamped)"""
+        (x1, y1), (x2, y2) = self.left, self.right
+        if x1 == x2:
+            return min(max(y, y1), y2)
+        if x == x1:
+            return y1
+        if x == x2:
+            return y2
+        return y1 + Fraction((y2 - y1) * (x - x1), 1) / (x2 - x1)
+
+
+def _intersection(a: _Segment, b: _Segment) -> Optional[Point]:
+    """The single point two non-parallel segments share, if any (collinear overlaps
+    surface as endpoint events instead)"""
+    (x1, y1), (x2, y2) = a.left, a.right
+    (x3, y3), (x4, y4) = b.left, b.right
+    d = (x2 - x1) * (y4 - y3) - (y2 - y1) * (x4 - x3)
+    if d == 0:
+        return None
+    t_num = (x3 - x1) * (y4 - y3) - (y3 - y1) * (x4 - x3)
+    u_num = (x3 - x1) * (y2 - y1) - (y3 - y1) * (x2 - x1)
+    if d < 0:
+        d, t_num, u_num = -d, -t_num, -u_num
+    if not (0 <= t_num <= d and 0 <= u_num <= d):
+        return None
+    t = Fraction(t_num, d)
+    x, y = x1 + t * (x2 - x1), y1 + t * (y2 - y1)
+    # Fractions with denominator 1 hash and compare like the ints in the queue
+    return (int(x) if x.denominator == 1 else x, int(y) if y.denominator == 1 else y)
+
+
+def sweep(segments: List[_Segment]) -> Iterator[Tuple[Point, List[_Segment], List[_Segment]]]:
+    """Bentley-Ottmann: yields (point, segments with it as an endpoint, segments with
+    it inside) for every point where two or more segments meet, left to right
+
+    The event queue is a heap; the status line is a list kept in sweep order and
+    searched with bisect.
+    """
+    queue: List[Point] = []
+    queued = set()
+    starts: Dict[Point, List[_Segment]] = defaultdict(list)
+
+    def push(point):
+        if point not in queued:
+            queued.add(point)
+            heapq.heappush(queue, point)
+
+    for segment in segments:
+        starts[segment.left].append(segment)
+        push(segment.left)
+        push(segment.right)
+
+    status: List[_Segment] = []
+
+    def check(below: _Segment, above: _Segment, point: Point):
+        meet = _intersection(below, above)
+        if meet is not None and meet > point:
+            push(meet)
+
+    while queue:
+        point = heapq.heappop(queue)
+        px, py = point
+
+        def key(s):
+            return s.y_at(px, py)
+
+        lo = bisect_left(status, py, key=key)
+        hi = bisect_right(status, py, key=key)
+        through = status[lo:hi]
+        upper = starts.pop(point, [])
+        ending = [s for s in through if s.right == point]
+        inside = [s for s in through if s.right != point]
+        if len(upper) + len(through) > 1:
+            yield point, upper + ending, inside
+
+        inserted = sorted(upper + inside, key=lambda s: s.order)
+        status[lo:hi] = inserted
+        if not inserted:
+            if 0 < lo < len(status):
+                check(status[lo - 1], status[lo], point)
+            continue
+        if lo > 0:
+            check(status[lo - 1], status[lo], point)
+        end = lo + len(inserted)
+        if end < len(status):
+            check(status[end - 1], status[end], point)
+
+
+def _clean_ring(ring) -> List[Point]:
+    """Integer vertices without the closing vertex or consecutive repeats"""
+    points: List[Point] = []
+    for c in ring:
+        p = (round(float(c[0]) * QUANTUM), round(float(c[1]) * QUANTUM))
+        if not points or points[-1] != p:
+            points.append(p)
+    if len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+    return points
+
+
+def _signed_area2(ring: List[Point]) -> int:
+    return sum(ring[i - 1][0] * ring[i][1] - ring[i][0] * ring[i - 1][1] for i in range(len(ring)))
+
+
+def _to_degrees(point) -> Tuple[float, float]:
+    """(lat, lng) for a sweep point"""
+    return float(point[1]) / QUANTUM, float(point[0]) / QUANTUM
+
+
+def validate_boundaries(features: List[dict], gap_tolerance_m: float = DEFAULT_GAP_TOLERANCE_M) -> BoundaryReport:
+    """Every defect in a list of Polygon/MultiPolygon GeoJSON features"""
+    report = BoundaryReport()
+    seen = set()
+
+    def add(kind, point, feature_ids, detail=''):
+        names = tuple(sorted({names_by_id[f] for f in feature_ids}))
+        lat, lng = _to_degrees(point)
+        key = (kind, round(lat, 6), round(lng, 6), names)
+        if key not in seen:
+            seen.add(key)
+            report.defects.append(Defect(kind, lat, lng, names, detail))
+
+    # Parse, check rings on their own, and collect deduplicated segments
+    names_by_id: Dict[int, str] = {}
+    rings: Dict[RingKey, List[Point]] = {}
+    float_polygons: Dict[int, List[List[List[Tuple[float, float]]]]] = {}
+    segments: Dict[Tuple[Point, Point], _Segment] = {}
+    for f, feature in enumerate(features):
+        geom = feature.get('geometry') or {}
+        if geom.get('type') not in ('Polygon', 'MultiPolygon'):
+            continue
+        props = feature.get('properties') or {}
+        names_by_id[f] = props.get('BARANGAY') or props.get('Name') or f'feature {f}'
+        raw = geom['coordinates'] if geom['type'] == 'MultiPolygon' else [geom['coordinates']]
+        float_polygons[f] = [[[(float(c[0]), float(c[1])) for c in ring] for ring in polygon] for polygon in raw]
+        for p, polygon in enumerate(raw):
+            for r, raw_ring in enumerate(polygon):
+                ring = _clean_ring(raw_ring)
+                report.rings += 1
+                if len(set(ring)) < 3:
+                    add('degenerate', ring[0] if ring else (0, 0), [f], f'{len(set(ring))} distinct vertices')
+                    continue
+                area2 = _signed_area2(ring)
+                is_hole = r > 0
+                if area2 == 0:
+                    # Still swept: a symmetric bow-tie has zero area too
+                    add('degenerate', min(ring), [f], 'zero area')
+                elif (area2 > 0) == is_hole:
+                    add('winding', min(ring), [f], f"{'hole' if is_hole else 'exterior'} is "
+                                                   f"{'counter-clockwise' if area2 > 0 else 'clockwise'}")
+                rings[(f, p, r)] = ring
+                interior_left = (area2 > 0) != is_hole
+                for i, a in enumerate(ring):
+                    b = ring[(i + 1) % len(ring)]
+                    left, right = (a, b) if a < b else (b, a)
+                    segment = segments.get((left, right))
+                    if segment is None:
+                        segment = segments[(left, right)] = _Segment(left, right)
+                    segment.owners.append(((f, p, r), interior_left == (a < b)))
+
+    report.segments = len(segments)
+
+    # Shared edges: each side should belong to a different barangay
+    for segment in segments.values():
+        if len(segment.owners) < 2:
+            continue
+        report.shared_segments += 1
+        midpoint = ((segment.left[0] + segment.right[0]) / 2, (segment.left[1] + segment.right[1]) / 2)
+        for i, (ring_a, side_a) in enumerate(segment.owners):
+            for ring_b, side_b in segment.owners[i + 1:]:
+                if ring_a == ring_b:
+                    add('self-intersection', midpoint, [ring_a[0]],
+                        'spike (edge traced out and back)' if side_a != side_b else 'edge repeated')
+                elif ring_a[0] == ring_b[0]:
+                    add('ring-intersection', midpoint, [ring_a[0]], 'rings share an edge')
+                elif side_a == side_b:
+                    add('overlap', midpoint, [ring_a[0], ring_b[0]], 'shared edge with both on one side')
+
+    # Every point where segments meet
+    crossing_pairs = set()
+    for point, ends, inside in sweep(list(segments.values())):
+        report.events += 1
+        if not inside:
+            # Only endpoints meet here: fine unless a ring passes through twice
+            uses = defaultdict(int)
+            for segment in ends:
+                for ring_key, _ in segment.owners:
+                    uses[ring_key] += 1
+            for ring_key, count in uses.items():
+                if count > 2:
+                    add('self-intersection', point, [ring_key[0]], 'ring touches itself at a vertex')
+            continue
+        for segment in inside:
+            for other in inside + ends:
+                if other is segment:
+                    continue
+                crosses = other in inside
+                for ring_a, _ in segment.owners:
+                    for ring_b, _ in other.owners:
+                        if ring_a == ring_b:
+                            add('self-intersection', point, [ring_a[0]],
+                                'edges cross' if crosses else 'vertex on its own edge')
+                        elif ring_a[0] == ring_b[0]:
+                            add('ring-intersection', point, [ring_a[0]],
+                                'rings cross' if crosses else 'rings touch')
+                        elif crosses:
+                            crossing_pairs.add(frozenset((ring_a[0], ring_b[0])))
+                            add('overlap', point, [ring_a[0], ring_b[0]], 'borders cross')
+                        else:
+                            add('unnoded', point, [ring_a[0], ring_b[0]])
+
+    _check_neighbours(rings, float_polygons, crossing_pairs, gap_tolerance_m, add)
+    report.defects.sort(key=lambda d: (list(KINDS).index(d.kind), d.barangays, d.lat, d.lng))
+    return report
+
+
+def _check_neighbours(rings, float_polygons, crossing_pairs, gap_tolerance_m, add):
+    """Slivers along borders and barangays inside others, for bbox-neighbouring pairs"""
+    vertices: Dict[int, set] = defaultdict(set)
+    bboxes: Dict[int, Tuple[int, int, int, int]] = {}
+    for (f, _, _), ring in rings.items():
+        vertices[f].update(ring)
+    for f, points in vertices.items():
+        xs, ys = [p[0] for p in points], [p[1] for p in points]
+        bboxes[f] = (min(xs), min(ys), max(xs), max(ys))
+
+    pad = round(gap_tolerance_m / 111_000 * QUANTUM * 1.1)
+    grid = GridIndex(cell_deg=0.01)
+    for f, (x0, y0, x1, y1) in bboxes.items():
+        grid.insert(f, (y0 - pad) / QUANTUM, (x0 - pad) / QUANTUM, (y1 + pad) / QUANTUM, (x1 + pad) / QUANTUM)
+
+    borders: Dict[int, SegmentIndex] = {}
+
+    def border(f: int) -> SegmentIndex:
+        if f not in borders:
+            index = borders[f] = SegmentIndex(cell_deg=0.001)
+            for (g, _, _), ring in rings.items():
+                if g == f:
+                    for a, b in zip(ring, ring[1:] + ring[:1]):
+                        index.add(a[1] / QUANTUM, a[0] / QUANTUM, b[1] / QUANTUM, b[0] / QUANTUM, f)
+        return borders[f]
+
+    def inside(f: int, point: Point) -> bool:
+        x, y = point[0] / QUANTUM, point[1] / QUANTUM
+        return any(point_in_polygon(x, y, polygon) for polygon in float_polygons[f])
+
+    containment_tested = set()
+    for a in sorted(vertices):
+        for point in sorted(vertices[a]):
+            lat, lng = point[1] / QUANTUM, point[0] / QUANTUM
+            for b in grid.at(lat, lng):
+                if b == a or point in vertices[b]:
+                    continue
+                x0, y0, x1, y1 = bboxes[b]
+                if not (x0 - pad <= point[0] <= x1 + pad and y0 - pad <= point[1] <= y1 + pad):
+                    continue
+                nearest = border(b).nearest(lat, lng, max_distance_m=gap_tolerance_m)
+                if nearest is None:
+                    # Away from b's border: one vertex settles whether a sits inside b
+                    if (a, b) not in containment_tested and frozenset((a, b)) not in crossing_pairs:
+                        containment_tested.add((a, b))
+                        if inside(b, point):
+                            add('overlap', point, [a, b], 'lies inside a neighbour')
+                    continue
+                distance, snap_lat, snap_lng, _ = nearest
+                if distance <= SNAP_M:
+                    continue
+                # Next to a vertex the two share (a junction), not a sliver
+                snapped = (round(snap_lng * QUANTUM), round(snap_lat * QUANTUM))
+                if snapped in vertices[a]:
+                    continue
+                if inside(b, point):
+                    add('overlap', point, [a, b], f'{distance:.1f} m sliver')
+                else:
+                    add('gap', point, [a, b], f'{distance:.1f} m from the neighbour')
+
+
+def validate_boundaries_file(path: str = BARANGAY_GEOJSON_PATH,
+                             gap_tolerance_m: float = DEFAULT_GAP_TOLERANCE_M) -> BoundaryReport:
+    with open(path, 'r', encoding='utf-8') as f:
+        return validate_boundaries(json.load(f).get('features', []), gap_tolerance_m)
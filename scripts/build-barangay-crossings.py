@@ -0,0 +1,123 @@
+"""
+Build the barangay adjacency graph and road border-crossing index
+Derives neighbours from the shared arcs of Barangay.shp.json (plus borders
+that cross or come within --contact-tolerance metres) and intersects
+every segment of basey-roads.geojson with the barangay borders, then checks
+the crossing index against point-in-polygon at every road end.
+
+Usage:
+    python scripts/build-barangay-crossings.py
+    python scripts/build-barangay-crossings.py --show SULOD
+"""
+
+import argparse
+import json
+import os
+import time
+
+from barangay_boundaries import BARANGAY_GEOJSON_PATH, BarangayIndex
+from boundary_validation import DEFAULT_GAP_TOLERANCE_M
+from barangay_crossings import (
+    ADJACENCY_PATH,
+    CROSSINGS_PATH,
+    OUTSIDE,
+    CrossingIndex,
+    build_adjacency,
+    build_crossings,
+    road_starts,
+)
+from barangay_topology import build_topology
+from road_graph import ROADS_PATH
+from run_metrics import RunMetrics
+
+
+def check_road_ends(crossings: CrossingIndex, roads: dict, index: BarangayIndex):
+    """(agreeing, checked, µs per lookup, µs per polygon test) for the last vertex of every road"""
+    ends = []
+    for f, feature in enumerate(roads.get('features', [])):
+        geom = feature.get('geometry') or {}
+        if geom.get('type') == 'LineString' and len(geom['coordinates']) > 1:
+            ends.append((f, len(geom['coordinates']) - 1, geom['coordinates'][-1]))
+
+    start = time.perf_counter()
+    derived = [crossings.barangay_at(f, vertex) for f, vertex, _ in ends]
+    lookup_us = (time.perf_counter() - start) / max(1, len(ends)) * 1e6
+
+    start = time.perf_counter()
+    exact = [index.find_name(c[1], c[0]) for _, _, c in ends]
+    polygon_us = (time.perf_counter() - start) / max(1, len(ends)) * 1e6
+
+    agreeing = sum(1 for d, e in zip(derived, exact) if crossings.name(d) == e)
+    return agreeing, len(ends), lookup_us, polygon_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Barangay adjacency graph and road border-crossing index')
+    parser.add_argument('--boundaries', default=BARANGAY_GEOJSON_PATH)
+    parser.add_argument('--roads', default=ROADS_PATH)
+    parser.add_argument('--adjacency-output', default=ADJACENCY_PATH)
+    parser.add_argument('--crossings-output', default=CROSSINGS_PATH)
+    parser.add_argument('--contact-tolerance', type=float, default=DEFAULT_GAP_TOLERANCE_M, metavar='METRES',
+                        help='borders that cross or come this close without a shared arc still make neighbours')
+    parser.add_argument('--show', metavar='BARANGAY', help='print the neighbours of one barangay')
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='dump a profile of the run')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Basey Fare Check - BARANGAY ADJACENCY & BORDER CROSSINGS")
+    print("=" * 60)
+
+    metrics = RunMetrics('build-barangay-crossings', profile=args.profile)
+    with metrics.span('load'):
+        with open(args.boundaries, 'r', encoding='utf-8') as f:
+            features = json.load(f).get('features', [])
+        with open(args.roads, 'r', encoding='utf-8') as f:
+            roads = json.load(f)
+        index = BarangayIndex.load(args.boundaries)
+    names = [b.name for b in index.barangays]
+    if args.show and args.show.upper() not in names:
+        raise SystemExit(f"❌ Unknown barangay {args.show!r}; expected one of: {', '.join(sorted(names))}")
+
+    with metrics.span('topology'):
+        topology = build_topology(features)
+    with metrics.span('adjacency'):
+        adjacency = build_adjacency(topology, names, features, args.contact_tolerance)
+    with metrics.span('crossings'):
+        crossing_list = build_crossings(topology, names, roads)
+    with metrics.span('starts'):
+        starts = road_starts(roads, index, names)
+    crossings = CrossingIndex(names, adjacency, crossing_list, starts)
+
+    isolated = [name for i, name in enumerate(names) if not crossings.neighbour_lists.get(i)]
+    print(f"\n🧩 {len(names)} barangays, {len(adjacency)} bordering pairs "
+          f"({topology.shared_arc_count()} shared arcs)")
+    if isolated:
+        print(f"  ⚠️ No border within {args.contact_tolerance:g} m of another barangay: {', '.join(isolated)}")
+    crossed = len({(c.feature, c.segment) for c in crossing_list})
+    outside = sum(1 for c in crossing_list if OUTSIDE in (c.from_barangay, c.to_barangay))
+    print(f"🛣️ {len(crossing_list)} border crossings on {crossed} road segments "
+          f"({outside} into or out of no barangay)")
+
+    with metrics.span('check'):
+        agreeing, checked, lookup_us, polygon_us = check_road_ends(crossings, roads, index)
+    print(f"✅ Road ends matching point-in-polygon: {agreeing}/{checked} ({agreeing / max(1, checked):.2%}); "
+          f"{lookup_us:.1f} µs/lookup vs {polygon_us:.1f} µs/polygon test")
+
+    if args.show:
+        print(f"\n📍 {args.show.upper()} borders:")
+        for name, metres in crossings.neighbours(args.show.upper()):
+            print(f"  {name:<20} {metres:>8.0f} m")
+
+    adjacency_artifact, crossings_artifact = crossings.to_artifacts(roads)
+    with metrics.span('write'):
+        for path, artifact in ((args.adjacency_output, adjacency_artifact),
+                               (args.crossings_output, crossings_artifact)):
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(artifact, f, separators=(',', ':'), ensure_ascii=False)
+            print(f"💾 {os.path.getsize(path) / 1024:.1f} KB -> {path}")
+    metrics.report()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Build the point-to-barangay lookup raster from Barangay.shp.json
+Writes the artifact at one resolution and reports artifact size against
+lookup accuracy at several others.
+
+Usage:
+    python scripts/build-barangay-raster.py                     # 20 m cells
+    python scripts/build-barangay-raster.py --cell-m 50 --report 10,20,50,100,200
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+
+from barangay_boundaries import BarangayIndex
+from barangay_raster import BOUNDARY, RASTER_PATH, build_raster
+
+
+def sample_points(index: BarangayIndex, count: int, seed: int):
+    """Uniform points over the barangays' combined bbox (where lookups happen)"""
+    lng_min = min(b.bbox[0] for b in index.barangays)
+    lat_min = min(b.bbox[1] for b in index.barangays)
+    lng_max = max(b.bbox[2] for b in index.barangays)
+    lat_max = max(b.bbox[3] for b in index.barangays)
+    rng = random.Random(seed)
+    return [(rng.uniform(lat_min, lat_max), rng.uniform(lng_min, lng_max)) for _ in range(count)]
+
+
+def evaluate(raster, centres, points, exact):
+    """(share needing fallback, accuracy without fallback, accuracy with fallback, µs/lookup)"""
+    fallback = centre_hits = hits = 0
+    for (lat, lng), expected in zip(points, exact):
+        r = int((lat - raster.bbox['lat_min']) / raster.dlat)
+        c = int((lng - raster.bbox['lng_min']) / raster.dlng)
+        if not (0 <= r < raster.rows and 0 <= c < raster.cols):
+            fallback += 1  # outside the raster: find_name goes straight to the polygons
+            continue
+        value = int(centres[r, c])
+        if (raster.names[value - 1] if value else None) == expected:
+            centre_hits += 1
+        if raster.grid[r, c] == BOUNDARY:
+            fallback += 1
+
+    start = time.perf_counter()
+    for (lat, lng), expected in zip(points, exact):
+        if raster.find_name(lat, lng) == expected:
+            hits += 1
+    per_lookup = (time.perf_counter() - start) / len(points) * 1e6
+
+    n = len(points)
+    return fallback / n, centre_hits / n, hits / n, per_lookup
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rasterise Barangay.shp.json into a lookup grid')
+    parser.add_argument('--cell-m', type=float, default=20, help='cell size of the written artifact (metres)')
+    parser.add_argument('--output', default=RASTER_PATH)
+    parser.add_argument('--report', default='10,20,50,100,200', help='resolutions (metres) to compare')
+    parser.add_argument('--samples', type=int, default=50_000, help='random lookups per resolution')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Basey Fare Check - BARANGAY LOOKUP RASTER")
+    print("=" * 60)
+
+    index = BarangayIndex.load()
+    points = sample_points(index, args.samples, args.seed)
+    start = time.perf_counter()
+    exact = [index.find_name(lat, lng) for lat, lng in points]
+    polygon_us = (time.perf_counter() - start) / len(points) * 1e6
+
+    resolutions = sorted({float(r) for r in args.report.split(',') if r} | {args.cell_m})
+    print(f"\n📏 {args.samples} random lookups; polygon test alone: {polygon_us:.1f} µs/lookup\n")
+    print(f"  {'cell':>6} {'grid':>11} {'boundary':>9} {'fallback':>9} {'no-fallback':>12} "
+          f"{'exact':>7} {'µs':>6} {'artifact':>10} {'build':>7}")
+
+    for cell_m in resolutions:
+        start = time.perf_counter()
+        raster, centres = build_raster(index, cell_m=cell_m)
+        build_s = time.perf_counter() - start
+        artifact = json.dumps(raster.to_artifact(), separators=(',', ':'))
+        fallback, centre_acc, acc, per_lookup = evaluate(raster, centres, points, exact)
+        boundary_share = (raster.grid == BOUNDARY).mean()
+        print(f"  {cell_m:>5.0f}m {raster.rows:>5}x{raster.cols:<5} {boundary_share:>8.2%} {fallback:>8.2%} "
+              f"{centre_acc:>11.3%} {acc:>7.2%} {per_lookup:>6.1f} {len(artifact) / 1024:>8.0f}KB {build_s:>6.1f}s")
+
+        if cell_m == args.cell_m:
+            os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(artifact)
+            written = (cell_m, len(artifact))
+
+    print(f"\n💾 {written[0]:.0f} m raster ({written[1] / 1024:.0f} KB) -> {args.output}")
+    print("  no-fallback = accuracy using only cell centres; exact = with polygon fallback on boundary cells")
+
+
+if __name__ == '__main__':
+    main()
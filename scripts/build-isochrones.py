@@ -0,0 +1,146 @@
+"""
+Build drive-time isochrones from the poblacion origins
+Reads origins, time bands and per-highway speeds for each vehicle profile
+from scripts/isochrone-config.json, runs one bounded multi-source Dijkstra
+per profile and writes every band as a GeoJSON (Multi)Polygon.
+
+Usage:
+    python scripts/build-isochrones.py
+    python scripts/build-isochrones.py --profile-name tricycle --minutes 10,20
+    python scripts/build-isochrones.py --origin 11.2803,125.0685 --origin "Basey Terminal"
+"""
+
+import argparse
+import json
+import os
+
+from isochrones import TimeGrid, edge_speeds, travel_times
+from location_names import AliasTable
+from road_graph import ROADS_PATH, RoadGraph
+from run_metrics import RunMetrics
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'isochrone-config.json')
+LOCATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'basey-locations.json')
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'isochrones.geojson')
+
+
+def resolve_origins(specs, gazetteer: dict):
+    """Config/CLI origins -> [(label, lat, lng)]; names resolve through the gazetteer"""
+    aliases = AliasTable.load()
+    by_name = {}
+    for entries in gazetteer.get('locations', {}).values():
+        for loc in entries:
+            by_name.setdefault(aliases.canonical_id(loc['name']), loc)
+
+    origins = []
+    for spec in specs:
+        if 'lat' in spec and 'lng' in spec:
+            origins.append((spec.get('name') or f"{spec['lat']},{spec['lng']}", spec['lat'], spec['lng']))
+            continue
+        loc = by_name.get(aliases.canonical_id(spec['name']))
+        if not loc:
+            raise SystemExit(f"❌ Origin not in the gazetteer: {spec['name']}")
+        origins.append((loc['name'], loc['coordinates']['lat'], loc['coordinates']['lng']))
+    return origins
+
+
+def _origin_spec(value: str) -> dict:
+    try:
+        lat, lng = (float(part) for part in value.split(','))
+        return {'lat': lat, 'lng': lng}
+    except ValueError:
+        return {'name': value}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Drive-time isochrones over the Basey road network')
+    parser.add_argument('--config', default=CONFIG_PATH)
+    parser.add_argument('--roads', default=ROADS_PATH)
+    parser.add_argument('--output', default=OUTPUT_PATH)
+    parser.add_argument('--origin', action='append', type=_origin_spec,
+                        help='gazetteer name or "lat,lng" (repeatable; replaces the configured origins)')
+    parser.add_argument('--profile-name', action='append', help='vehicle profile(s) to build (default: all)')
+    parser.add_argument('--minutes', help='comma-separated time bands (default: from the config)')
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='dump a profile of the run')
+    args = parser.parse_args()
+
+    metrics = RunMetrics('build-isochrones', profile=args.profile)
+
+    print("=" * 60)
+    print("Basey Fare Check - DRIVE-TIME ISOCHRONES")
+    print("=" * 60)
+
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    with open(LOCATIONS_PATH, 'r', encoding='utf-8') as f:
+        gazetteer = json.load(f)
+    minutes = sorted(float(m) for m in args.minutes.split(',')) if args.minutes else sorted(config['minutes'])
+    profiles = args.profile_name or list(config['profiles'])
+    cell_m, catchment_m = config.get('cellM', 50), config.get('catchmentM', 100)
+
+    with metrics.span('load'):
+        graph = RoadGraph.load(args.roads)
+
+    origins = resolve_origins(args.origin or config['origins'], gazetteer)
+    origin_nodes = []
+    for name, lat, lng in origins:
+        node = graph.nearest_node(lat, lng)
+        if node is None:
+            raise SystemExit(f"❌ Origin is more than 200 m from any road: {name}")
+        origin_nodes.append(node)
+    print(f"\n📍 Origins: {', '.join(name for name, _, _ in origins)}")
+
+    # One reference point per barangay for the coverage report
+    barangay_points = []
+    for loc in gazetteer.get('locations', {}).get('barangay', []):
+        node = graph.nearest_node(loc['coordinates']['lat'], loc['coordinates']['lng'], max_distance_m=1000)
+        barangay_points.append((loc['name'], node))
+
+    features = []
+    for profile_name in profiles:
+        profile = config['profiles'].get(profile_name)
+        if profile is None:
+            raise SystemExit(f"❌ Unknown profile: {profile_name}")
+        with metrics.span('route'):
+            speeds = edge_speeds(graph, profile['speedsKmh'], profile['defaultKmh'])
+            times = travel_times(graph, origin_nodes, speeds, max_seconds=minutes[-1] * 60)
+        with metrics.span('grid'):
+            grid = TimeGrid.from_network(graph, times, speeds, cell_m, catchment_m)
+
+        print(f"\n🛺 {profile_name}")
+        print(f"  {'minutes':>8} {'area km²':>9} {'barangays':>10}")
+        # Largest band first so smaller bands draw on top
+        for band in reversed(minutes):
+            with metrics.span('trace'):
+                polygons = grid.band_polygons(band * 60)
+            if not polygons:
+                continue
+            covered = sum(1 for _, node in barangay_points if node is not None and times[node] <= band * 60)
+            area = grid.area_km2(band * 60)
+            features.append({
+                'type': 'Feature',
+                'properties': {
+                    'profile': profile_name,
+                    'minutes': band,
+                    'origins': [name for name, _, _ in origins],
+                    'areaKm2': round(area, 2),
+                    'barangaysReached': covered,
+                },
+                'geometry': {
+                    'type': 'Polygon' if len(polygons) == 1 else 'MultiPolygon',
+                    'coordinates': polygons[0] if len(polygons) == 1 else polygons,
+                },
+            })
+            metrics.count('bands')
+            print(f"  {band:>8g} {area:>9.1f} {covered:>6}/{len(barangay_points)}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    body = json.dumps({'type': 'FeatureCollection', 'features': features}, separators=(',', ':'))
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(body)
+    print(f"\n💾 {len(features)} isochrones ({len(body) / 1024:.0f} KB) -> {args.output}")
+    metrics.report()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Build contraction hierarchies for the offline road graph
+Contracts public/data/basey-roads.geojson, writes the shortcut graph for
+the client and benchmarks hierarchy queries against plain Dijkstra on
+origin/destination pairs drawn from the gazetteer.
+
+Usage:
+    python scripts/build-road-hierarchy.py                      # build, write, benchmark 500 pairs
+    python scripts/build-road-hierarchy.py --pairs 2000 --seed 7
+    python scripts/build-road-hierarchy.py --input public/data/basey-roads.ch.json --pairs 500
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import time
+
+from contraction_hierarchy import ContractionHierarchy, build_hierarchy
+from road_graph import ROADS_PATH, RoadGraph
+from run_metrics import RunMetrics
+
+LOCATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'basey-locations.json')
+HIERARCHY_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'basey-roads.ch.json')
+TOLERANCE_M = 0.5  # artifact weights are rounded to centimetres
+
+
+def gazetteer_nodes(graph: RoadGraph, path: str = LOCATIONS_PATH):
+    """Graph node for every gazetteer entry within snapping distance of a road"""
+    with open(path, 'r', encoding='utf-8') as f:
+        gazetteer = json.load(f)
+    nodes = []
+    for entries in gazetteer.get('locations', {}).values():
+        for loc in entries:
+            node = graph.nearest_node(loc['coordinates']['lat'], loc['coordinates']['lng'])
+            if node is not None:
+                nodes.append(node)
+    return nodes
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def benchmark(graph: RoadGraph, hierarchy: ContractionHierarchy, pairs):
+    dijkstra_ms, dijkstra_settled, ch_ms, ch_settled = [], [], [], []
+    mismatches = 0
+    for source, target in pairs:
+        start = time.perf_counter()
+        dist, settled = graph.dijkstra({source: 0.0}, target=target)
+        dijkstra_ms.append((time.perf_counter() - start) * 1000)
+        dijkstra_settled.append(settled)
+
+        start = time.perf_counter()
+        length, settled, path = hierarchy.query(source, target)
+        ch_ms.append((time.perf_counter() - start) * 1000)
+        ch_settled.append(settled)
+
+        expected = dist.get(target, math.inf)
+        if not (length == expected or abs(length - expected) <= TOLERANCE_M):
+            mismatches += 1
+        elif path and (path[0] != source or path[-1] != target):
+            mismatches += 1
+    return {
+        'dijkstra_ms': dijkstra_ms, 'dijkstra_settled': dijkstra_settled,
+        'ch_ms': ch_ms, 'ch_settled': ch_settled, 'mismatches': mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Contraction hierarchies for the offline road graph')
+    parser.add_argument('--roads', default=ROADS_PATH)
+    parser.add_argument('--output', default=HIERARCHY_PATH)
+    parser.add_argument('--input', help='benchmark an existing hierarchy instead of building one')
+    parser.add_argument('--pairs', type=int, default=500, help='gazetteer OD pairs to benchmark (0 to skip)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='dump a profile of the run')
+    args = parser.parse_args()
+
+    metrics = RunMetrics('build-road-hierarchy', profile=args.profile)
+
+    print("=" * 60)
+    print("Basey Fare Check - ROAD CONTRACTION HIERARCHY")
+    print("=" * 60)
+
+    with metrics.span('load'):
+        graph = RoadGraph.load(args.roads)
+    print(f"\n🛣️  {graph.node_count} nodes, {graph.edge_count} edges")
+
+    if args.input:
+        with metrics.span('load'):
+            hierarchy = ContractionHierarchy.load(args.input)
+        print(f"📦 Loaded {args.input}")
+    else:
+        with metrics.span('contract'):
+            hierarchy = build_hierarchy(graph)
+        artifact = json.dumps(hierarchy.to_artifact(), separators=(',', ':'))
+        with metrics.span('write'):
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(artifact)
+        print(f"🔺 {hierarchy.edge_count} upward edges ({hierarchy.shortcut_count} shortcuts)")
+        print(f"💾 {len(artifact) / 1024:.0f} KB -> {args.output}")
+
+    if args.pairs <= 0:
+        metrics.report()
+        return
+
+    nodes = gazetteer_nodes(graph)
+    rng = random.Random(args.seed)
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(args.pairs)]
+    print(f"\n📏 {len(pairs)} OD pairs from {len(nodes)} gazetteer entries on the network\n")
+    with metrics.span('benchmark'):
+        result = benchmark(graph, hierarchy, pairs)
+    metrics.count('pairs', len(pairs))
+
+    print(f"  {'':>10} {'p50 ms':>8} {'p95 ms':>8} {'mean settled':>13} {'max settled':>12}")
+    for label, ms, settled in (('dijkstra', result['dijkstra_ms'], result['dijkstra_settled']),
+                               ('hierarchy', result['ch_ms'], result['ch_settled'])):
+        print(f"  {label:>10} {_percentile(ms, 0.5):>8.3f} {_percentile(ms, 0.95):>8.3f} "
+              f"{statistics.mean(settled):>13.0f} {max(settled):>12}")
+    speedup = statistics.mean(result['dijkstra_ms']) / statistics.mean(result['ch_ms'])
+    print(f"\n⚡ {speedup:.0f}x faster on average; {result['mismatches']} distance mismatches")
+    metrics.report()
+    if result['mismatches']:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
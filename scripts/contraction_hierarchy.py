@@ -0,0 +1,231 @@
+"""
+Contraction hierarchies over the Basey road graph
+Nodes are contracted one at a time in order of importance (edge difference
+plus contracted neighbours); whenever removing a node would lengthen a
+shortest path between two of its neighbours, a shortcut edge replaces it.
+A query then runs a bidirectional Dijkstra that only climbs to higher-ranked
+nodes, settling a few hundred nodes instead of most of the graph.
+
+    hierarchy = build_hierarchy(RoadGraph.load())
+    distance, settled, path = hierarchy.query(source, target)
+"""
+
+import heapq
+import json
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+from road_graph import RoadGraph
+
+NO_VIA = -1
+WITNESS_SETTLE_LIMIT = 60  # bounded witness searches; a missed witness only adds a spare shortcut
+
+# up[v] = [(higher-ranked neighbour, weight, via node or NO_VIA), ...]
+UpEdges = List[List[Tuple[int, float, int]]]
+
+
+class ContractionHierarchy:
+    def __init__(self, coords: List[Tuple[float, float]], rank: List[int], up: UpEdges):
+        self.coords = coords
+        self.rank = rank
+        self.up = up
+        self._via: Dict[Tuple[int, int], int] = {}
+        for v, edges in enumerate(up):
+            for u, _, via in edges:
+                self._via[(v, u) if v < u else (u, v)] = via
+
+    @property
+    def shortcut_count(self) -> int:
+        return sum(1 for edges in self.up for _, _, via in edges if via != NO_VIA)
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(edges) for edges in self.up)
+
+    def query(self, source: int, target: int) -> Tuple[float, int, List[int]]:
+        """(distance in metres, settled nodes, node path); inf and [] when unreachable"""
+        if source == target:
+            return 0.0, 1, [source]
+        dist = ({source: 0.0}, {target: 0.0})
+        parent = ({source: source}, {target: target})
+        heaps = ([(0.0, source)], [(0.0, target)])
+        settled = [set(), set()]
+        best, meet = math.inf, None
+
+        side = 0
+        while heaps[0] or heaps[1]:
+            # Alternate directions; a side stops once its queue can't beat best
+            if not heaps[side] or heaps[side][0][0] >= best:
+                side ^= 1
+                if not heaps[side] or heaps[side][0][0] >= best:
+                    break
+            d, v = heapq.heappop(heaps[side])
+            if v in settled[side] or d > dist[side][v]:
+                side ^= 1
+                continue
+            settled[side].add(v)
+            other = dist[side ^ 1].get(v)
+            if other is not None and d + other < best:
+                best, meet = d + other, v
+            for u, w, _ in self.up[v]:
+                nd = d + w
+                if nd < dist[side].get(u, math.inf):
+                    dist[side][u] = nd
+                    parent[side][u] = v
+                    heapq.heappush(heaps[side], (nd, u))
+            side ^= 1
+
+        count = len(settled[0]) + len(settled[1])
+        if meet is None:
+            return math.inf, count, []
+        return best, count, self._unpack_path(parent, meet)
+
+    def _unpack_path(self, parent, meet: int) -> List[int]:
+        forward = [meet]
+        while parent[0][forward[-1]] != forward[-1]:
+            forward.append(parent[0][forward[-1]])
+        backward = [meet]
+        while parent[1][backward[-1]] != backward[-1]:
+            backward.append(parent[1][backward[-1]])
+        hops = forward[::-1] + backward[1:]
+
+        path = [hops[0]]
+        for a, b in zip(hops, hops[1:]):
+            path.extend(self._unpack_edge(a, b))
+        return path
+
+    def _unpack_edge(self, a: int, b: int) -> List[int]:
+        """Original nodes after a along shortcut a-b (inclusive of b)"""
+        out, stack = [], [(a, b)]
+        while stack:
+            x, y = stack.pop()
+            via = self._via[(x, y) if x < y else (y, x)]
+            if via == NO_VIA:
+                out.append(y)
+            else:
+                stack.append((via, y))
+                stack.append((x, via))
+        return out
+
+    def to_artifact(self, precision: int = 5) -> dict:
+        """Flat CSR arrays of the upward graph, ready for a typed-array loader"""
+        offsets, targets, weights, vias = [0], [], [], []
+        for edges in self.up:
+            for u, w, via in edges:
+                targets.append(u)
+                weights.append(round(w, 2))
+                vias.append(via)
+            offsets.append(len(targets))
+        return {
+            'version': 1,
+            'metric': 'length_m',
+            'directed': False,
+            'nodeCount': len(self.coords),
+            'coordinates': [round(x, precision) for c in self.coords for x in c],  # lng, lat pairs
+            'rank': self.rank,
+            'upOffsets': offsets,
+            'upTargets': targets,
+            'upWeights': weights,
+            'upVia': vias,
+        }
+
+    @classmethod
+    def from_artifact(cls, artifact: dict) -> 'ContractionHierarchy':
+        flat = artifact['coordinates']
+        coords = list(zip(flat[0::2], flat[1::2]))
+        offsets = artifact['upOffsets']
+        up = [
+            list(zip(artifact['upTargets'][a:b], artifact['upWeights'][a:b], artifact['upVia'][a:b]))
+            for a, b in zip(offsets, offsets[1:])
+        ]
+        return cls(coords, artifact['rank'], up)
+
+    @classmethod
+    def load(cls, path: str) -> 'ContractionHierarchy':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_artifact(json.load(f))
+
+
+def _witness_distances(adj: List[Dict[int, float]], source: int, excluded: int,
+                       max_cost: float, limit: int) -> Dict[int, float]:
+    """Tentative distances from source avoiding one node, bounded by cost and settle count"""
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    settled = 0
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if d > max_cost or settled >= limit:
+            break
+        settled += 1
+        for x, w in adj[u].items():
+            if x == excluded:
+                continue
+            nd = d + w
+            if nd < dist.get(x, math.inf):
+                dist[x] = nd
+                heapq.heappush(heap, (nd, x))
+    return dist
+
+
+def _shortcuts(adj: List[Dict[int, float]], v: int, limit: int) -> List[Tuple[int, int, float]]:
+    """Shortcuts needed between v's neighbours if v were removed now"""
+    neighbours = list(adj[v].items())
+    if len(neighbours) < 2:
+        return []
+    heaviest = max(w for _, w in neighbours)
+    needed = []
+    for i, (a, wa) in enumerate(neighbours[:-1]):
+        dist = _witness_distances(adj, a, v, wa + heaviest, limit)
+        for b, wb in neighbours[i + 1:]:
+            if dist.get(b, math.inf) > wa + wb:
+                needed.append((a, b, wa + wb))
+    return needed
+
+
+def build_hierarchy(graph: RoadGraph, witness_limit: int = WITNESS_SETTLE_LIMIT,
+                    progress: Optional[Callable[[int, int], None]] = None) -> ContractionHierarchy:
+    """Contract every node; up[v] records v's edges to the nodes contracted after it"""
+    n = graph.node_count
+    adj: List[Dict[int, float]] = [{} for _ in range(n)]
+    via: Dict[Tuple[int, int], int] = {}
+    for u, v, w in zip(graph.edge_u, graph.edge_v, graph.edge_length):
+        if w < adj[u].get(v, math.inf):  # parallel ways: keep the shorter
+            adj[u][v] = adj[v][u] = w
+            via[(u, v) if u < v else (v, u)] = NO_VIA
+
+    contracted_neighbours = [0] * n
+
+    def priority(v: int) -> int:
+        return len(_shortcuts(adj, v, witness_limit)) - len(adj[v]) + contracted_neighbours[v]
+
+    heap = [(priority(v), v) for v in range(n)]
+    heapq.heapify(heap)
+    rank = [0] * n
+    up: UpEdges = [[] for _ in range(n)]
+    order = 0
+
+    while heap:
+        _, v = heapq.heappop(heap)
+        # Lazy update: re-check the popped node against the next best
+        current = priority(v)
+        if heap and current > heap[0][0]:
+            heapq.heappush(heap, (current, v))
+            continue
+
+        for a, b, w in _shortcuts(adj, v, witness_limit):
+            if w < adj[a].get(b, math.inf):
+                adj[a][b] = adj[b][a] = w
+                via[(a, b) if a < b else (b, a)] = v
+        for u, w in adj[v].items():
+            up[v].append((u, w, via[(u, v) if u < v else (v, u)]))
+            del adj[u][v]
+            contracted_neighbours[u] += 1
+        adj[v] = {}
+        rank[v] = order
+        order += 1
+        if progress and order % 10_000 == 0:
+            progress(order, n)
+
+    return ContractionHierarchy(list(graph.coords), rank, up)
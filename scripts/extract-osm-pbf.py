@@ -0,0 +1,78 @@
+"""
+Build the road network and OSM location candidates from a local PBF extract
+Network-free replacement for scripts/fetch-roads.mjs (Overpass) and the
+OSM searches in the location scripts, for CI and air-gapped builds.
+
+Usage:
+    python scripts/extract-osm-pbf.py philippines-latest.osm.pbf
+    python scripts/extract-osm-pbf.py samar.osm.pbf --node-index flex_mem \
+        --candidates-out osm-candidates.json
+    python scripts/find-new-osm-locations.py --fixture osm-candidates.json --dry-run
+"""
+
+import argparse
+import json
+import os
+
+from barangay_boundaries import BarangayIndex
+from osm_extract import extract_candidates
+from osm_pbf import read_pbf
+from run_metrics import RunMetrics
+
+ROADS_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'basey-roads.geojson')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract Basey roads and locations from an .osm.pbf file')
+    parser.add_argument('pbf', help='local .osm.pbf extract (e.g. from Geofabrik)')
+    parser.add_argument('--roads-out', default=ROADS_PATH, help='road GeoJSON to write')
+    parser.add_argument('--no-roads', action='store_true', help='only extract location candidates')
+    parser.add_argument('--candidates-out', help='write POI elements as an Overpass-style JSON response')
+    parser.add_argument('--node-index', help='osmium node index (default: temporary sparse_file_array)')
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='dump a profile of the run')
+    args = parser.parse_args()
+
+    metrics = RunMetrics('extract-osm-pbf', profile=args.profile)
+
+    print("=" * 60)
+    print("Basey Fare Check - OSM PBF EXTRACTION")
+    print("=" * 60)
+
+    with metrics.span('load'):
+        index = BarangayIndex.load()
+
+    print(f"\n🗺️ Streaming {args.pbf}...")
+    with metrics.span('parse'):
+        elements, roads = read_pbf(args.pbf, index, node_index=args.node_index, roads=not args.no_roads)
+    candidates = extract_candidates({'elements': elements})
+    metrics.count('elements', len(elements))
+    metrics.count('candidates', len(candidates))
+    metrics.count('roads', len(roads))
+
+    by_type = {}
+    for candidate in candidates:
+        by_type[candidate['type']] = by_type.get(candidate['type'], 0) + 1
+    print(f"  Location candidates inside Basey: {len(candidates)}")
+    for loc_type, count in sorted(by_type.items()):
+        print(f"    {loc_type.title()}s: {count}")
+
+    with metrics.span('write'):
+        if args.candidates_out:
+            with open(args.candidates_out, 'w', encoding='utf-8') as f:
+                json.dump({'generator': f"extract-osm-pbf {os.path.basename(args.pbf)}", 'elements': elements},
+                          f, indent=2, ensure_ascii=False)
+            print(f"  💾 Candidates -> {args.candidates_out}")
+
+        if not args.no_roads:
+            body = json.dumps({'type': 'FeatureCollection', 'features': roads}, separators=(',', ':'))
+            os.makedirs(os.path.dirname(os.path.abspath(args.roads_out)), exist_ok=True)
+            with open(args.roads_out, 'w', encoding='utf-8') as f:
+                f.write(body)
+            print(f"  💾 {len(roads)} road segments, {len(body) / 1024:.0f} KB -> {args.roads_out}")
+
+    print("\n✅ Extraction complete")
+    metrics.report()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+"""
+Historical fare re-pricing and audit for Basey Fare Check
+Re-prices every saved fare calculation at the rate that was live when the
+trip happened and flags rows whose stored fares disagree.
+
+Rows stream from fare_calculations through a server-side cursor in large
+batches; each batch is matched to its FareRateVersion with one
+searchsorted over a precomputed rate timeline and re-priced in NumPy,
+so memory stays flat and throughput is millions of rows per minute.
+
+The fare formula mirrors src/lib/fare/calculator.ts:
+    subtotal = baseFare + ceil(max(distance - 3, 0)) * perKmRate
+    fare     = subtotal * 0.8 for discounted trips, else subtotal
+
+Usage:
+    python scripts/fare-audit.py [--since 2025-01-01] [--until 2025-07-01]
+    python scripts/fare-audit.py --disputed-only --output disputes.csv
+"""
+
+import argparse
+import csv
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    raise SystemExit("❌ numpy is required: pip install numpy")
+
+from location_db import connect
+from run_metrics import RunMetrics
+
+# src/lib/fare/policy.ts
+FARE_BASE_DISTANCE_KM = 3
+LEGACY_BASE_FARE = 15
+LEGACY_PER_KM_RATE = 3
+# src/lib/fare/calculator.ts
+DISCOUNT_RATE = 0.8
+
+TOLERANCE = 0.01
+DEFAULT_BATCH_SIZE = 50_000
+
+# Discrepancy flags (bitmask per row)
+FARE_MISMATCH = 1      # calculatedFare differs from the re-priced fare
+OVERCHARGED = 2        # actualFare paid exceeds the re-priced fare
+ORIGINAL_MISMATCH = 4  # pre-discount originalFare differs from the re-priced subtotal
+FLAG_NAMES = {FARE_MISMATCH: 'fare_mismatch', OVERCHARGED: 'overcharged', ORIGINAL_MISMATCH: 'original_mismatch'}
+
+VERSIONS_SQL = """
+SELECT id, "baseFare"::float8, "perKmRate"::float8,
+       EXTRACT(EPOCH FROM "effectiveAt")::float8,
+       EXTRACT(EPOCH FROM "createdAt")::float8,
+       EXTRACT(EPOCH FROM "canceledAt")::float8
+FROM fare_rate_versions
+"""
+
+CALCULATIONS_SQL = """
+SELECT fc.id, EXTRACT(EPOCH FROM fc."createdAt")::float8, fc.distance::float8,
+       fc."calculatedFare"::float8, fc."actualFare"::float8, fc."originalFare"::float8,
+       (fc."discountType" IS NOT NULL)
+FROM fare_calculations fc
+WHERE fc."createdAt" >= %(since)s AND fc."createdAt" < %(until)s
+{disputed}
+"""
+
+DISPUTED_FILTER = """
+  AND EXISTS (
+    SELECT 1 FROM incidents i
+    WHERE i."fareCalculationId" = fc.id
+      AND i."incidentType" IN ('FARE_OVERCHARGE', 'FARE_UNDERCHARGE')
+  )
+"""
+
+
+@dataclass
+class RateVersion:
+    id: str
+    base_fare: float
+    per_km_rate: float
+    effective_at: float  # epoch seconds
+    created_at: float
+    canceled_at: Optional[float] = None
+
+    def live_at(self, t: float) -> bool:
+        """Could getCurrentLiveFareRateVersion have picked this version at time t?"""
+        return (
+            self.created_at <= t
+            and self.effective_at <= t
+            and (self.canceled_at is None or t < self.canceled_at)
+        )
+
+
+class RateTimeline:
+    """The live rate as a piecewise-constant function of time
+
+    Every effectiveAt/createdAt/canceledAt is a breakpoint; between two
+    breakpoints the live version cannot change, so it is resolved once per
+    interval and a batch of trip times maps to intervals with searchsorted.
+    Interval 0 (before any version) uses the legacy default policy.
+    """
+
+    def __init__(self, versions: List[RateVersion]):
+        points = set()
+        for v in versions:
+            points.update(p for p in (v.effective_at, v.created_at, v.canceled_at) if p is not None)
+        self.starts = np.array([-np.inf] + sorted(points))
+
+        self.version_ids: List[Optional[str]] = []
+        base, per_km = [], []
+        for start in self.starts:
+            live = [v for v in versions if v.live_at(start)]
+            # Same ordering as getCurrentLiveFareRateVersion: effectiveAt desc, createdAt desc
+            current = max(live, key=lambda v: (v.effective_at, v.created_at)) if live else None
+            self.version_ids.append(current.id if current else None)
+            base.append(current.base_fare if current else LEGACY_BASE_FARE)
+            per_km.append(current.per_km_rate if current else LEGACY_PER_KM_RATE)
+        self.base_fare = np.array(base)
+        self.per_km_rate = np.array(per_km)
+
+    def resolve(self, times: np.ndarray) -> np.ndarray:
+        """Interval index for each trip time"""
+        return np.searchsorted(self.starts, times, side='right') - 1
+
+
+def load_timeline(conn) -> RateTimeline:
+    with conn.cursor() as cur:
+        cur.execute(VERSIONS_SQL)
+        versions = [RateVersion(*row) for row in cur.fetchall()]
+    return RateTimeline(versions)
+
+
+def _round_cents(values: np.ndarray) -> np.ndarray:
+    # Math.round(x * 100) / 100 rounds halves up, unlike np.round
+    return np.floor(values * 100 + 0.5) / 100
+
+
+def reprice(timeline: RateTimeline, times, distance, discounted):
+    """Vectorised calculateFare: (interval index, subtotal, expected fare)"""
+    interval = timeline.resolve(times)
+    additional_km = np.ceil(np.maximum(distance - FARE_BASE_DISTANCE_KM, 0))
+    subtotal = timeline.base_fare[interval] + additional_km * timeline.per_km_rate[interval]
+    expected = _round_cents(np.where(discounted, subtotal * DISCOUNT_RATE, subtotal))
+    return interval, subtotal, expected
+
+
+def audit_batch(timeline: RateTimeline, rows: list) -> dict:
+    """Re-price one fetched batch and return its columns plus per-row flags"""
+    ids, created, distance, calculated, actual, original, discounted = zip(*rows)
+    times = np.array(created, dtype=float)
+    distance = np.array(distance, dtype=float)
+    calculated = np.array(calculated, dtype=float)
+    actual = np.array(actual, dtype=float)  # None -> nan
+    original = np.array(original, dtype=float)
+    discounted = np.array(discounted, dtype=bool)
+
+    interval, subtotal, expected = reprice(timeline, times, distance, discounted)
+
+    flags = np.zeros(len(rows), dtype=np.int8)
+    flags |= np.where(np.abs(calculated - expected) > TOLERANCE, FARE_MISMATCH, 0).astype(np.int8)
+    # Comparisons against nan are False, so rows without the column never flag
+    flags |= np.where(actual - expected > TOLERANCE, OVERCHARGED, 0).astype(np.int8)
+    flags |= np.where(np.abs(original - subtotal) > TOLERANCE, ORIGINAL_MISMATCH, 0).astype(np.int8)
+
+    return {
+        'ids': ids, 'times': times, 'distance': distance, 'calculated': calculated,
+        'actual': actual, 'original': original, 'interval': interval,
+        'subtotal': subtotal, 'expected': expected, 'flags': flags,
+    }
+
+
+def _cell(value: float):
+    return '' if np.isnan(value) else f"{value:.2f}"
+
+
+def write_flagged(writer, timeline: RateTimeline, batch: dict) -> int:
+    flagged = np.nonzero(batch['flags'])[0]
+    for i in flagged:
+        writer.writerow([
+            batch['ids'][i],
+            datetime.fromtimestamp(batch['times'][i], tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
+            f"{batch['distance'][i]:.3f}",
+            _cell(batch['calculated'][i]),
+            _cell(batch['expected'][i]),
+            _cell(batch['actual'][i]),
+            _cell(batch['original'][i]),
+            _cell(batch['subtotal'][i]),
+            timeline.version_ids[batch['interval'][i]] or 'legacy-default',
+            '|'.join(name for bit, name in FLAG_NAMES.items() if batch['flags'][i] & bit),
+        ])
+    return len(flagged)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-price fare calculations at their historical rates')
+    parser.add_argument('--database-url', help='defaults to DIRECT_DATABASE_URL / DATABASE_URL')
+    parser.add_argument('--since', type=datetime.fromisoformat, default=datetime(1970, 1, 1),
+                        help='only trips on/after this date (YYYY-MM-DD)')
+    parser.add_argument('--until', type=datetime.fromisoformat, default=datetime(9999, 1, 1),
+                        help='only trips before this date (YYYY-MM-DD)')
+    parser.add_argument('--disputed-only', action='store_true', help='only trips with a fare incident')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='rows per cursor fetch')
+    parser.add_argument('--output', default='fare-audit.csv', help='CSV of flagged rows')
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='dump a profile of the run')
+    args = parser.parse_args()
+
+    metrics = RunMetrics('fare-audit', profile=args.profile)
+
+    print("=" * 60)
+    print("Basey Fare Check - FARE AUDIT")
+    print("=" * 60)
+
+    flag_totals = {name: 0 for name in FLAG_NAMES.values()}
+    by_version = {}
+
+    with connect(args.database_url) as conn:
+        with metrics.span('load'):
+            timeline = load_timeline(conn)
+        print(f"\n📋 Rate timeline: {len(timeline.starts)} intervals, "
+              f"{len({v for v in timeline.version_ids if v})} versions")
+
+        sql = CALCULATIONS_SQL.format(disputed=DISPUTED_FILTER if args.disputed_only else '')
+        with open(args.output, 'w', newline='', encoding='utf-8') as f, \
+                conn.cursor(name='fare_audit', binary=True) as cur:  # binary rows parse ~2x faster
+            writer = csv.writer(f)
+            writer.writerow([
+                'id', 'createdAt', 'distanceKm', 'calculatedFare', 'expectedFare', 'actualFare',
+                'originalFare', 'expectedOriginalFare', 'rateVersionId', 'flags',
+            ])
+
+            cur.itersize = args.batch_size
+            cur.execute(sql, {'since': args.since, 'until': args.until})
+            while True:
+                with metrics.span('fetch'):
+                    rows = cur.fetchmany(args.batch_size)
+                if not rows:
+                    break
+                with metrics.span('verify'):
+                    batch = audit_batch(timeline, rows)
+                with metrics.span('write'):
+                    flagged = write_flagged(writer, timeline, batch)
+
+                metrics.count('rows', len(rows))
+                metrics.count('flagged', flagged)
+                for bit, name in FLAG_NAMES.items():
+                    flag_totals[name] += int(np.count_nonzero(batch['flags'] & bit))
+                counts = np.bincount(batch['interval'], minlength=len(timeline.starts))
+                for interval in np.nonzero(counts)[0]:
+                    key = timeline.version_ids[interval] or 'legacy-default'
+                    by_version[key] = by_version.get(key, 0) + int(counts[interval])
+
+    rows = metrics.counters.get('rows', 0)
+    print(f"\n📊 Audited {rows} fare calculations")
+    for version, count in sorted(by_version.items(), key=lambda kv: -kv[1]):
+        print(f"  Rate {version}: {count} trips")
+    print("\n🚩 Discrepancies:")
+    for name, count in flag_totals.items():
+        print(f"  {name}: {count}")
+    print(f"\n💾 Flagged rows written to {args.output}")
+    metrics.report()
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,9 @@
 //
 // OSM/Overpass policy: rate-limited. Run ONCE, not per build. Output is cached
 // in public/data. Data © OpenStreetMap contributors (ODbL).
+//
+// CI / air-gapped builds: `python scripts/extract-osm-pbf.py <extract>.osm.pbf`
+// writes the same file from a local Geofabrik extract without Overpass.
 
 import { mkdir, writeFile } from 'node:fs/promises'
 
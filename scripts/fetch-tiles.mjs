@@ -4,19 +4,27 @@
 // Usage:
 //   node scripts/fetch-tiles.mjs            # default zoom 11..15
 //   node scripts/fetch-tiles.mjs 11 16      # custom min/max zoom
+//   node scripts/fetch-tiles.mjs --plan     # only the tiles in .builds/tile-plan.json
+//
+// The plan comes from scripts/plan-tiles.py: the whole bbox at overview
+// zooms, and only tiles near roads and gazetteer places above that.
 //
 // OSM tile policy: bulk downloading is rate-limited and discouraged at scale.
 // This is a ONE-TIME pull of a tiny municipal bbox, throttled, with a
 // descriptive User-Agent. Do not run it in a loop or per build. If coverage
 // needs to grow, switch to a self-hosted or commercial tile source.
 
-import { mkdir, writeFile } from 'node:fs/promises'
+import { existsSync } from 'node:fs'
+import { mkdir, readFile, writeFile } from 'node:fs/promises'
 import { dirname } from 'node:path'
 
 // Basey service-area bbox — mirrors SERVICE_AREA in
 // src/app/api/routes/calculate/route.ts
 const BBOX = { latMin: 11.1, latMax: 11.5, lngMin: 124.8, lngMax: 125.3 }
 
+const planIndex = process.argv.indexOf('--plan')
+const PLAN_PATH =
+  planIndex === -1 ? null : (process.argv[planIndex + 1] ?? '.builds/tile-plan.json')
 const MIN_ZOOM = Number(process.argv[2] ?? 11)
 const MAX_ZOOM = Number(process.argv[3] ?? 15)
 const THROTTLE_MS = 120
@@ -36,49 +44,71 @@ const subdomains = ['a', 'b', 'c']
 let subIndex = 0
 const nextSubdomain = () => subdomains[subIndex++ % subdomains.length]
 
-async function main() {
-  const manifest = []
-  let downloaded = 0
-  let skipped = 0
-
+// Tiles per zoom as "z/x/y": the plan's list, or every tile in the bbox.
+async function tilesByZoom() {
+  const zooms = new Map()
+  if (PLAN_PATH) {
+    const plan = JSON.parse(await readFile(PLAN_PATH, 'utf8'))
+    for (const tile of plan.tiles) {
+      const z = Number(tile.split('/')[0])
+      if (!zooms.has(z)) zooms.set(z, [])
+      zooms.get(z).push(tile)
+    }
+    console.log(
+      `plan ${PLAN_PATH}: ${plan.tiles.length} of ${plan.bboxTiles} bbox tiles, ` +
+        `~${(plan.estimatedBytes / 1024 ** 2).toFixed(0)} MB estimated`,
+    )
+    return zooms
+  }
   for (let z = MIN_ZOOM; z <= MAX_ZOOM; z++) {
     const xMin = lon2tile(BBOX.lngMin, z)
     const xMax = lon2tile(BBOX.lngMax, z)
     // y is inverted: north (latMax) gives the smaller y.
     const yMin = lat2tile(BBOX.latMax, z)
     const yMax = lat2tile(BBOX.latMin, z)
-
+    const tiles = []
     for (let x = xMin; x <= xMax; x++) {
-      for (let y = yMin; y <= yMax; y++) {
-        const rel = `${z}/${x}/${y}.png`
-        const outPath = `${OUT_DIR}/${rel}`
-        manifest.push(`/tiles/${rel}`)
+      for (let y = yMin; y <= yMax; y++) tiles.push(`${z}/${x}/${y}`)
+    }
+    zooms.set(z, tiles)
+  }
+  return zooms
+}
 
-        const { existsSync } = await import('node:fs')
-        if (existsSync(outPath)) {
-          skipped++
-          continue
-        }
+async function main() {
+  const manifest = []
+  let downloaded = 0
+  let skipped = 0
+
+  for (const [z, tiles] of await tilesByZoom()) {
+    for (const tile of tiles) {
+      const rel = `${tile}.png`
+      const outPath = `${OUT_DIR}/${rel}`
+      manifest.push(`/tiles/${rel}`)
 
-        const url = `https://${nextSubdomain()}.tile.openstreetmap.org/${rel}`
-        try {
-          const res = await fetch(url, { headers: { 'User-Agent': USER_AGENT } })
-          if (!res.ok) {
-            console.warn(`skip ${rel}: HTTP ${res.status}`)
-            continue
-          }
-          const buf = Buffer.from(await res.arrayBuffer())
-          await mkdir(dirname(outPath), { recursive: true })
-          await writeFile(outPath, buf)
-          downloaded++
-          if (downloaded % 100 === 0) console.log(`  ...${downloaded} tiles`)
-        } catch (err) {
-          console.warn(`error ${rel}: ${err.message}`)
+      if (existsSync(outPath)) {
+        skipped++
+        continue
+      }
+
+      const url = `https://${nextSubdomain()}.tile.openstreetmap.org/${rel}`
+      try {
+        const res = await fetch(url, { headers: { 'User-Agent': USER_AGENT } })
+        if (!res.ok) {
+          console.warn(`skip ${rel}: HTTP ${res.status}`)
+          continue
         }
-        await sleep(THROTTLE_MS)
+        const buf = Buffer.from(await res.arrayBuffer())
+        await mkdir(dirname(outPath), { recursive: true })
+        await writeFile(outPath, buf)
+        downloaded++
+        if (downloaded % 100 === 0) console.log(`  ...${downloaded} tiles`)
+      } catch (err) {
+        console.warn(`error ${rel}: ${err.message}`)
       }
+      await sleep(THROTTLE_MS)
     }
-    console.log(`zoom ${z}: x[${xMin}..${xMax}] y[${yMin}..${yMax}]`)
+    console.log(`zoom ${z}: ${tiles.length} tiles`)
   }
 
   await mkdir(OUT_DIR, { recursive: true })
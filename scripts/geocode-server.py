@@ -0,0 +1,137 @@
+"""
+Local reverse-geocoding service for Basey (stdlib http.server)
+Loads the barangay polygons, gazetteer landmarks and road network into
+in-memory indexes once, then answers lookups in microseconds.
+
+Endpoints (JSON in, JSON out):
+    POST /reverse               {"lat": 11.28, "lng": 125.07}
+    POST /reverse/batch         {"points": [{"lat": ..., "lng": ...}, ...]}   (up to 1000)
+    POST /api/geocode/reverse   same contract as the Next.js route, Google-shaped result
+    GET  /health
+
+Usage:
+    python scripts/geocode-server.py [--host 127.0.0.1] [--port 8765]
+"""
+
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from reverse_geocoder import ReverseGeocoder, to_google_result
+
+DEFAULT_PORT = 8765
+MAX_BATCH = 1000
+
+
+class BadRequest(Exception):
+    pass
+
+
+def _point(body) -> tuple:
+    if not isinstance(body, dict):
+        raise BadRequest('Invalid coordinates. Please provide valid latitude and longitude.')
+    lat, lng = body.get('lat'), body.get('lng')
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in (lat, lng)):
+        raise BadRequest('Invalid coordinates. Please provide valid latitude and longitude.')
+    return float(lat), float(lng)
+
+
+def make_handler(geocoder: ReverseGeocoder, max_batch: int = MAX_BATCH):
+    class GeocodeHandler(BaseHTTPRequestHandler):
+        server_version = 'BaseyGeocoder/1.0'
+
+        def _send(self, status: int, payload: dict):
+            body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_OPTIONS(self):
+            self.send_response(204)
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+            self.end_headers()
+
+        def do_GET(self):
+            if self.path == '/health':
+                self._send(200, {
+                    'status': 'ok',
+                    'barangays': len(geocoder.barangays.barangays),
+                    'landmarks': geocoder.landmarks.size,
+                    'roadSegments': geocoder.roads.size,
+                })
+            else:
+                self._send(404, {'error': 'Not found'})
+
+        def do_POST(self):
+            try:
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length) or b'{}')
+                start = time.perf_counter()
+
+                if self.path == '/reverse':
+                    result = geocoder.lookup(*_point(body))
+                    payload = {'success': True, 'result': result}
+                elif self.path == '/reverse/batch':
+                    points = body.get('points') if isinstance(body, dict) else None
+                    if not isinstance(points, list):
+                        raise BadRequest('Provide "points": [{"lat": ..., "lng": ...}, ...]')
+                    if len(points) > max_batch:
+                        raise BadRequest(f"At most {max_batch} points per batch")
+                    results = geocoder.lookup_many([_point(p) for p in points])
+                    payload = {'success': True, 'results': results}
+                elif self.path == '/api/geocode/reverse':
+                    result = to_google_result(geocoder.lookup(*_point(body)))
+                    if result['status'] != 'OK':
+                        self._send(400, {'error': f"Geocoding failed: {result['status']}"})
+                        return
+                    payload = {'success': True, 'result': result}
+                else:
+                    self._send(404, {'error': 'Not found'})
+                    return
+
+                payload['elapsedUs'] = round((time.perf_counter() - start) * 1e6, 1)
+                self._send(200, payload)
+            except (BadRequest, json.JSONDecodeError) as e:
+                self._send(400, {'error': str(e)})
+            except Exception as e:
+                self._send(500, {'error': 'Internal server error during geocoding', 'details': str(e)})
+
+        def log_message(self, format, *args):
+            if self.server.verbose:
+                super().log_message(format, *args)
+
+    return GeocodeHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local reverse-geocoding service for Basey')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH)
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    geocoder = ReverseGeocoder.load()
+    print(f"📦 Indexed {len(geocoder.barangays.barangays)} barangays, {geocoder.landmarks.size} landmarks, "
+          f"{geocoder.roads.size} road segments in {time.perf_counter() - start:.2f}s")
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(geocoder, args.max_batch))
+    server.verbose = args.verbose
+    print(f"🌐 Listening on http://{args.host}:{args.port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
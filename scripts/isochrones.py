@@ -0,0 +1,205 @@
+"""
+Drive-time isochrones over the Basey road network
+A bounded multi-source Dijkstra gives the travel time to every road node
+from the nearest origin, using a speed per OSM highway class. Times are
+interpolated along each edge onto a metric grid, spread over a short
+catchment so roadside homes count as reached, and every band's cells are
+traced into polygons.
+
+    graph = RoadGraph.load()
+    speeds = edge_speeds(graph, {'primary': 35, 'footway': None}, default_kmh=15)
+    times = travel_times(graph, origins, speeds, max_seconds=1800)
+    grid = TimeGrid.from_network(graph, times, speeds, cell_m=50)
+    polygons = grid.band_polygons(600)   # reachable within 10 minutes
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from barangay_boundaries import point_in_polygon
+from barangay_topology import douglas_peucker_weights
+from road_graph import RoadGraph
+from spatial_index import METRES_PER_DEGREE
+
+Ring = List[Tuple[float, float]]
+
+
+def edge_speeds(graph: RoadGraph, speeds_kmh: Dict[str, Optional[float]], default_kmh: float) -> np.ndarray:
+    """Metres per second per edge; 0 for classes the vehicle can't use (speed null)"""
+    speeds = np.empty(graph.edge_count)
+    for i, highway in enumerate(graph.edge_highway):
+        kmh = speeds_kmh[highway] if highway in speeds_kmh else default_kmh
+        speeds[i] = (kmh or 0) / 3.6
+    return speeds
+
+
+def travel_times(graph: RoadGraph, origins: List[int], speeds: np.ndarray, max_seconds: float) -> np.ndarray:
+    """Seconds from the nearest origin to every node (inf beyond max_seconds)"""
+    seconds = np.where(speeds > 0, np.asarray(graph.edge_length) / np.where(speeds > 0, speeds, 1), math.inf)
+    edge_seconds = seconds.tolist()
+    settled, _ = graph.dijkstra({node: 0.0 for node in origins}, max_cost=max_seconds,
+                                edge_cost=edge_seconds.__getitem__)
+    times = np.full(graph.node_count, math.inf)
+    times[list(settled)] = list(settled.values())
+    return times
+
+
+class TimeGrid:
+    """Minimum travel time per grid cell, in a local metric projection"""
+
+    def __init__(self, times: np.ndarray, origin: Tuple[float, float], cell_m: float, lng_scale: float):
+        self.times = times  # [row][col], rows south-to-north
+        self.origin = origin  # (lng, lat) of the south-west corner
+        self.cell_m = cell_m
+        self.lng_scale = lng_scale
+
+    @classmethod
+    def from_network(cls, graph: RoadGraph, node_times: np.ndarray, speeds: np.ndarray,
+                     cell_m: float = 50, catchment_m: float = 100) -> 'TimeGrid':
+        coords = np.asarray(graph.coords)
+        reached = np.isfinite(node_times)
+
+        # Sample every usable edge with a reached end at half-cell spacing;
+        # the time at a sample is the faster of arriving from either end
+        u = np.asarray(graph.edge_u)
+        v = np.asarray(graph.edge_v)
+        length = np.asarray(graph.edge_length)
+        keep = (speeds > 0) & (reached[u] | reached[v])
+        u, v, length, speed = u[keep], v[keep], length[keep], speeds[keep]
+        samples = np.maximum(2, np.ceil(length / (cell_m / 2)).astype(int) + 1)
+        edge = np.repeat(np.arange(len(u)), samples)
+        offsets = np.concatenate([[0], np.cumsum(samples)[:-1]])
+        frac = (np.arange(len(edge)) - np.repeat(offsets, samples)) / np.repeat(samples - 1, samples)
+        along = frac * length[edge]
+        t = np.minimum(node_times[u[edge]] + along / speed[edge],
+                       node_times[v[edge]] + (length[edge] - along) / speed[edge])
+        lng = coords[u[edge], 0] + frac * (coords[v[edge], 0] - coords[u[edge], 0])
+        lat = coords[u[edge], 1] + frac * (coords[v[edge], 1] - coords[u[edge], 1])
+
+        # Grid over the sampled points plus a margin for the catchment
+        margin = 2 * catchment_m / METRES_PER_DEGREE + cell_m / METRES_PER_DEGREE
+        lng0, lat0 = lng.min() - margin, lat.min() - margin
+        lng1, lat1 = lng.max() + margin, lat.max() + margin
+        lng_scale = math.cos(math.radians((lat0 + lat1) / 2))
+        rows = int((lat1 - lat0) * METRES_PER_DEGREE / cell_m) + 1
+        cols = int((lng1 - lng0) * METRES_PER_DEGREE * lng_scale / cell_m) + 1
+
+        r = ((lat - lat0) * METRES_PER_DEGREE / cell_m).astype(int)
+        c = ((lng - lng0) * METRES_PER_DEGREE * lng_scale / cell_m).astype(int)
+        grid = np.full((rows, cols), np.inf)
+        np.minimum.at(grid, (r, c), t)
+
+        # Catchment: a cell within catchment_m of a reached road takes its time
+        radius = int(round(catchment_m / cell_m))
+        spread = grid.copy()
+        for dr in range(-radius, radius + 1):
+            for dc in range(-radius, radius + 1):
+                if (dr or dc) and dr * dr + dc * dc <= radius * radius:
+                    shifted = np.full_like(grid, np.inf)
+                    shifted[max(dr, 0):rows + min(dr, 0), max(dc, 0):cols + min(dc, 0)] = \
+                        grid[max(-dr, 0):rows + min(-dr, 0), max(-dc, 0):cols + min(-dc, 0)]
+                    np.minimum(spread, shifted, out=spread)
+        return cls(spread, (lng0, lat0), cell_m, lng_scale)
+
+    def area_km2(self, max_seconds: float) -> float:
+        return float((self.times <= max_seconds).sum()) * self.cell_m ** 2 / 1e6
+
+    def band_polygons(self, max_seconds: float, simplify_m: Optional[float] = None) -> List[List[Ring]]:
+        """Polygons ([outer, *holes] in lng/lat) covering every cell reached within max_seconds
+
+        The cell staircase is smoothed with Douglas-Peucker at simplify_m
+        (default half a cell); rings that collapse are dropped.
+        """
+        tolerance = (self.cell_m / 2 if simplify_m is None else simplify_m) / self.cell_m
+        rings = []
+        for ring in trace_rings(self.times <= max_seconds):
+            if tolerance > 0:
+                keep = douglas_peucker_weights(np.asarray(ring, dtype=float)) >= tolerance
+                ring = [p for p, k in zip(ring, keep) if k]
+            if len(ring) >= 4:
+                rings.append(ring)
+        lng0, lat0 = self.origin
+        deg_y = self.cell_m / METRES_PER_DEGREE
+        deg_x = self.cell_m / (METRES_PER_DEGREE * self.lng_scale)
+
+        outers, holes = [], []
+        for ring in rings:
+            area = _signed_area(ring)
+            coords = [(round(lng0 + x * deg_x, 6), round(lat0 + y * deg_y, 6)) for x, y in ring]
+            (outers if area > 0 else holes).append((area, coords))
+        # Smallest outer first, so a hole goes to the ring that directly encloses it
+        polygons = [[outer] for _, outer in sorted(outers)]
+        for _, hole in holes:
+            for polygon in polygons:
+                if point_in_polygon(*_inner_point(hole), polygon[:1]):
+                    polygon.append(hole)
+                    break
+        return polygons
+
+
+# Corner-to-corner unit steps; turning right from (dx, dy) is (dy, -dx)
+def trace_rings(mask: np.ndarray) -> List[List[Tuple[int, int]]]:
+    """Outline a boolean grid as closed rings on cell corners (x = col, y = row)
+
+    Outer rings run counter-clockwise and holes clockwise (inside on the
+    left). Where two cells touch only at a corner the trace turns right, so
+    they stay separate rings.
+    """
+    padded = np.pad(mask, 1)
+    inside = padded[1:-1, 1:-1]
+    rows, cols = np.nonzero(inside)
+    edges: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+
+    def add(starts_x, starts_y, dx, dy):
+        for x, y in zip(starts_x.tolist(), starts_y.tolist()):
+            edges.setdefault((x, y), []).append((dx, dy))
+
+    # Neighbour outside -> the shared side is a boundary edge
+    below = ~padded[rows, cols + 1]
+    right = ~padded[rows + 1, cols + 2]
+    above = ~padded[rows + 2, cols + 1]
+    left = ~padded[rows + 1, cols]
+    add(cols[below], rows[below], 1, 0)
+    add(cols[right] + 1, rows[right], 0, 1)
+    add(cols[above] + 1, rows[above] + 1, -1, 0)
+    add(cols[left], rows[left] + 1, 0, -1)
+
+    rings = []
+    while edges:
+        start = next(iter(edges))
+        x, y = start
+        dx, dy = edges[start].pop()
+        if not edges[start]:
+            del edges[start]
+        ring = [(x, y)]
+        while True:
+            x, y = x + dx, y + dy
+            if (x, y) == start:
+                break
+            options = edges[(x, y)]
+            if len(options) > 1:
+                turn = (dy, -dx) if (dy, -dx) in options else options[0]
+                options.remove(turn)
+            else:
+                turn = options.pop()
+            if not options:
+                del edges[(x, y)]
+            if turn != (dx, dy):
+                ring.append((x, y))  # keep corners only
+            dx, dy = turn
+        if ring[0] != ring[-1]:
+            ring.append(ring[0])
+        rings.append(ring)
+    return rings
+
+
+def _signed_area(ring) -> float:
+    return sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(ring, ring[1:])) / 2
+
+
+def _inner_point(ring: Ring) -> Tuple[float, float]:
+    # Midpoint of the first edge; enough to tell which outer ring holds a hole
+    (x1, y1), (x2, y2) = ring[0], ring[1]
+    return (x1 + x2) / 2, (y1 + y2) / 2
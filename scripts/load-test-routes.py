@@ -0,0 +1,471 @@
+"""
+Load test for POST /api/routes/calculate
+Fires route calculations for origin/destination pairs sampled from the
+gazetteer at a fixed concurrency, or at a Poisson arrival rate, and records
+latency percentiles, status codes and API error codes. The results are
+written as JSON so runs can be compared across releases (--compare).
+
+With --rate the test is open loop: requests are scheduled on the arrival
+clock whether or not earlier ones have finished. Latency is measured from
+the scheduled time, so time spent waiting for one of the --concurrency
+slots counts (no coordinated omission). Service time, from the actual
+send, is reported beside it. Without --rate, --concurrency workers send
+back to back.
+
+Providers should be stubbed, or a run bills the real APIs and measures
+their latency instead of ours. --stub-ors PORT serves an OpenRouteService-
+shaped stub (straight line x 1.3, --stub-latency-ms per call) from this
+process. Start the dev server against it:
+
+    $env:ROUTING_ORS_URL='http://127.0.0.1:8790/v2/directions/driving-car'
+    $env:OPENROUTESERVICE_API_KEY='stub'; $env:ROUTING_PROVIDER='ors'
+    npm run dev
+
+Usage:
+    python scripts/load-test-routes.py --stub-ors 8790 --stub-only
+    python scripts/load-test-routes.py --concurrency 20 --duration 60
+    python scripts/load-test-routes.py --rate 50 --concurrency 100 --duration 120 --compare .loadtests/last.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import ssl
+import statistics
+import subprocess
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from road_graph import encode_polyline, haversine_m
+from run_metrics import RunMetrics
+
+LOCATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'basey-locations.json')
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), '..', '.loadtests')
+DEFAULT_URL = 'http://localhost:3000/api/routes/calculate'
+
+# SERVICE_AREA in src/app/api/routes/calculate/route.ts; pins outside it are rejected with 400
+SERVICE_AREA = {'lat_min': 11.1, 'lat_max': 11.5, 'lng_min': 124.8, 'lng_max': 125.3}
+MODES = ('pin', 'preset', 'mixed')
+PASSENGER_TYPES = ('REGULAR', 'REGULAR', 'REGULAR', 'STUDENT', 'SENIOR', 'PWD')
+PERCENTILES = (50, 90, 95, 99)
+STUB_DETOUR = 1.3  # road distance over straight line, for the stub
+STUB_SPEED_KMH = 30
+
+
+def sample_pairs(gazetteer: dict, count: int, mode: str, rng: random.Random) -> List[dict]:
+    """Distinct request bodies for OD pairs drawn from the gazetteer"""
+    places = [
+        (loc['name'], loc['coordinates']['lat'], loc['coordinates']['lng'])
+        for locs in gazetteer.get('locations', {}).values() for loc in locs
+        if SERVICE_AREA['lat_min'] <= loc['coordinates']['lat'] <= SERVICE_AREA['lat_max']
+        and SERVICE_AREA['lng_min'] <= loc['coordinates']['lng'] <= SERVICE_AREA['lng_max']
+    ]
+    if len(places) < 2:
+        raise SystemExit("❌ The gazetteer needs at least two places inside the service area")
+
+    def endpoint(place, as_pin: bool) -> dict:
+        name, lat, lng = place
+        return {'type': 'pin', 'lat': lat, 'lng': lng} if as_pin else {'type': 'preset', 'name': name}
+
+    bodies, seen = [], set()
+    attempts = 0
+    while len(bodies) < count and attempts < count * 20:
+        attempts += 1
+        origin, destination = rng.sample(places, 2)
+        as_pin = mode == 'pin' or (mode == 'mixed' and rng.random() < 0.5)
+        key = (origin[0], destination[0], as_pin)
+        if key in seen:
+            continue
+        seen.add(key)
+        bodies.append({
+            'origin': endpoint(origin, as_pin),
+            'destination': endpoint(destination, as_pin),
+            'passengerType': rng.choice(PASSENGER_TYPES),
+        })
+    return bodies
+
+
+def zipf_weights(count: int, skew: float) -> Optional[List[float]]:
+    """Popularity weights (pair i drawn in proportion to 1 / (i + 1) ** skew); None is uniform"""
+    return [1 / (i + 1) ** skew for i in range(count)] if skew > 0 else None
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Linear-interpolated percentile (q in 0..100)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    low, high = math.floor(position), math.ceil(position)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def latency_summary(values: List[float]) -> dict:
+    summary = {f'p{q}': percentile(values, q) for q in PERCENTILES}
+    summary.update({
+        'mean': statistics.mean(values) if values else None,
+        'max': max(values) if values else None,
+    })
+    return {k: None if v is None else round(v, 2) for k, v in summary.items()}
+
+
+class HttpPool:
+    """Minimal keep-alive HTTP/1.1 client on asyncio streams (stdlib only)"""
+
+    def __init__(self, url: str, size: int, timeout: float):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.path = parts.path or '/'
+        self.ssl = ssl.create_default_context() if parts.scheme == 'https' else None
+        self.timeout = timeout
+        self.idle: asyncio.LifoQueue = asyncio.LifoQueue()
+        for _ in range(size):
+            self.idle.put_nowait(None)
+
+    async def post_json(self, body: dict) -> Tuple[int, bytes]:
+        connection = await self.idle.get()
+        try:
+            if connection is None:
+                connection = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port, ssl=self.ssl), self.timeout)
+            status, payload, keep_alive = await asyncio.wait_for(self._exchange(connection, body), self.timeout)
+            if not keep_alive:
+                connection[1].close()
+                connection = None
+            return status, payload
+        except BaseException:
+            if connection is not None:
+                connection[1].close()
+            connection = None
+            raise
+        finally:
+            self.idle.put_nowait(connection)
+
+    async def _exchange(self, connection, body: dict) -> Tuple[int, bytes, bool]:
+        reader, writer = connection
+        data = json.dumps(body).encode()
+        writer.write(
+            f"POST {self.path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+            f"Connection: keep-alive\r\n\r\n".encode() + data)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError('connection closed by server')
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            payload = b''.join(chunks)
+        elif 'content-length' in headers:
+            payload = await reader.readexactly(int(headers['content-length']))
+        else:
+            payload = await reader.read()
+            return status, payload, False
+        return status, payload, headers.get('connection', '').lower() != 'close'
+
+    async def close(self):
+        while not self.idle.empty():
+            connection = self.idle.get_nowait()
+            if connection is not None:
+                connection[1].close()
+
+
+class Recorder:
+    def __init__(self, warmup_until: float):
+        self.warmup_until = warmup_until
+        self.latency_ms: List[float] = []
+        self.service_ms: List[float] = []
+        self.statuses: Dict[str, int] = {}
+        self.error_codes: Dict[str, int] = {}
+        self.providers: Dict[str, int] = {}
+        self.errors = 0
+        self.first: Optional[float] = None
+        self.last: Optional[float] = None
+
+    def record(self, scheduled: float, sent: float, done: float, status: str, payload: Optional[dict]):
+        if scheduled < self.warmup_until:
+            return
+        self.first = scheduled if self.first is None else min(self.first, scheduled)
+        self.last = done if self.last is None else max(self.last, done)
+        self.latency_ms.append((done - scheduled) * 1000)
+        self.service_ms.append((done - sent) * 1000)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if not status.startswith('2'):
+            self.errors += 1
+            code = (payload or {}).get('code') or status
+            self.error_codes[code] = self.error_codes.get(code, 0) + 1
+        elif payload:
+            provider = payload.get('provider') or payload.get('method') or 'estimate'
+            self.providers[provider] = self.providers.get(provider, 0) + 1
+
+
+async def send(pool: HttpPool, body: dict, scheduled: float, recorder: Recorder):
+    sent = time.perf_counter()
+    payload = None
+    try:
+        status_code, raw = await pool.post_json(body)
+        status = str(status_code)
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            pass
+    except asyncio.TimeoutError:
+        status = 'timeout'
+    except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError):
+        status = 'connection_error'
+    recorder.record(scheduled, sent, time.perf_counter(), status, payload)
+
+
+async def run_load(args, bodies: List[dict], rng: random.Random) -> Recorder:
+    weights = zipf_weights(len(bodies), args.skew)
+    pool = HttpPool(args.url, args.concurrency, args.timeout)
+    started = time.perf_counter()
+    stop_at = started + args.warmup + args.duration
+    recorder = Recorder(started + args.warmup)
+    budget = args.requests
+
+    def next_body() -> dict:
+        return rng.choices(bodies, weights)[0] if weights else rng.choice(bodies)
+
+    try:
+        if args.rate:
+            # Open loop: Poisson arrivals; a semaphore caps requests in flight
+            slots = asyncio.Semaphore(args.concurrency)
+            tasks = set()
+
+            async def arrival(body: dict, scheduled: float):
+                async with slots:
+                    await send(pool, body, scheduled, recorder)
+
+            scheduled, sent = started, 0
+            while scheduled < stop_at and (budget is None or sent < budget):
+                scheduled += rng.expovariate(args.rate)
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                task = asyncio.create_task(arrival(next_body(), scheduled))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                sent += 1
+            if tasks:
+                await asyncio.gather(*tasks)
+        else:
+            # Closed loop: each worker sends its next request when the last one returns
+            counter = {'sent': 0}
+
+            async def worker():
+                while time.perf_counter() < stop_at and (budget is None or counter['sent'] < budget):
+                    counter['sent'] += 1
+                    now = time.perf_counter()
+                    await send(pool, next_body(), now, recorder)
+
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    finally:
+        await pool.close()
+    return recorder
+
+
+def make_stub_handler(latency_s: float):
+    """OpenRouteService directions stub: routes[0].summary / geometry / way_points"""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    if name.strip().lower() == 'content-length':
+                        length = int(value)
+                raw = await reader.readexactly(length) if length else b''
+                try:
+                    (lng1, lat1), (lng2, lat2) = json.loads(raw)['coordinates'][:2]
+                    metres = haversine_m(lng1, lat1, lng2, lat2) * STUB_DETOUR
+                    status, body = 200, {'routes': [{
+                        'summary': {'distance': round(metres, 1), 'duration': round(metres / (STUB_SPEED_KMH / 3.6), 1)},
+                        'geometry': encode_polyline([(lat1, lng1), (lat2, lng2)]),
+                        'way_points': [0, 1],
+                    }]}
+                except (ValueError, KeyError, TypeError):
+                    status, body = 400, {'error': {'message': 'Invalid request'}}
+                if latency_s:
+                    await asyncio.sleep(latency_s)
+                data = json.dumps(body).encode()
+                writer.write(f"HTTP/1.1 {status} {'OK' if status == 200 else 'Bad Request'}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    return handle
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_results(args, recorder: Recorder, pairs: int) -> dict:
+    total = len(recorder.latency_ms)
+    elapsed = (recorder.last - recorder.first) if total and recorder.last > recorder.first else 0.0
+    return {
+        'tool': 'load-test-routes',
+        'started': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': git_commit(),
+        'config': {
+            'url': args.url, 'mode': args.mode, 'pairs': pairs, 'skew': args.skew, 'seed': args.seed,
+            'concurrency': args.concurrency, 'rate': args.rate, 'duration': args.duration,
+            'warmup': args.warmup, 'requests': args.requests, 'timeout': args.timeout,
+        },
+        'requests': total,
+        'errors': recorder.errors,
+        'errorRate': round(recorder.errors / total, 4) if total else None,
+        'throughput': round(total / elapsed, 2) if elapsed else None,
+        'latencyMs': latency_summary(recorder.latency_ms),
+        'serviceMs': latency_summary(recorder.service_ms),
+        'statuses': dict(sorted(recorder.statuses.items())),
+        'errorCodes': dict(sorted(recorder.error_codes.items())),
+        'providers': dict(sorted(recorder.providers.items())),
+    }
+
+
+def print_results(results: dict, baseline: Optional[dict] = None):
+    print(f"\n📊 {results['requests']} requests, {results['throughput'] or 0:.1f} req/s, "
+          f"{results['errors']} errors ({(results['errorRate'] or 0):.2%})")
+    print(f"\n  {'':>10} " + ' '.join(f"{k:>9}" for k in results['latencyMs']))
+    for label in ('latencyMs', 'serviceMs'):
+        row = results[label]
+        print(f"  {label[:-2]:>10} " + ' '.join(f"{'-' if v is None else f'{v:.1f}':>9}" for v in row.values()))
+        if baseline and baseline.get(label):
+            deltas = []
+            for key, value in row.items():
+                before = baseline[label].get(key)
+                deltas.append('-' if value is None or not before else f"{(value - before) / before:+.0%}")
+            print(f"  {'vs base':>10} " + ' '.join(f"{d:>9}" for d in deltas))
+    print(f"\n  Statuses: {results['statuses']}")
+    if results['errorCodes']:
+        print(f"  Errors:   {results['errorCodes']}")
+    if results['providers']:
+        print(f"  Routed by: {results['providers']}")
+    if baseline:
+        print(f"\n  Baseline: {baseline.get('requests')} requests at {baseline.get('commit') or '?'}, "
+              f"error rate {baseline.get('errorRate')}")
+
+
+async def serve_stub(port: int, latency_ms: float):
+    server = await asyncio.start_server(make_stub_handler(latency_ms / 1000), '127.0.0.1', port)
+    print(f"🧪 ORS stub on http://127.0.0.1:{port}/v2/directions/driving-car ({latency_ms:.0f} ms per call)")
+    return server
+
+
+async def main_async(args, bodies, rng) -> Optional[Recorder]:
+    server = await serve_stub(args.stub_ors, args.stub_latency_ms) if args.stub_ors else None
+    try:
+        if args.stub_only:
+            print("   Ctrl+C to stop")
+            await asyncio.Event().wait()
+            return None
+        return await run_load(args, bodies, rng)
+    finally:
+        if server:
+            server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test POST /api/routes/calculate with gazetteer OD pairs')
+    parser.add_argument('--url', default=DEFAULT_URL)
+    parser.add_argument('--concurrency', type=int, default=10, help='requests in flight at most')
+    parser.add_argument('--rate', type=float, help='open-loop Poisson arrivals per second (default: closed loop)')
+    parser.add_argument('--duration', type=float, default=30, help='seconds measured after the warm-up')
+    parser.add_argument('--warmup', type=float, default=5, help='seconds sent but not measured')
+    parser.add_argument('--requests', type=int, help='stop after this many requests')
+    parser.add_argument('--timeout', type=float, default=15, help='seconds before a request counts as timed out')
+    parser.add_argument('--mode', choices=MODES, default='mixed', help='send pins, preset names, or both')
+    parser.add_argument('--pairs', type=int, default=500, help='distinct OD pairs to draw from')
+    parser.add_argument('--skew', type=float, default=1.0,
+                        help='Zipf exponent for pair popularity (0: uniform); repeats hit the server route cache')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--locations', default=LOCATIONS_PATH)
+    parser.add_argument('--output', help=f'results JSON (default: {os.path.relpath(RESULTS_DIR)}/routes-<time>.json)')
+    parser.add_argument('--compare', help='earlier results JSON to compare with')
+    parser.add_argument('--stub-ors', type=int, metavar='PORT', help='serve an OpenRouteService stub on this port')
+    parser.add_argument('--stub-latency-ms', type=float, default=150, help='stub response delay')
+    parser.add_argument('--stub-only', action='store_true', help='only serve the stub (start the dev server against it)')
+    args = parser.parse_args()
+
+    if args.stub_only and not args.stub_ors:
+        raise SystemExit("❌ --stub-only needs --stub-ors PORT")
+
+    print("=" * 60)
+    print("Basey Fare Check - ROUTE LOAD TEST")
+    print("=" * 60)
+
+    metrics = RunMetrics('load-test-routes')
+    rng = random.Random(args.seed)
+    bodies = []
+    if not args.stub_only:
+        with metrics.span('load'):
+            with open(args.locations, 'r', encoding='utf-8') as f:
+                bodies = sample_pairs(json.load(f), args.pairs, args.mode, rng)
+        shape = f"{args.rate:g} req/s open loop" if args.rate else "closed loop"
+        print(f"\n🎯 {args.url}")
+        print(f"   {len(bodies)} OD pairs ({args.mode}, skew {args.skew:g}), {args.concurrency} in flight, "
+              f"{shape}, {args.warmup:g}s warm-up + {args.duration:g}s")
+
+    try:
+        with metrics.span('load_test'):
+            recorder = asyncio.run(main_async(args, bodies, rng))
+    except KeyboardInterrupt:
+        print("\n🛑 Stopped")
+        return
+    if recorder is None:
+        return
+
+    results = build_results(args, recorder, len(bodies))
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"routes-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 {output}")
+    metrics.report()
+    if not results['requests']:
+        raise SystemExit("❌ No requests completed; is the server running?")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+PostgreSQL access for the Python location tools
+Connects with the same DATABASE_URL the Prisma app uses
+"""
+
+import os
+import uuid
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Prisma-only connection-string options that libpq rejects
+PRISMA_URL_PARAMS = {'schema', 'pgbouncer', 'connection_limit', 'pool_timeout', 'socket_timeout', 'statement_cache_size'}
+
+
+def database_url(explicit: Optional[str] = None) -> str:
+    """Resolve the connection string: explicit, DIRECT_DATABASE_URL, then DATABASE_URL"""
+    url = explicit or os.environ.get('DIRECT_DATABASE_URL') or os.environ.get('DATABASE_URL')
+    if not url:
+        raise SystemExit("❌ Please set DATABASE_URL (or pass --database-url)")
+
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k not in PRISMA_URL_PARAMS]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def connect(explicit_url: Optional[str] = None):
+    """Open a psycopg connection (psycopg is only needed by the DB tools)"""
+    try:
+        import psycopg  # type: ignore
+    except ImportError:
+        raise SystemExit('❌ psycopg is required: pip install "psycopg[binary]"')
+    return psycopg.connect(database_url(explicit_url))
+
+
+def new_id() -> str:
+    """Generate a cuid-shaped primary key for rows written outside Prisma"""
+    return 'c' + uuid.uuid4().hex[:24]
+
+
+def find_admin_user_id(conn) -> str:
+    """Return the first admin user's ID (locations require a createdBy)"""
+    with conn.cursor() as cur:
+        cur.execute('SELECT id FROM users WHERE "userType" = \'ADMIN\' ORDER BY "createdAt" LIMIT 1')
+        row = cur.fetchone()
+    if not row:
+        raise SystemExit("❌ No admin user found. Please create an admin user first.")
+    return row[0]
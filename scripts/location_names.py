@@ -0,0 +1,158 @@
+"""
+Location name normalisation and alias table for Basey location data
+Folds spelling, language and abbreviation variants to one canonical key
+"""
+
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, Iterable, Optional
+
+ALIASES_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'basey-location-aliases.json')
+
+# Multi-word phrases rewritten before tokenising (Waray/Tagalog/English)
+PHRASE_VARIANTS = {
+    'bahay pamahalaan': 'hall',
+    'balay pamahalaan': 'hall',
+    'town hall': 'municipal hall',
+    'city hall': 'municipal hall',
+    'sari sari store': 'store',
+    'sarisari store': 'store',
+}
+
+# Single-token abbreviations and language variants
+TOKEN_VARIANTS = {
+    'brgy': 'barangay',
+    'bgy': 'barangay',
+    'sto': 'santo',
+    'sta': 'santa',
+    'mt': 'mount',
+    'elem': 'elementary',
+    'sch': 'school',
+    'natl': 'national',
+    'mun': 'municipal',
+    'munisipyo': 'municipal hall',
+    'ctr': 'center',
+    'centre': 'center',
+    'nhs': 'national high school',
+    'ces': 'central elementary school',
+    'es': 'elementary school',
+    'campusanto': 'cemetery',
+    'kampusanto': 'cemetery',
+    'sementeryo': 'cemetery',
+    'simbahan': 'church',
+    'kapilya': 'chapel',
+    'eskwelahan': 'school',
+    'eskuylahan': 'school',
+    'tindahan': 'store',
+    'merkado': 'market',
+    'tiyanggihan': 'market',
+    'tulay': 'bridge',
+    'taytayan': 'bridge',
+    'busay': 'falls',
+    'waterfall': 'falls',
+    'waterfalls': 'falls',
+    'ii': '2',
+    'iii': '3',
+    'iv': '4',
+}
+
+# Expanded only as the first token: "St. Michael" is a saint, "Rizal St" a street.
+# Sorting tokens would otherwise merge the two.
+LEADING_VARIANTS = {
+    'st': 'saint',
+}
+
+# Connectives that carry no identity ("Campusanto han Basey")
+STOPWORDS = {'the', 'of', 'han', 'hin', 'ng', 'sa', 'nga'}
+
+_JOINERS = re.compile(r"[-'’`]")
+_SEPARATORS = re.compile(r'[^a-z0-9 ]+')
+_PHRASES = re.compile(
+    r'\b(' + '|'.join(re.escape(p) for p in sorted(PHRASE_VARIANTS, key=len, reverse=True)) + r')\b'
+)
+
+
+def fold_unicode(text: str) -> str:
+    """Fold compatibility forms and strip diacritics ("Ⅰ" -> "I", "ñ" -> "n")"""
+    text = unicodedata.normalize('NFKC', text)
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a location name to its comparison key
+
+    Unicode folding, abbreviation/variant expansion, a leading "Barangay"
+    prefix dropped, then tokens sorted so word order does not matter.
+    """
+    text = fold_unicode(name).lower()
+    text = _JOINERS.sub('', text)
+    text = _SEPARATORS.sub(' ', text)
+    text = ' '.join(text.split())
+    text = _PHRASES.sub(lambda m: PHRASE_VARIANTS[m.group(1)], text)
+
+    tokens = []
+    for i, token in enumerate(text.split()):
+        variant = LEADING_VARIANTS.get(token) if i == 0 else None
+        tokens.extend((variant or TOKEN_VARIANTS.get(token, token)).split())
+    tokens = [t for t in tokens if t not in STOPWORDS]
+
+    if len(tokens) > 1 and tokens[0] == 'barangay':
+        tokens = tokens[1:]
+
+    return ' '.join(sorted(tokens))
+
+
+def location_id(name: str) -> str:
+    """Canonical location ID derived from a name's normalized key"""
+    return normalize_name(name).replace(' ', '-')
+
+
+class AliasTable:
+    """Persisted variant -> canonical location ID map
+
+    The file stores human-readable pairs (variant name -> canonical name);
+    both sides are normalized on load so every lookup is one dict hit.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, str]] = None):
+        self.aliases: Dict[str, str] = {}
+        for variant, canonical in (aliases or {}).items():
+            self.add(variant, canonical)
+
+    @classmethod
+    def load(cls, filepath: str = ALIASES_PATH) -> 'AliasTable':
+        """Load the alias table, or an empty one if the file is missing"""
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls()
+        return cls(data.get('aliases', {}))
+
+    def add(self, variant: str, canonical: str):
+        """Map a variant name onto a canonical location name"""
+        canonical_key = self.canonical_id(canonical)
+        variant_key = normalize_name(variant)
+        if variant_key.replace(' ', '-') == canonical_key:
+            return
+        self.aliases[variant_key] = canonical_key
+
+    def canonical_id(self, name: str) -> str:
+        """Resolve a name to its canonical location ID"""
+        key = normalize_name(name)
+        return self.aliases.get(key) or key.replace(' ', '-')
+
+    def index(self, names: Iterable[str]) -> set:
+        """Canonical IDs of a set of location names"""
+        return {self.canonical_id(name) for name in names}
+
+    def index_locations(self, data: dict) -> set:
+        """Canonical IDs of every location in a basey-locations.json document"""
+        return self.index(
+            loc['name']
+            for locs in data.get('locations', {}).values()
+            for loc in locs
+        )
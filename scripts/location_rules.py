@@ -0,0 +1,180 @@
+"""
+Declarative cleaning rules for basey-locations.json
+A rules file lists rules applied in order. Each rule has selectors that
+narrow the entries it touches and one action:
+
+    {"action": "move",   "from": "sitio", "to": "landmark", "keywords": ["hall", "barangay"]}
+    {"action": "retype", "osm_tags": ["place=hamlet", "place=village"], "to": "sitio"}
+    {"action": "verify", "sources": ["osm"]}
+    {"action": "drop",   "outside": "barangays"}
+
+Selectors: from / types (current category), sources, keywords (substring
+of the lower-cased name), osm_tags ("key=value" or "key=*"), unverified,
+and outside ("basey", "service-area", "barangays" or a bbox dict).
+
+The gazetteer is flattened into columns once; every rule is a boolean mask
+over all entries and the categories are rebuilt once at the end, so a
+large import costs one pass per rule instead of list.remove per entry.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from barangay_boundaries import BASEY_BBOX, SERVICE_AREA_BBOX, BarangayIndex
+from barangay_raster import BarangayRaster
+
+ACTIONS = ('move', 'retype', 'verify', 'drop')
+NAMED_BOUNDS = {'basey': BASEY_BBOX, 'service-area': SERVICE_AREA_BBOX}
+SELECTORS = ('from', 'types', 'sources', 'keywords', 'osm_tags', 'unverified', 'outside')
+
+
+class RuleError(ValueError):
+    pass
+
+
+@dataclass
+class Change:
+    rule: str
+    action: str
+    name: str
+    before: str  # category before the rule
+    after: Optional[str]  # category after (None when dropped)
+
+
+def load_rules(path: str) -> List[dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        rules = json.load(f).get('rules', [])
+    for i, rule in enumerate(rules):
+        validate_rule(rule, i)
+    return rules
+
+
+def validate_rule(rule: dict, position: int = 0):
+    label = rule.get('name') or f"rule {position + 1}"
+    action = rule.get('action')
+    if action not in ACTIONS:
+        raise RuleError(f"{label}: action must be one of {', '.join(ACTIONS)}")
+    if action in ('move', 'retype') and not rule.get('to'):
+        raise RuleError(f"{label}: {action} needs a 'to' category")
+    if not any(key in rule for key in SELECTORS):
+        raise RuleError(f"{label}: needs at least one selector ({', '.join(SELECTORS)})")
+    outside = rule.get('outside')
+    if isinstance(outside, str) and outside not in NAMED_BOUNDS and outside != 'barangays':
+        raise RuleError(f"{label}: unknown bounds '{outside}'")
+
+
+class LocationTable:
+    """Column view of every gazetteer entry"""
+
+    def __init__(self, data: dict):
+        self.order = list(data.get('locations', {}))
+        self.entries = []
+        types = []
+        for loc_type, locs in data.get('locations', {}).items():
+            for loc in locs:
+                self.entries.append(loc)
+                types.append(loc_type)
+        n = len(self.entries)
+        self.types = np.array(types, dtype=object)
+        self.original_types = self.types.copy()
+        self.keep = np.ones(n, dtype=bool)
+        self.verified = np.array([bool(loc.get('verified')) for loc in self.entries], dtype=bool)
+        self.sources = np.array([loc.get('source') for loc in self.entries], dtype=object)
+        self.osm_tags = np.array([loc.get('osm_tag') or '' for loc in self.entries], dtype=object)
+        self.names = [loc['name'].lower() for loc in self.entries]
+        self.lats = np.array([loc['coordinates']['lat'] for loc in self.entries], dtype=float)
+        self.lngs = np.array([loc['coordinates']['lng'] for loc in self.entries], dtype=float)
+        self._in_barangay: Optional[np.ndarray] = None
+
+    def in_barangay(self) -> np.ndarray:
+        if self._in_barangay is None:
+            raster = BarangayRaster.load_or_build(BarangayIndex.load())
+            self._in_barangay = raster.find_positions(self.lats, self.lngs) > 0
+        return self._in_barangay
+
+    def select(self, rule: dict) -> np.ndarray:
+        mask = self.keep.copy()
+        types = rule.get('types') or ([rule['from']] if 'from' in rule else None)
+        if types:
+            mask &= np.isin(self.types, types)
+        if 'sources' in rule:
+            mask &= np.isin(self.sources, rule['sources'])
+        if rule.get('unverified'):
+            mask &= ~self.verified
+        if 'keywords' in rule:
+            keywords = [k.lower() for k in rule['keywords']]
+            mask &= np.array([any(k in name for k in keywords) for name in self.names], dtype=bool)
+        if 'osm_tags' in rule:
+            exact = {t for t in rule['osm_tags'] if not t.endswith('=*')}
+            keys = tuple(t[:-1] for t in rule['osm_tags'] if t.endswith('=*'))
+            mask &= np.array([tag in exact or (bool(keys) and tag.startswith(keys)) for tag in self.osm_tags],
+                             dtype=bool)
+        if 'outside' in rule:
+            mask &= ~self.inside(rule['outside'])
+        return mask
+
+    def inside(self, bounds) -> np.ndarray:
+        if bounds == 'barangays':
+            return self.in_barangay()
+        bbox = NAMED_BOUNDS[bounds] if isinstance(bounds, str) else bounds
+        return ((self.lats >= bbox['lat_min']) & (self.lats <= bbox['lat_max'])
+                & (self.lngs >= bbox['lng_min']) & (self.lngs <= bbox['lng_max']))
+
+    def to_locations(self) -> dict:
+        """Rebuild the category dict in one pass, keeping the original category order"""
+        locations = {loc_type: [] for loc_type in self.order}
+        for i in np.nonzero(self.keep)[0]:
+            loc = self.entries[i]
+            loc_type = self.types[i]
+            if loc_type != self.original_types[i] or self.verified[i] != bool(loc.get('verified')):
+                loc = dict(loc)
+                if loc_type != self.original_types[i]:
+                    loc['type'] = loc_type
+                loc['verified'] = bool(self.verified[i])
+            locations.setdefault(loc_type, []).append(loc)
+        return {loc_type: locs for loc_type, locs in locations.items() if locs}
+
+
+def apply_rules(data: dict, rules: List[dict]):
+    """Apply rules in order; returns (cleaned copy of data, [Change])"""
+    table = LocationTable(data)
+    changes: List[Change] = []
+
+    for position, rule in enumerate(rules):
+        validate_rule(rule, position)
+        label = rule.get('name') or f"rule {position + 1}"
+        action = rule['action']
+        mask = table.select(rule)
+        if action in ('move', 'retype'):
+            mask &= table.types != rule['to']
+        elif action == 'verify':
+            mask &= ~table.verified
+
+        for i in np.nonzero(mask)[0]:
+            after = None if action == 'drop' else (rule['to'] if action in ('move', 'retype') else table.types[i])
+            changes.append(Change(label, action, table.entries[i]['name'], table.types[i], after))
+
+        if action in ('move', 'retype'):
+            table.types[mask] = rule['to']
+        elif action == 'verify':
+            table.verified[mask] = True
+        else:
+            table.keep[mask] = False
+
+    cleaned = dict(data)
+    cleaned['locations'] = table.to_locations()
+    cleaned['metadata'] = dict(data.get('metadata', {}))
+    cleaned['metadata']['total_locations'] = sum(len(locs) for locs in cleaned['locations'].values())
+    return cleaned, changes
+
+
+def format_change(change: Change) -> str:
+    """One diff line: - dropped, ~ moved/retyped, ✓ verified"""
+    if change.action == 'drop':
+        return f"- [{change.before}] {change.name}  ({change.rule})"
+    if change.action == 'verify':
+        return f"✓ [{change.before}] {change.name}  ({change.rule})"
+    return f"~ [{change.before} -> {change.after}] {change.name}  ({change.rule})"
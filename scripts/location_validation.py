@@ -0,0 +1,133 @@
+"""
+Local location validation for Basey location data
+Python port of the boundary checks in src/utils/locationValidation.ts
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from barangay_boundaries import BarangayIndex
+
+# Extended bounds used by validateCoordinateRange in locationValidation.ts
+EXTENDED_BOUNDS = {'lat_min': 11.15, 'lat_max': 11.50, 'lng_min': 125.00, 'lng_max': 125.20}
+
+# Gazetteer type -> Prisma LocationType
+LOCATION_TYPES = {
+    'barangay': 'BARANGAY',
+    'sitio': 'SITIO',
+    'landmark': 'LANDMARK',
+    'poi': 'LANDMARK',
+}
+
+
+@dataclass
+class ValidationResult:
+    is_valid: bool
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    within_municipality: bool = False
+    within_barangay: bool = False
+    detected_barangay: Optional[str] = None
+    google_maps_valid: Optional[bool] = None
+    google_place_id: Optional[str] = None
+    google_address: Optional[str] = None
+    google_confidence: Optional[str] = None
+    coordinates: str = ''
+
+
+@dataclass
+class GeocodeCheck:
+    """Outcome of a reverse-geocode provider lookup (see googleMapsVerification.ts)"""
+    is_valid_location: bool
+    place_id: Optional[str] = None
+    formatted_address: Optional[str] = None
+    municipality: Optional[str] = None
+    confidence: str = 'low'
+    issues: List[str] = field(default_factory=list)
+    failed: bool = False  # the lookup itself errored (network, HTTP); not an answer to cache
+
+
+def _compact(name: str) -> str:
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+def validate_location(
+    name: str,
+    location_type: str,
+    lat: float,
+    lng: float,
+    index: BarangayIndex,
+    expected_barangay: Optional[str] = None,
+) -> ValidationResult:
+    """Run the local (non-Google) validation checks for one location"""
+    result = ValidationResult(is_valid=True, coordinates=f"{lat},{lng}")
+
+    if not name or not name.strip():
+        result.errors.append('Location name is required')
+
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        result.errors.append(f"Invalid coordinates ({lat}, {lng})")
+        result.is_valid = False
+        return result
+
+    b = EXTENDED_BOUNDS
+    if not (b['lat_min'] <= lat <= b['lat_max'] and b['lng_min'] <= lng <= b['lng_max']):
+        result.warnings.append(f"Coordinates ({lat}, {lng}) may be outside Basey municipality")
+
+    detected = index.find_name(lat, lng)
+    result.detected_barangay = detected
+    result.within_barangay = detected is not None
+    result.within_municipality = detected is not None
+
+    if detected is None:
+        if location_type in ('LANDMARK', 'SITIO'):
+            # Tourist spots and remote sitios can sit outside mapped polygons
+            result.warnings.append('Landmark coordinates are outside mapped barangay boundaries')
+            result.within_municipality = True
+        else:
+            result.warnings.append('Coordinates are not within mapped barangay boundaries')
+    elif expected_barangay and _compact(detected) != _compact(expected_barangay):
+        result.warnings.append(
+            f"Coordinates are in {detected}, but barangay is set to {expected_barangay}"
+        )
+
+    result.is_valid = not result.errors
+    return result
+
+
+def apply_geocode_check(result: ValidationResult, check: GeocodeCheck, location_type: str) -> ValidationResult:
+    """Fold a provider lookup into a local result (step 6 of validateLocation)"""
+    result.google_maps_valid = check.is_valid_location
+    result.google_place_id = check.place_id
+    result.google_address = check.formatted_address
+    result.google_confidence = check.confidence
+
+    if not check.is_valid_location:
+        result.errors.append('Google Maps could not verify this location')
+        result.errors.extend(check.issues)
+    else:
+        if check.municipality and 'basey' not in check.municipality.lower():
+            message = f'Google Maps shows this is in "{check.municipality}"'
+            if location_type in ('LANDMARK', 'SITIO'):
+                result.warnings.append(message)
+            else:
+                result.errors.append(message + ', not Basey')
+        if check.confidence == 'low':
+            result.warnings.append('Google Maps confidence is low for this location')
+
+    result.is_valid = not result.errors and result.within_municipality
+    return result
+
+
+def validation_status(result: ValidationResult, verified: bool = False) -> str:
+    """Map a result to LocationValidationStatus
+
+    Mirrors getLocationValidationStatus; without a Google check the
+    gazetteer's own `verified` flag stands in for googleMapsValid.
+    """
+    if result.errors:
+        return 'FAILED'
+    if result.is_valid and (result.google_maps_valid or (result.google_maps_valid is None and verified)):
+        return 'VALIDATED'
+    return 'NEEDS_REVIEW'
@@ -0,0 +1,146 @@
+"""
+Single-request OpenStreetMap extraction for Basey gazetteer candidates
+One Overpass query pulls every named amenity, place, tourism, leisure and
+shop node or way in the service-area bbox; a table-driven pass maps the
+tags onto our sitio/landmark types.
+
+    data = fetch_overpass(build_query())      # or load_response('fixture.json')
+    candidates = extract_candidates(data)
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from barangay_boundaries import SERVICE_AREA_BBOX
+
+OVERPASS_ENDPOINT = 'https://overpass-api.de/api/interpreter'
+USER_AGENT = 'BaseyFareGuide/1.0 (Location Data Collection)'
+DEFAULT_LOCALITY = 'Basey, Samar'  # appended to addresses without addr:city
+
+# Top-level keys whose named features become gazetteer candidates
+POI_KEYS = ['amenity', 'place', 'tourism', 'leisure', 'shop']
+
+# place=* values that are sitios (OSM often marks sitios as hamlets/villages);
+# anything larger is an administrative area, not a location
+PLACE_TYPES = {
+    'hamlet': 'sitio',
+    'village': 'sitio',
+    'neighbourhood': 'sitio',
+    'isolated_dwelling': 'sitio',
+    'locality': 'sitio',
+    'quarter': 'sitio',
+    'square': 'landmark',
+    'island': 'landmark',
+    'islet': 'landmark',
+}
+
+# Named street furniture that is not worth a gazetteer entry
+IGNORED_TAGS = {
+    ('amenity', 'bench'),
+    ('amenity', 'parking'),
+    ('amenity', 'parking_space'),
+    ('amenity', 'toilets'),
+    ('amenity', 'waste_basket'),
+    ('amenity', 'vending_machine'),
+    ('amenity', 'atm'),
+}
+
+SITIO_KEYWORDS = ('sitio', 'purok')
+
+
+def build_query(bbox: Optional[dict] = None, timeout: int = 120) -> str:
+    """Overpass QL for all named POI nodes/ways in the bbox, ways as centroids"""
+    b = bbox or SERVICE_AREA_BBOX
+    area = f"{b['lat_min']},{b['lng_min']},{b['lat_max']},{b['lng_max']}"
+    selectors = '\n'.join(
+        f'  {element}["name"]["{key}"]({area});'
+        for key in POI_KEYS
+        for element in ('node', 'way')
+    )
+    return f"[out:json][timeout:{timeout}];\n(\n{selectors}\n);\nout center tags;"
+
+
+def fetch_overpass(query: str, endpoint: str = OVERPASS_ENDPOINT, timeout: int = 180) -> dict:
+    """POST the query to Overpass and return the parsed JSON response"""
+    import requests  # type: ignore
+
+    response = requests.post(
+        endpoint,
+        data={'data': query},
+        headers={'User-Agent': USER_AGENT},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def load_response(path: str) -> dict:
+    """Read a saved Overpass response (e.g. a fixture) from disk"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def classify(tags: Dict[str, str]) -> Optional[str]:
+    """Map an element's tags to 'sitio', 'landmark' or None (skip)"""
+    name = tags.get('name', '').lower()
+    if any(keyword in name for keyword in SITIO_KEYWORDS):
+        return 'sitio'
+
+    place = tags.get('place')
+    if place:
+        return PLACE_TYPES.get(place)
+
+    for key in POI_KEYS:
+        value = tags.get(key)
+        if value is not None:
+            return None if (key, value) in IGNORED_TAGS else 'landmark'
+    return None
+
+
+def _coordinates(element: dict):
+    if element.get('type') == 'node':
+        return element.get('lat'), element.get('lon')
+    center = element.get('center') or {}
+    return center.get('lat'), center.get('lon')
+
+
+def _address(name: str, tags: Dict[str, str], locality: str = DEFAULT_LOCALITY) -> str:
+    parts = [name] + [tags[k] for k in ('addr:street', 'addr:village', 'addr:city') if tags.get(k)]
+    if not tags.get('addr:city'):
+        parts.append(locality)
+    return ', '.join(parts)
+
+
+def extract_candidates(data: dict, locality: str = DEFAULT_LOCALITY) -> List[dict]:
+    """Turn an Overpass response into gazetteer-shaped location dicts
+
+    Each candidate carries `osm_id` ("node/123") and the matched `osm_tag`
+    ("amenity=school") so a reviewer can trace it back to OSM.
+    """
+    candidates = []
+    for element in data.get('elements', []):
+        tags = element.get('tags') or {}
+        name = tags.get('name', '').strip()
+        if not name:
+            continue
+
+        loc_type = classify(tags)
+        if loc_type is None:
+            continue
+
+        lat, lng = _coordinates(element)
+        if lat is None or lng is None:
+            continue
+
+        tag_key = next((k for k in POI_KEYS if k in tags), None)
+        candidates.append({
+            'name': name,
+            'type': loc_type,
+            'coordinates': {'lat': float(lat), 'lng': float(lng)},
+            'source': 'osm',
+            'address': _address(name, tags, locality),
+            'verified': False,  # OSM data should be verified
+            'osm_id': f"{element.get('type')}/{element.get('id')}",
+            'osm_tag': f"{tag_key}={tags[tag_key]}" if tag_key else None,
+        })
+    return candidates
@@ -0,0 +1,110 @@
+"""
+Offline OpenStreetMap ingestion from a local .osm.pbf extract
+Streams a Geofabrik-style extract (Philippines, Samar, ...) once with
+pyosmium, keeping only objects that fall inside Basey: named POIs inside
+the barangay boundaries, and highway ways touching the service-area bbox.
+
+Node locations live in an osmium index rather than Python objects, and the
+default index is file-backed, so memory stays flat however large the
+extract is. Python only ever sees tagged POIs and highway ways.
+
+    elements, roads = read_pbf('philippines-latest.osm.pbf', BarangayIndex.load())
+    candidates = extract_candidates({'elements': elements})
+"""
+
+import os
+import tempfile
+from typing import List, Optional, Tuple
+
+from barangay_boundaries import SERVICE_AREA_BBOX, BarangayIndex, is_within_bbox
+from osm_extract import POI_KEYS
+
+# Same exclusions and rounding as scripts/fetch-roads.mjs
+EXCLUDED_HIGHWAYS = {'steps', 'elevator', 'construction', 'proposed', 'corridor', 'platform'}
+COORD_DP = 5
+
+
+def _import_osmium():
+    try:
+        import osmium  # type: ignore
+    except ImportError:
+        raise SystemExit("❌ pyosmium is not installed: pip install osmium")
+    return osmium
+
+
+def _tags(obj) -> dict:
+    return {tag.k: tag.v for tag in obj.tags}
+
+
+def _way_coordinates(way) -> List[Tuple[float, float]]:
+    """(lng, lat) of every node whose location the extract contains"""
+    return [(node.location.lon, node.location.lat) for node in way.nodes if node.location.valid()]
+
+
+def read_pbf(
+    path: str,
+    index: Optional[BarangayIndex],
+    bbox: Optional[dict] = None,
+    node_index: Optional[str] = None,
+    roads: bool = True,
+) -> Tuple[List[dict], List[dict]]:
+    """Stream a PBF extract into (Overpass-shaped POI elements, road features)
+
+    POI elements look like an Overpass `out center tags` response so
+    osm_extract.extract_candidates maps them exactly like the online path.
+    `node_index` is an osmium index spec; the default is a temporary
+    sparse_file_array, e.g. pass 'flex_mem' for a small extract.
+    With no `index`, POIs are kept by bbox alone.
+    """
+    osmium = _import_osmium()
+    bbox = bbox or SERVICE_AREA_BBOX
+    keys = POI_KEYS + (['highway'] if roads else [])
+
+    elements: List[dict] = []
+    features: List[dict] = []
+
+    with tempfile.TemporaryDirectory() as workdir:
+        storage = node_index or f"sparse_file_array,{os.path.join(workdir, 'nodes.idx')}"
+        processor = (
+            osmium.FileProcessor(path)
+            .with_locations(storage)
+            .with_filter(osmium.filter.KeyFilter(*keys))
+        )
+
+        for obj in processor:
+            if obj.is_node():
+                if 'name' not in obj.tags or not any(key in obj.tags for key in POI_KEYS):
+                    continue
+                if not obj.location.valid():
+                    continue
+                lat, lng = obj.location.lat, obj.location.lon
+                if is_within_bbox(lat, lng, bbox) and (index is None or index.find(lat, lng) is not None):
+                    elements.append({'type': 'node', 'id': obj.id, 'lat': lat, 'lon': lng, 'tags': _tags(obj)})
+
+            elif obj.is_way():
+                tags = _tags(obj)
+                highway = tags.get('highway')
+                if roads and highway and highway not in EXCLUDED_HIGHWAYS:
+                    coords = _way_coordinates(obj)
+                    if len(coords) >= 2 and any(is_within_bbox(lat, lng, bbox) for lng, lat in coords):
+                        features.append({
+                            'type': 'Feature',
+                            'properties': {'highway': highway, 'oneway': tags.get('oneway')},
+                            'geometry': {
+                                'type': 'LineString',
+                                'coordinates': [[round(lng, COORD_DP), round(lat, COORD_DP)] for lng, lat in coords],
+                            },
+                        })
+
+                if 'name' in tags and any(key in tags for key in POI_KEYS):
+                    coords = _way_coordinates(obj)
+                    if not coords:
+                        continue
+                    lng = sum(c[0] for c in coords) / len(coords)
+                    lat = sum(c[1] for c in coords) / len(coords)
+                    if is_within_bbox(lat, lng, bbox) and (index is None or index.find(lat, lng) is not None):
+                        elements.append({
+                            'type': 'way', 'id': obj.id, 'center': {'lat': lat, 'lon': lng}, 'tags': tags,
+                        })
+
+    return elements, features
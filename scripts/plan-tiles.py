@@ -0,0 +1,235 @@
+"""
+Offline tile planner for Basey Fare Check
+fetch-tiles.mjs used to pull every tile in the service-area bbox at every
+zoom. Most of those are open sea and forest nobody zooms into, and each
+zoom level has four times the tiles of the last. This script plans the
+tiles riders actually see instead:
+
+- up to --full-zoom the whole service-area bbox (overview zooms are cheap)
+- above it only tiles within --road-buffer-m of a road in
+  public/data/basey-roads.geojson or --point-buffer-m of a gazetteer place
+
+Roads are rasterised per zoom by sampling each segment at no more than half
+a tile (or the buffer width) and padding every sample by the buffer, a box,
+so the set is a slight superset of the true buffer. Tiles are clipped to
+the service-area tile range, so nothing is planned that the old fetcher
+would not have fetched. The plan lists each tile once, with per-zoom
+counts, the reduction against the full bbox and a size estimate;
+`node scripts/fetch-tiles.mjs --plan` downloads exactly that list.
+
+Usage:
+    python scripts/plan-tiles.py                                  # zoom 11..15, full bbox to 13
+    python scripts/plan-tiles.py --max-zoom 17 --road-buffer-m 150 --avg-tile-kb 15
+"""
+
+import argparse
+import json
+import math
+import os
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Set, Tuple
+
+from barangay_boundaries import SERVICE_AREA_BBOX
+from road_graph import ROADS_PATH
+from run_metrics import RunMetrics
+from spatial_index import METRES_PER_DEGREE
+
+LOCATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'basey-locations.json')
+TILES_DIR = os.path.join(os.path.dirname(__file__), '..', 'public', 'tiles')
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), '..', '.builds', 'tile-plan.json')
+
+DEFAULT_MIN_ZOOM = 11  # fetch-tiles.mjs defaults
+DEFAULT_MAX_ZOOM = 15
+DEFAULT_FULL_ZOOM = 13
+DEFAULT_ROAD_BUFFER_M = 250
+DEFAULT_POINT_BUFFER_M = 500
+DEFAULT_TILE_KB = 12  # typical rendered OSM land tile; sea tiles are far smaller
+THROTTLE_MS = 120  # fetch-tiles.mjs
+
+Tile = Tuple[int, int]  # (x, y) at one zoom
+
+
+def lon2tile(lng: float, z: int) -> int:
+    """Tile column (lon2tile in fetch-tiles.mjs)"""
+    return math.floor((lng + 180) / 360 * 2 ** z)
+
+
+def lat2tile(lat: float, z: int) -> int:
+    """Tile row, north at the top (lat2tile in fetch-tiles.mjs)"""
+    r = math.radians(lat)
+    return math.floor((1 - math.log(math.tan(r) + 1 / math.cos(r)) / math.pi) / 2 * 2 ** z)
+
+
+class ZoomCover:
+    """Tiles at one zoom covering padded points, clipped to a bbox's tile range"""
+
+    def __init__(self, z: int, bbox: dict):
+        self.z = z
+        self.x_min, self.x_max = lon2tile(bbox['lng_min'], z), lon2tile(bbox['lng_max'], z)
+        self.y_min, self.y_max = lat2tile(bbox['lat_max'], z), lat2tile(bbox['lat_min'], z)
+        self.tiles: Set[Tile] = set()
+        # Tile size in degrees; rows shrink towards the poles, so size the
+        # sampling step at the bbox's northern edge
+        self.tile_lng = 360 / 2 ** z
+        self.tile_lat = self.tile_lng * math.cos(math.radians(max(abs(bbox['lat_min']), abs(bbox['lat_max']))))
+
+    @property
+    def bbox_tiles(self) -> int:
+        return (self.x_max - self.x_min + 1) * (self.y_max - self.y_min + 1)
+
+    def add_full(self):
+        self.tiles.update(
+            (x, y) for x in range(self.x_min, self.x_max + 1) for y in range(self.y_min, self.y_max + 1)
+        )
+
+    def add_box(self, lat: float, lng: float, dlat: float, dlng: float):
+        x0 = max(lon2tile(lng - dlng, self.z), self.x_min)
+        x1 = min(lon2tile(lng + dlng, self.z), self.x_max)
+        y0 = max(lat2tile(lat + dlat, self.z), self.y_min)
+        y1 = min(lat2tile(lat - dlat, self.z), self.y_max)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                self.tiles.add((x, y))
+
+    def add_point(self, lat: float, lng: float, buffer_m: float):
+        dlat = buffer_m / METRES_PER_DEGREE
+        self.add_box(lat, lng, dlat, dlat / math.cos(math.radians(lat)))
+
+    def add_segment(self, a, b, buffer_m: float):
+        """(lng, lat) endpoints, sampled at half a tile (or the buffer) and padded to cover the gaps"""
+        step = min(self.tile_lng / 2, self.tile_lat / 2, buffer_m / METRES_PER_DEGREE)
+        n = max(1, math.ceil(max(abs(b[0] - a[0]), abs(b[1] - a[1])) / step))
+        dlat = buffer_m / METRES_PER_DEGREE + step / 2
+        dlng = buffer_m / (METRES_PER_DEGREE * math.cos(math.radians(a[1]))) + step / 2
+        for i in range(n + 1):
+            t = i / n
+            self.add_box(a[1] + (b[1] - a[1]) * t, a[0] + (b[0] - a[0]) * t, dlat, dlng)
+
+
+def road_segments(path: str) -> Iterable[tuple]:
+    with open(path, 'r', encoding='utf-8') as f:
+        network = json.load(f)
+    for feature in network.get('features', []):
+        geom = feature.get('geometry') or {}
+        if geom.get('type') == 'LineString':
+            lines = [geom['coordinates']]
+        elif geom.get('type') == 'MultiLineString':
+            lines = geom['coordinates']
+        else:
+            continue
+        for line in lines:
+            yield from zip(line, line[1:])
+
+
+def gazetteer_points(path: str) -> Iterable[Tuple[float, float]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    for locs in data.get('locations', {}).values():
+        for loc in locs:
+            yield loc['coordinates']['lat'], loc['coordinates']['lng']
+
+
+def plan_tiles(min_zoom: int, max_zoom: int, full_zoom: int, segments: list, points: list,
+               road_buffer_m: float, point_buffer_m: float, bbox: dict, metrics: RunMetrics) -> Dict[int, ZoomCover]:
+    covers = {}
+    for z in range(min_zoom, max_zoom + 1):
+        cover = ZoomCover(z, bbox)
+        with metrics.span(f'zoom {z}'):
+            if z <= full_zoom:
+                cover.add_full()
+            else:
+                for a, b in segments:
+                    cover.add_segment(a, b, road_buffer_m)
+                for lat, lng in points:
+                    cover.add_point(lat, lng, point_buffer_m)
+        covers[z] = cover
+        metrics.count('tiles', len(cover.tiles))
+    return covers
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Plan the offline map tiles around roads and places')
+    parser.add_argument('--min-zoom', type=int, default=DEFAULT_MIN_ZOOM)
+    parser.add_argument('--max-zoom', type=int, default=DEFAULT_MAX_ZOOM)
+    parser.add_argument('--full-zoom', type=int, default=DEFAULT_FULL_ZOOM,
+                        help='highest zoom fetched for the whole service-area bbox')
+    parser.add_argument('--road-buffer-m', type=float, default=DEFAULT_ROAD_BUFFER_M)
+    parser.add_argument('--point-buffer-m', type=float, default=DEFAULT_POINT_BUFFER_M)
+    parser.add_argument('--avg-tile-kb', type=float, default=DEFAULT_TILE_KB, help='for the size estimate')
+    parser.add_argument('--roads', default=ROADS_PATH)
+    parser.add_argument('--locations', default=LOCATIONS_PATH, help='gazetteer places to cover')
+    parser.add_argument('--tiles-dir', default=TILES_DIR, help='tiles already on disk are not re-fetched')
+    parser.add_argument('--output', default=OUTPUT_PATH, help='plan for fetch-tiles.mjs --plan')
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='dump a profile of the run')
+    args = parser.parse_args()
+
+    if args.min_zoom > args.max_zoom:
+        raise SystemExit(f"❌ --min-zoom {args.min_zoom} is above --max-zoom {args.max_zoom}")
+
+    metrics = RunMetrics('plan-tiles', profile=args.profile)
+
+    print("=" * 60)
+    print("Basey Fare Check - Offline Tile Plan")
+    print("=" * 60)
+
+    with metrics.span('load'):
+        segments = list(road_segments(args.roads))
+        points = list(gazetteer_points(args.locations)) if os.path.exists(args.locations) else []
+    print(f"📦 {len(segments)} road segments, {len(points)} gazetteer places")
+    if not points:
+        print(f"⚠️  No gazetteer at {args.locations}; planning around roads only")
+
+    covers = plan_tiles(args.min_zoom, args.max_zoom, args.full_zoom, segments, points,
+                        args.road_buffer_m, args.point_buffer_m, SERVICE_AREA_BBOX, metrics)
+
+    tile_bytes = args.avg_tile_kb * 1024
+    zooms, tiles = [], []
+    print(f"\n{'zoom':>4}  {'bbox':>9}  {'planned':>9}  {'reduction':>9}  {'on disk':>8}  {'est. size':>10}")
+    for z, cover in covers.items():
+        rels = [f'{z}/{x}/{y}' for x, y in sorted(cover.tiles)]
+        cached = sum(os.path.exists(os.path.join(args.tiles_dir, f'{rel}.png')) for rel in rels)
+        reduction = 1 - len(rels) / cover.bbox_tiles
+        zooms.append({
+            'z': z,
+            'mode': 'bbox' if z <= args.full_zoom else 'corridor',
+            'bboxTiles': cover.bbox_tiles,
+            'tiles': len(rels),
+            'reduction': round(reduction, 4),
+            'cached': cached,
+            'estimatedBytes': round(len(rels) * tile_bytes),
+        })
+        tiles.extend(rels)
+        print(f"{z:>4}  {cover.bbox_tiles:>9,}  {len(rels):>9,}  {reduction:>9.1%}  {cached:>8,}  "
+              f"{len(rels) * tile_bytes / 1024 ** 2:>7.1f} MB")
+
+    bbox_total = sum(zoom['bboxTiles'] for zoom in zooms)
+    to_fetch = len(tiles) - sum(zoom['cached'] for zoom in zooms)
+    plan = {
+        'version': 1,
+        'generated': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'bbox': SERVICE_AREA_BBOX,
+        'minZoom': args.min_zoom,
+        'maxZoom': args.max_zoom,
+        'fullZoom': args.full_zoom,
+        'roadBufferM': args.road_buffer_m,
+        'pointBufferM': args.point_buffer_m,
+        'avgTileBytes': round(tile_bytes),
+        'bboxTiles': bbox_total,
+        'estimatedBytes': round(len(tiles) * tile_bytes),
+        'zooms': zooms,
+        'tiles': tiles,
+    }
+    with metrics.span('write'):
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, separators=(',', ':'))
+
+    print(f"\n🎯 {len(tiles):,} tiles instead of {bbox_total:,} ({1 - len(tiles) / bbox_total:.1%} fewer), "
+          f"~{len(tiles) * tile_bytes / 1024 ** 2:.0f} MB at {args.avg_tile_kb:g} KB/tile")
+    print(f"⏱️  {to_fetch:,} not on disk yet, ~{to_fetch * THROTTLE_MS / 60000:.0f} min at the fetcher's throttle")
+    print(f"💾 {args.output}")
+    metrics.report()
+
+
+if __name__ == '__main__':
+    main()
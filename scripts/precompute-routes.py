@@ -0,0 +1,262 @@
+"""
+Demand-driven route precomputation for Basey Fare Check
+Ranks origin/destination pairs from fare_calculations by how often and how
+recently they were travelled, routes the top N over the local road graph
+and writes a warm route cache the client can load before its first request.
+
+Trips are grouped per (fromLocation, toLocation) in the database and the
+groups stream back through a server-side cursor, so memory holds one row
+per distinct label pair, not per trip. Each trip adds 0.5 ** (age / half
+life) to its pair's score: a pair travelled 10 times last week outranks one
+travelled 20 times last year. Labels are gazetteer names (or aliases) and
+pinned coordinates ("pin:lat,lng" or "lat, lng"); labels that resolve to
+the same point pair are merged.
+
+Routes match the client's offline router (src/lib/routing/offlineGraph.ts):
+vertex snapping within 200 m, path length over the graph, 30 km/h duration
+and a precision-5 encoded polyline. Entries are keyed like routePairKey in
+src/lib/offline/routeCache.ts. The hierarchy in public/data/basey-roads.ch.json
+(build-road-hierarchy.py) is used when present, otherwise built in memory.
+
+Usage:
+    python scripts/precompute-routes.py                        # top 500 pairs
+    python scripts/precompute-routes.py --top 2000 --half-life-days 14 --since 2025-01-01
+"""
+
+import argparse
+import json
+import os
+import re
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from contraction_hierarchy import ContractionHierarchy, build_hierarchy
+from location_db import connect
+from location_names import AliasTable
+from road_graph import MAX_SNAP_M, ROADS_PATH, RoadGraph, encode_polyline
+from run_metrics import RunMetrics
+
+LOCATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'basey-locations.json')
+HIERARCHY_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'basey-roads.ch.json')
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'warm-routes.json')
+
+DEFAULT_TOP = 500
+DEFAULT_HALF_LIFE_DAYS = 30
+DEFAULT_BATCH_SIZE = 10_000
+KEY_DP = 4  # routePairKey precision (~11 m)
+AVG_SPEED_KMH = 30  # src/lib/routing/offlineGraph.ts
+DISTANCE_DRIFT = 0.15  # report pairs whose recorded distance differs from the graph route by more
+
+# One row per label pair; the decayed score is summed in the database
+PAIRS_SQL = """
+SELECT "fromLocation", "toLocation", COUNT(*),
+       SUM(POWER(0.5, GREATEST(EXTRACT(EPOCH FROM (%(now)s - "createdAt")), 0) / %(half_life)s))::float8,
+       EXTRACT(EPOCH FROM MAX("createdAt"))::float8,
+       (PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY distance))::float8
+FROM fare_calculations
+WHERE "createdAt" >= %(since)s
+GROUP BY "fromLocation", "toLocation"
+"""
+
+PIN_PATTERN = re.compile(r'^(?:pin:)?\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$')
+
+
+class LabelResolver:
+    """fromLocation/toLocation label -> (lat, lng), memoised per distinct label"""
+
+    def __init__(self, gazetteer: dict, aliases: AliasTable):
+        self.aliases = aliases
+        self.points: Dict[str, Tuple[float, float]] = {}
+        for locs in gazetteer.get('locations', {}).values():
+            for loc in locs:
+                point = (loc['coordinates']['lat'], loc['coordinates']['lng'])
+                self.points.setdefault(aliases.canonical_id(loc['name']), point)
+        self._memo: Dict[str, Optional[Tuple[float, float]]] = {}
+
+    def resolve(self, label: str) -> Optional[Tuple[float, float]]:
+        if label not in self._memo:
+            match = PIN_PATTERN.match(label)
+            if match:
+                self._memo[label] = (float(match.group(1)), float(match.group(2)))
+            else:
+                self._memo[label] = self.points.get(self.aliases.canonical_id(label))
+        return self._memo[label]
+
+
+def route_pair_key(origin: Tuple[float, float], destination: Tuple[float, float]) -> str:
+    """routePairKey in src/lib/offline/routeCache.ts"""
+    return f"{origin[0]:.{KEY_DP}f},{origin[1]:.{KEY_DP}f}->{destination[0]:.{KEY_DP}f},{destination[1]:.{KEY_DP}f}"
+
+
+def add_demand(demand: Dict[str, dict], rows, resolver: LabelResolver, metrics: RunMetrics):
+    """Fold grouped label rows into {route key: demand}, merging labels at the same point pair"""
+    for from_label, to_label, trips, score, last_seen, distance in rows:
+        metrics.count('label_pairs')
+        metrics.count('trips', trips)
+        origin, destination = resolver.resolve(from_label), resolver.resolve(to_label)
+        if origin is None or destination is None:
+            metrics.count('unresolved_trips', trips)
+            continue
+        key = route_pair_key(origin, destination)
+        entry = demand.get(key)
+        if entry is None:
+            demand[key] = entry = {
+                'key': key, 'origin': origin, 'destination': destination,
+                'trips': 0, 'score': 0.0, 'lastSeen': 0.0, 'labelTrips': 0,
+            }
+        entry['trips'] += trips
+        entry['score'] += score
+        entry['lastSeen'] = max(entry['lastSeen'], last_seen)
+        # The most travelled label pair names the entry and supplies the recorded distance
+        if trips > entry['labelTrips']:
+            entry.update({'from': from_label, 'to': to_label, 'recordedKm': distance, 'labelTrips': trips})
+
+
+def compute_routes(ranked: list, limit: int, graph: RoadGraph, hierarchy: ContractionHierarchy,
+                   metrics: RunMetrics):
+    """Route ranked pairs until `limit` routes exist; off-network pairs don't take a slot
+
+    The graph is undirected, so A->B and B->A share one hierarchy query.
+    """
+    paths: Dict[Tuple[int, int], Tuple[float, list]] = {}
+    routes = []
+    for entry in ranked:
+        if len(routes) >= limit:
+            break
+        if all(abs(a - b) < 10 ** -KEY_DP for a, b in zip(entry['origin'], entry['destination'])):
+            metrics.count('same_point')  # the API answers these without routing
+            continue
+        source = graph.nearest_node(*entry['origin'], max_distance_m=MAX_SNAP_M)
+        target = graph.nearest_node(*entry['destination'], max_distance_m=MAX_SNAP_M)
+        if source is None or target is None:
+            metrics.count('off_network')
+            continue
+        pair = (min(source, target), max(source, target))
+        if pair not in paths:
+            with metrics.span('route'):
+                paths[pair] = hierarchy.query(*pair)[::2]
+            metrics.count('queries')
+        length, path = paths[pair]
+        if not path:
+            metrics.count('unreachable')
+            continue
+        if path[0] != source:
+            path = path[::-1]
+        coords = [(graph.coords[n][1], graph.coords[n][0]) for n in path]
+        distance_km = length / 1000
+        routes.append({
+            'key': entry['key'],
+            'from': entry['from'],
+            'to': entry['to'],
+            'distanceKm': round(distance_km, 3),
+            'durationMin': round(distance_km / AVG_SPEED_KMH * 60, 1),
+            'polyline': encode_polyline(coords) if len(coords) > 1 else None,
+            'trips': entry['trips'],
+            'score': round(entry['score'], 3),
+            'lastSeen': datetime.fromtimestamp(entry['lastSeen'], tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'recordedKm': None if entry['recordedKm'] is None else round(entry['recordedKm'], 3),
+        })
+    return routes
+
+
+def load_hierarchy(graph: RoadGraph, path: str, metrics: RunMetrics) -> ContractionHierarchy:
+    if os.path.exists(path):
+        with metrics.span('load'):
+            hierarchy = ContractionHierarchy.load(path)
+        if len(hierarchy.coords) == graph.node_count:
+            print(f"📦 Loaded {path}")
+            return hierarchy
+        print(f"⚠️  {path} is for a different road network; contracting in memory")
+    with metrics.span('contract'):
+        return build_hierarchy(graph)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute routes for the most travelled OD pairs')
+    parser.add_argument('--database-url', help='defaults to DIRECT_DATABASE_URL / DATABASE_URL')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help='OD pairs to precompute')
+    parser.add_argument('--half-life-days', type=float, default=DEFAULT_HALF_LIFE_DAYS,
+                        help='a trip this old counts half as much as one today')
+    parser.add_argument('--since', type=datetime.fromisoformat, default=datetime(1970, 1, 1),
+                        help='only trips on/after this date (YYYY-MM-DD)')
+    parser.add_argument('--min-trips', type=int, default=1, help='skip pairs travelled fewer times')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='rows per cursor fetch')
+    parser.add_argument('--roads', default=ROADS_PATH)
+    parser.add_argument('--hierarchy', default=HIERARCHY_PATH, help='contraction hierarchy (built if missing)')
+    parser.add_argument('--locations', default=LOCATIONS_PATH, help='gazetteer for named labels')
+    parser.add_argument('--output', default=OUTPUT_PATH, help='warm route cache to write')
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='dump a profile of the run')
+    args = parser.parse_args()
+
+    metrics = RunMetrics('precompute-routes', profile=args.profile)
+
+    print("=" * 60)
+    print("Basey Fare Check - ROUTE PRECOMPUTATION")
+    print("=" * 60)
+
+    with metrics.span('load'):
+        with open(args.locations, 'r', encoding='utf-8') as f:
+            resolver = LabelResolver(json.load(f), AliasTable.load())
+
+    now = datetime.now(timezone.utc)
+    params = {'now': now, 'half_life': args.half_life_days * 86400, 'since': args.since}
+    demand: Dict[str, dict] = {}
+    with connect(args.database_url) as conn, conn.cursor(name='precompute_routes') as cur:
+        cur.itersize = args.batch_size
+        with metrics.span('fetch'):
+            cur.execute(PAIRS_SQL, params)
+        while True:
+            with metrics.span('fetch'):
+                rows = cur.fetchmany(args.batch_size)
+            if not rows:
+                break
+            with metrics.span('rank'):
+                add_demand(demand, rows, resolver, metrics)
+
+    trips = metrics.counters.get('trips', 0)
+    unresolved = metrics.counters.get('unresolved_trips', 0)
+    print(f"\n📋 {trips} trips over {metrics.counters.get('label_pairs', 0)} label pairs; "
+          f"{len(demand)} distinct point pairs ({unresolved} trips with unknown labels)")
+
+    ranked = sorted((e for e in demand.values() if e['trips'] >= args.min_trips),
+                    key=lambda e: (-e['score'], -e['trips'], -e['lastSeen'], e['key']))
+
+    with metrics.span('load'):
+        graph = RoadGraph.load(args.roads)
+    hierarchy = load_hierarchy(graph, args.hierarchy, metrics)
+    routes = compute_routes(ranked, args.top, graph, hierarchy, metrics)
+
+    covered = sum(route['trips'] for route in routes)
+    drift = [r for r in routes if r['recordedKm'] and abs(r['distanceKm'] - r['recordedKm']) > DISTANCE_DRIFT * r['recordedKm']]
+    artifact = {
+        'version': 1,
+        'generated': now.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'keyPrecision': KEY_DP,
+        'halfLifeDays': args.half_life_days,
+        'since': args.since.strftime('%Y-%m-%d'),
+        'trips': trips,
+        'coveredTrips': covered,
+        'routes': routes,
+    }
+    with metrics.span('write'):
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(artifact, f, separators=(',', ':'), ensure_ascii=False)
+
+    print(f"\n🛣️  {len(routes)} routes from {metrics.counters.get('queries', 0)} hierarchy queries "
+          f"(skipped {metrics.counters.get('off_network', 0)} off the network, "
+          f"{metrics.counters.get('unreachable', 0)} unreachable, "
+          f"{metrics.counters.get('same_point', 0)} same-point)")
+    if trips:
+        print(f"🎯 Covers {covered} of {trips} recorded trips ({covered / trips:.1%})")
+    if drift:
+        print(f"⚠️  {len(drift)} routes differ from their recorded distance by more than {DISTANCE_DRIFT:.0%}")
+    for route in routes[:10]:
+        print(f"  {route['trips']:>6} trips  {route['distanceKm']:>7.2f} km  {route['from']} -> {route['to']}")
+    print(f"\n💾 {os.path.getsize(args.output) / 1024:.0f} KB -> {args.output}")
+    metrics.count('routes', len(routes))
+    metrics.report()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+"""
+Adaptive scheduling for the collectors' search queries
+Every run records, per provider and query, how many results were new,
+duplicate or out of bounds and how long the round-trip took (including
+the rate-limit sleep). The next run orders queries by expected new results
+per second, skips queries that keep returning nothing with exponential
+backoff, and stops when the run's time or query budget is spent.
+
+    scheduler = QueryScheduler.load('google-places', queries, budget_seconds=60)
+    for query in scheduler:
+        ...fetch, classify each result...
+        scheduler.record(query, new=2, duplicate=5, out_of_bounds=1)
+    scheduler.save()
+
+Backed-off queries come back after 1, 3, 7, ... runs (capped), so a query
+that starts yielding again is found; --all-queries ignores the schedule.
+A --dry-run scheduler is read-only: it plans from the history but save()
+leaves the file, run count and backoff state as they were.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional
+
+HISTORY_PATH = os.path.join(os.path.dirname(__file__), '..', '.collectors', 'query-history.json')
+
+DECAY = 0.7          # weight of older runs in the running yield averages
+MAX_BACKOFF_RUNS = 31
+PRIOR_NEW = 0.5      # optimistic prior so rarely-run queries still rank
+PRIOR_SECONDS = 1.0
+LOCK_TIMEOUT = 30.0  # seconds; a lock older than this is from a crashed run
+
+
+@contextmanager
+def _locked(lock_path: str, timeout: float = LOCK_TIMEOUT):
+    """Exclusive lock via O_EXCL file creation (works on every platform)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                stale = time.time() - os.path.getmtime(lock_path) > timeout
+            except FileNotFoundError:
+                continue
+            if stale or time.monotonic() > deadline:
+                try:
+                    os.remove(lock_path)
+                except FileNotFoundError:
+                    pass
+                continue
+            time.sleep(0.05)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except FileNotFoundError:
+            pass
+
+
+@dataclass
+class QueryStats:
+    runs: int = 0
+    new: float = 0.0        # decayed sums
+    duplicate: float = 0.0
+    out_of_bounds: float = 0.0
+    seconds: float = 0.0
+    total_new: int = 0      # lifetime count
+    dead_streak: int = 0    # consecutive runs with no new results
+    next_run: int = 0       # first scheduler run this query is eligible again
+    last_run_at: Optional[str] = None
+
+    def expected_yield(self) -> float:
+        """Expected new results per second"""
+        return (self.new + PRIOR_NEW) / (self.seconds + PRIOR_SECONDS)
+
+    def mean_seconds(self) -> float:
+        weight = sum(DECAY ** k for k in range(self.runs)) or 1
+        return self.seconds / weight if self.runs else 0.0
+
+
+class QueryScheduler:
+    def __init__(self, provider: str, queries: List[str], history: dict, path: str = HISTORY_PATH,
+                 budget_seconds: Optional[float] = None, max_queries: Optional[int] = None,
+                 run_all: bool = False, started: Optional[float] = None, read_only: bool = False):
+        self.provider = provider
+        self.queries = list(dict.fromkeys(queries))
+        self.history = history
+        self.path = path
+        self.budget_seconds = budget_seconds
+        self.max_queries = max_queries
+        self.run_all = run_all
+        self.read_only = read_only
+
+        providers = history.setdefault('providers', {})
+        entry = providers.setdefault(provider, {'runs': 0, 'queries': {}})
+        self.run_number = entry['runs'] + 1
+        self.stats: Dict[str, QueryStats] = {
+            q: QueryStats(**entry['queries'][q]) if q in entry['queries'] else QueryStats()
+            for q in self.queries
+        }
+        self.executed: List[str] = []
+        self.skipped_backoff: List[str] = []
+        self.skipped_budget: List[str] = []
+        self._started_at: Dict[str, float] = {}
+        # Pass the same perf_counter start to several schedulers to share one budget
+        self._run_started = started if started is not None else time.perf_counter()
+
+    @classmethod
+    def load(cls, provider: str, queries: List[str], path: str = HISTORY_PATH, **options) -> 'QueryScheduler':
+        history = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+        return cls(provider, queries, history, path, **options)
+
+    def plan(self) -> List[str]:
+        """Eligible queries, best expected yield first (unseen queries lead)"""
+        eligible, self.skipped_backoff = [], []
+        for query in self.queries:
+            stats = self.stats[query]
+            if not self.run_all and stats.next_run > self.run_number:
+                self.skipped_backoff.append(query)
+            else:
+                eligible.append(query)
+        return sorted(eligible, key=lambda q: (self.stats[q].runs > 0, -self.stats[q].expected_yield()))
+
+    def __iter__(self) -> Iterator[str]:
+        for query in self.plan():
+            elapsed = time.perf_counter() - self._run_started
+            expected = self.stats[query].mean_seconds()
+            over_time = self.budget_seconds is not None and elapsed + expected > self.budget_seconds
+            over_quota = self.max_queries is not None and len(self.executed) >= self.max_queries
+            if over_time or over_quota:
+                self.skipped_budget.append(query)
+                continue
+            self._started_at[query] = time.perf_counter()
+            self.executed.append(query)
+            yield query
+
+    def record(self, query: str, new: int = 0, duplicate: int = 0, out_of_bounds: int = 0,
+               seconds: Optional[float] = None, failed: bool = False):
+        """Fold one round-trip into the query's history (seconds default: since it was yielded)"""
+        if seconds is None:
+            seconds = time.perf_counter() - self._started_at.get(query, time.perf_counter())
+        stats = self.stats.setdefault(query, QueryStats())
+        if failed:
+            return  # errors say nothing about the query's yield
+        stats.runs += 1
+        stats.new = stats.new * DECAY + new
+        stats.duplicate = stats.duplicate * DECAY + duplicate
+        stats.out_of_bounds = stats.out_of_bounds * DECAY + out_of_bounds
+        stats.seconds = stats.seconds * DECAY + seconds
+        stats.total_new += new
+        stats.last_run_at = time.strftime('%Y-%m-%d %H:%M:%S')
+        if new:
+            stats.dead_streak = 0
+            stats.next_run = 0
+        else:
+            stats.dead_streak += 1
+            stats.next_run = self.run_number + 1 + min(MAX_BACKOFF_RUNS, 2 ** stats.dead_streak - 1)
+
+    def save(self):
+        """Write this provider's history, re-reading the file so other providers' updates survive
+
+        The read-modify-write holds a lock file, so parallel LGU builds
+        (basey-locations.py build --jobs N) don't drop each other's runs.
+        A read-only (dry run) scheduler writes nothing.
+        """
+        if self.read_only:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with _locked(self.path + '.lock'):
+            history = {}
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    history = json.load(f)
+            entry = history.setdefault('providers', {}).setdefault(self.provider, {'runs': 0, 'queries': {}})
+            entry['runs'] = self.run_number
+            entry['queries'].update({q: asdict(s) for q, s in self.stats.items()})
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(history, f, indent=2, ensure_ascii=False)
+            os.replace(temporary, self.path)
+        self.history = history
+
+    def summary(self) -> str:
+        parts = [f"{len(self.executed)} run"]
+        if self.skipped_backoff:
+            parts.append(f"{len(self.skipped_backoff)} backed off")
+        if self.skipped_budget:
+            parts.append(f"{len(self.skipped_budget)} over budget")
+        return f"{self.provider} queries (run #{self.run_number}): " + ', '.join(parts)
+
+
+def add_scheduler_arguments(parser):
+    """The budget flags shared by every collector"""
+    parser.add_argument('--budget-seconds', type=float, help='stop querying after this many seconds')
+    parser.add_argument('--max-queries', type=int, help='at most this many queries per provider')
+    parser.add_argument('--all-queries', action='store_true', help='ignore backoff and run every query')
+    parser.add_argument('--query-history', default=HISTORY_PATH, help='yield history file')
+
+
+def scheduler_options(args, started: Optional[float] = None) -> dict:
+    return {
+        'path': args.query_history,
+        'budget_seconds': args.budget_seconds,
+        'max_queries': args.max_queries,
+        'run_all': args.all_queries,
+        'started': started,
+        'read_only': getattr(args, 'dry_run', False),
+    }
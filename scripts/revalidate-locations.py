@@ -0,0 +1,282 @@
+"""
+Periodic Location Revalidation for Basey Fare Check
+Re-checks locations whose lastValidated is stale and logs PERIODIC_CHECK results.
+Boundary/barangay checks run locally; reverse-geocode lookups go through a
+bounded thread pool with a coordinate cache to any geocoding.py provider
+(which applies its own concurrency and rate limit); results are written in
+batches.
+
+Usage:
+    python scripts/revalidate-locations.py                      # Google if GOOGLE_MAPS_API_KEY is set
+    python scripts/revalidate-locations.py --provider fake      # offline, no network
+    python scripts/revalidate-locations.py --provider nominatim --provider-url http://localhost:8080
+    python scripts/revalidate-locations.py --max-age-days 7 --limit 2000 --workers 16
+"""
+
+import argparse
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from barangay_boundaries import BarangayIndex
+from geocoding import PROVIDERS, add_provider_arguments, provider_from_args
+from location_db import connect, find_admin_user_id, new_id
+from location_validation import (
+    GeocodeCheck,
+    ValidationResult,
+    apply_geocode_check,
+    validate_location,
+    validation_status,
+)
+from run_metrics import RunMetrics
+
+VALIDATION_TYPE = 'PERIODIC_CHECK'
+
+# Locations/second a full run is expected to sustain with the stub provider
+DEFAULT_TARGET_RATE = 500
+
+SELECT_STALE_SQL = """
+SELECT id, name, type::text, coordinates, barangay, "verifiedAt" IS NOT NULL
+FROM locations
+WHERE "isActive"
+  AND ("lastValidated" IS NULL OR "lastValidated" < now() - make_interval(days => %(days)s))
+ORDER BY "lastValidated" NULLS FIRST
+LIMIT %(limit)s
+"""
+
+STAGING_DDL = """
+CREATE TEMP TABLE location_revalidation (
+    id TEXT, "validationStatus" TEXT, "isWithinMunicipality" BOOLEAN, "isWithinBarangay" BOOLEAN,
+    "actualBarangay" TEXT, "googlePlaceId" TEXT, "googleFormattedAddress" TEXT
+) ON COMMIT DROP
+"""
+
+UPDATE_SQL = """
+UPDATE locations AS l SET
+    "validationStatus" = r."validationStatus"::"LocationValidationStatus",
+    "isWithinMunicipality" = r."isWithinMunicipality",
+    "isWithinBarangay" = r."isWithinBarangay",
+    "actualBarangay" = r."actualBarangay",
+    "googlePlaceId" = COALESCE(r."googlePlaceId", l."googlePlaceId"),
+    "googleFormattedAddress" = COALESCE(r."googleFormattedAddress", l."googleFormattedAddress"),
+    "lastValidated" = %(now)s::timestamp,
+    "updatedAt" = %(now)s::timestamp
+FROM location_revalidation AS r
+WHERE l.id = r.id
+"""
+
+VALIDATION_COLUMNS = [
+    'id', 'locationId', 'validatedBy', 'validationType', 'isValid',
+    'validationErrors', 'validationWarnings', 'withinMunicipality', 'withinBarangay',
+    'detectedBarangay', 'googleMapsValid', 'googlePlaceId', 'googleAddress', 'googleConfidence',
+    'validatedCoordinates', 'validatedAt',
+]
+
+
+class CachedGeocoder:
+    """Thread-safe cache in front of a provider, keyed by rounded coordinates
+
+    Concurrent misses on one key share a single provider call. Failed lookups
+    (network or HTTP errors) are returned but not cached, so a later row at
+    the same coordinate tries again.
+    """
+
+    def __init__(self, provider, precision: int = 5):
+        self.provider = provider
+        self.precision = precision
+        self.cache: Dict[Tuple[float, float], GeocodeCheck] = {}
+        self.in_flight: Dict[Tuple[float, float], Future] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, lat: float, lng: float) -> GeocodeCheck:
+        key = (round(lat, self.precision), round(lng, self.precision))
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            pending = self.in_flight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self.in_flight[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not owner:
+            return pending.result()
+
+        try:
+            check = self.provider.reverse(lat, lng)
+        except BaseException as e:
+            with self.lock:
+                del self.in_flight[key]
+            pending.set_exception(e)
+            raise
+        with self.lock:
+            if not check.failed:
+                self.cache[key] = check
+            del self.in_flight[key]
+        pending.set_result(check)
+        return check
+
+
+def parse_coordinates(coordinates: str) -> Optional[Tuple[float, float]]:
+    """Parse the "lat,lng" string stored in locations.coordinates"""
+    try:
+        lat, lng = (float(part) for part in coordinates.split(','))
+    except (AttributeError, ValueError):
+        return None
+    return lat, lng
+
+
+def select_stale(conn, max_age_days: int, limit: int):
+    """Active locations never validated or validated more than max_age_days ago"""
+    with conn.cursor() as cur:
+        cur.execute(SELECT_STALE_SQL, {'days': max_age_days, 'limit': limit})
+        return cur.fetchall()
+
+
+def revalidate(row, index: BarangayIndex, geocoder,
+               metrics: RunMetrics) -> Tuple[str, ValidationResult, Optional[str]]:
+    """Revalidate one location row; returns (id, result, status)
+
+    status is None when the reverse-geocode lookup itself failed (network or
+    HTTP error): the row is left as it was so the next run retries it.
+    """
+    location_id, name, location_type, coordinates, barangay, verified = row
+    parsed = parse_coordinates(coordinates)
+    if not parsed:
+        result = ValidationResult(is_valid=False, coordinates=coordinates or '')
+        result.errors.append('Invalid coordinate format. Expected format: "latitude,longitude"')
+        return location_id, result, 'FAILED'
+
+    lat, lng = parsed
+    expected = barangay if location_type == 'BARANGAY' else None
+    with metrics.span('verify'):
+        result = validate_location(name, location_type, lat, lng, index, expected_barangay=expected)
+    if geocoder is not None:
+        with metrics.span('lookup'):
+            check = geocoder.lookup(lat, lng)
+        if check.failed:
+            return location_id, result, None
+        apply_geocode_check(result, check, location_type)
+    return location_id, result, validation_status(result, verified=verified)
+
+
+def write_batch(conn, batch, admin_id: str):
+    """Write one batch of results: staging COPY, one UPDATE, one log COPY"""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    with conn.cursor() as cur:
+        cur.execute(STAGING_DDL)
+        with cur.copy(
+            'COPY location_revalidation (id, "validationStatus", "isWithinMunicipality", "isWithinBarangay", '
+            '"actualBarangay", "googlePlaceId", "googleFormattedAddress") FROM STDIN'
+        ) as copy:
+            for location_id, result, status in batch:
+                copy.write_row([
+                    location_id, status, result.within_municipality, result.within_barangay,
+                    result.detected_barangay, result.google_place_id, result.google_address,
+                ])
+        cur.execute(UPDATE_SQL, {'now': now})
+
+        columns = ', '.join(f'"{c}"' for c in VALIDATION_COLUMNS)
+        with cur.copy(f'COPY location_validations ({columns}) FROM STDIN') as copy:
+            for location_id, result, _ in batch:
+                copy.write_row([
+                    new_id(), location_id, admin_id, VALIDATION_TYPE, result.is_valid,
+                    result.errors, result.warnings, result.within_municipality, result.within_barangay,
+                    result.detected_barangay, result.google_maps_valid, result.google_place_id,
+                    result.google_address, result.google_confidence, result.coordinates, now,
+                ])
+    conn.commit()
+
+
+def build_geocoder(args, index: BarangayIndex):
+    """Pick the reverse-geocode provider for this run (None = local checks only)"""
+    provider = args.provider
+    if provider == 'auto':
+        provider = 'google' if os.environ.get('GOOGLE_MAPS_API_KEY') else 'none'
+    if provider == 'stub':
+        provider = 'fake'  # old name for the offline provider
+    if provider == 'none':
+        return None
+    return CachedGeocoder(provider_from_args(args, index=index, name=provider))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Revalidate stale locations (PERIODIC_CHECK)')
+    parser.add_argument('--database-url', help='defaults to DIRECT_DATABASE_URL / DATABASE_URL')
+    parser.add_argument('--max-age-days', type=int, default=30, help='revalidate rows older than this')
+    parser.add_argument('--limit', type=int, default=10000, help='maximum locations per run')
+    parser.add_argument('--workers', type=int, default=8, help='concurrent provider lookups')
+    parser.add_argument('--batch-size', type=int, default=500, help='rows per database write')
+    add_provider_arguments(parser, default='auto', choices=('auto', *PROVIDERS, 'stub', 'none'))
+    parser.add_argument('--target-rate', type=float, default=DEFAULT_TARGET_RATE,
+                        help='expected locations/second; a slower run is reported')
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='dump a profile of the run')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Basey Fare Check - PERIODIC LOCATION REVALIDATION")
+    print("=" * 60)
+
+    metrics = RunMetrics('revalidate-locations', profile=args.profile)
+    with metrics.span('parse'):
+        index = BarangayIndex.load()
+    geocoder = build_geocoder(args, index)
+    if geocoder is not None:
+        print(f"\n🌐 Provider: {geocoder.provider.describe()}")
+
+    with connect(args.database_url) as conn:
+        with metrics.span('fetch'):
+            rows = select_stale(conn, args.max_age_days, args.limit)
+        metrics.count('locations', len(rows))
+        print(f"\n📋 {len(rows)} locations not validated in the last {args.max_age_days} days")
+        if not rows:
+            print("✅ Nothing to revalidate")
+            return
+
+        admin_id = find_admin_user_id(conn)
+        statuses: Dict[str, int] = {}
+        batch = []
+
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            for outcome in pool.map(lambda row: revalidate(row, index, geocoder, metrics), rows):
+                if outcome[2] is None:
+                    metrics.count('lookup_failed')
+                    continue
+                batch.append(outcome)
+                statuses[outcome[2]] = statuses.get(outcome[2], 0) + 1
+                if len(batch) >= args.batch_size:
+                    with metrics.span('write'):
+                        write_batch(conn, batch, admin_id)
+                    batch = []
+            if batch:
+                with metrics.span('write'):
+                    write_batch(conn, batch, admin_id)
+
+    elapsed = metrics.elapsed()
+    rate = len(rows) / elapsed if elapsed else 0
+
+    print("\n📊 Revalidation Summary:")
+    for status, count in sorted(statuses.items()):
+        print(f"  {status}: {count}")
+    if geocoder is not None:
+        print(f"  Provider lookups: {geocoder.misses} ({geocoder.hits} cache hits)")
+        failed = metrics.counters.get('lookup_failed', 0)
+        if failed:
+            print(f"⚠️ {failed} locations skipped after a failed lookup; they stay stale and are retried next run")
+    print(f"\n⏱️ {len(rows)} locations in {elapsed:.2f}s ({rate:,.0f} locations/s, target {args.target_rate:,.0f})")
+    if rate < args.target_rate:
+        print("⚠️ Below throughput target - check provider latency or raise --workers")
+    else:
+        print("✅ Throughput target met")
+    metrics.report()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Local reverse geocoder for Basey
+Answers "where is this point?" from data already in the repo: the barangay
+polygons, the gazetteer's landmarks and the offline road network, each
+loaded once into an in-memory spatial index.
+
+    geocoder = ReverseGeocoder.load()
+    geocoder.lookup(11.2801, 125.0689)
+    geocoder.lookup_many([(11.2801, 125.0689), ...])
+"""
+
+import json
+import os
+from typing import Iterable, List, Tuple
+
+from barangay_boundaries import BarangayIndex
+from location_names import location_id
+from spatial_index import PointIndex, SegmentIndex
+
+LOCATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'basey-locations.json')
+ROADS_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'basey-roads.geojson')
+
+# Gazetteer types that label a pin better than its barangay alone
+LANDMARK_TYPES = ('landmark', 'sitio', 'poi')
+
+MAX_LANDMARK_M = 2000
+MAX_ROAD_SNAP_M = 200  # MAX_SNAP_M in src/lib/routing/offlineGraph.ts
+
+
+class ReverseGeocoder:
+    def __init__(self, barangays: BarangayIndex, landmarks: PointIndex, roads: SegmentIndex):
+        self.barangays = barangays
+        self.landmarks = landmarks
+        self.roads = roads
+
+    @classmethod
+    def load(cls, locations_path: str = LOCATIONS_PATH, roads_path: str = ROADS_PATH) -> 'ReverseGeocoder':
+        """Build all three indexes from the repo's data files"""
+        with open(locations_path, 'r', encoding='utf-8') as f:
+            gazetteer = json.load(f)
+        landmarks = PointIndex()
+        for loc_type in LANDMARK_TYPES:
+            for loc in gazetteer.get('locations', {}).get(loc_type, []):
+                coords = loc['coordinates']
+                landmarks.add(coords['lat'], coords['lng'], {'name': loc['name'], 'type': loc_type})
+
+        roads = SegmentIndex(cell_deg=0.001)  # ~110 m; roads are dense in the poblacion
+        if os.path.exists(roads_path):
+            with open(roads_path, 'r', encoding='utf-8') as f:
+                network = json.load(f)
+            for feature in network.get('features', []):
+                geom = feature.get('geometry') or {}
+                if geom.get('type') == 'LineString':
+                    roads.add_linestring(geom['coordinates'], (feature.get('properties') or {}).get('highway'))
+
+        return cls(BarangayIndex.load(), landmarks, roads)
+
+    def lookup(self, lat: float, lng: float) -> dict:
+        """Barangay, nearest landmark and nearest road snap for one point"""
+        barangay = self.barangays.find(lat, lng)
+
+        landmark = None
+        nearest = self.landmarks.nearest(lat, lng, MAX_LANDMARK_M)
+        if nearest:
+            distance, info = nearest
+            landmark = {'name': info['name'], 'type': info['type'], 'distanceM': round(distance, 1)}
+
+        road = None
+        snap = self.roads.nearest(lat, lng, MAX_ROAD_SNAP_M)
+        if snap:
+            distance, snap_lat, snap_lng, highway = snap
+            road = {
+                'highway': highway,
+                'distanceM': round(distance, 1),
+                'snapped': {'lat': round(snap_lat, 6), 'lng': round(snap_lng, 6)},
+            }
+
+        return {
+            'lat': lat,
+            'lng': lng,
+            'barangay': barangay.name.title() if barangay else None,
+            'withinMunicipality': barangay is not None,
+            'nearestLandmark': landmark,
+            'road': road,
+        }
+
+    def lookup_many(self, points: Iterable[Tuple[float, float]]) -> List[dict]:
+        return [self.lookup(lat, lng) for lat, lng in points]
+
+
+def to_google_result(lookup: dict) -> dict:
+    """Shape a lookup like a Google Geocoding API response
+
+    Enough of the format for analyzeGeocodingResult in
+    googleMapsVerification.ts (and check_from_google, behind the Google
+    provider's reverse lookup in geocoding.py) to read it unchanged.
+    """
+    if not lookup['withinMunicipality']:
+        return {'status': 'ZERO_RESULTS', 'results': []}
+
+    lat, lng = lookup['lat'], lookup['lng']
+    geometry = {
+        'location': {'lat': lat, 'lng': lng},
+        'locationType': 'APPROXIMATE',
+        'viewport': {
+            'northeast': {'lat': lat + 0.001, 'lng': lng + 0.001},
+            'southwest': {'lat': lat - 0.001, 'lng': lng - 0.001},
+        },
+    }
+
+    barangay = lookup['barangay']
+    landmark = lookup['nearestLandmark']
+    components = [
+        _component(barangay, barangay, ['neighborhood', 'political']),
+        _component('Basey', 'Basey', ['locality', 'political']),
+        _component('Samar', 'Samar', ['administrative_area_level_1', 'political']),
+        _component('Philippines', 'PH', ['country', 'political']),
+    ]
+
+    parts = [barangay, 'Basey', 'Samar', 'Philippines']
+    types = ['neighborhood', 'political']
+    if landmark and landmark['distanceM'] <= 50:
+        parts.insert(0, landmark['name'])
+        types = ['establishment', 'point_of_interest']
+
+    return {
+        'status': 'OK',
+        'results': [{
+            'formatted_address': ', '.join(parts),
+            'address_components': components,
+            'place_id': f"local:{location_id(parts[0])}:{lat:.5f},{lng:.5f}",
+            'geometry': geometry,
+            'types': types,
+        }],
+    }
+
+
+def _component(long_name: str, short_name: str, types: List[str]) -> dict:
+    # The Geocoding API uses snake_case; googleMapsVerification.ts reads camelCase
+    return {
+        'long_name': long_name, 'short_name': short_name,
+        'longName': long_name, 'shortName': short_name,
+        'types': types,
+    }
@@ -0,0 +1,141 @@
+"""
+Road network graph for Basey built from public/data/basey-roads.geojson
+Every distinct coordinate is a node and consecutive coordinates of a
+LineString are joined by an edge, the same graph geojson-path-finder builds
+for the client's offline router (src/lib/routing/offlineGraph.ts). Edges are
+undirected there, so they are here too.
+
+    graph = RoadGraph.load()
+    node = graph.nearest_node(11.2801, 125.0689)
+    dist, settled = graph.dijkstra({node: 0.0})
+"""
+
+import heapq
+import json
+import math
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+from spatial_index import EARTH_RADIUS_M, PointIndex
+
+ROADS_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'basey-roads.geojson')
+MAX_SNAP_M = 200  # MAX_SNAP_M in src/lib/routing/offlineGraph.ts
+
+Point = Tuple[float, float]  # (lng, lat), as in GeoJSON
+
+
+def haversine_m(lng1: float, lat1: float, lng2: float, lat2: float) -> float:
+    """Great-circle distance in metres (haversineKm in src/lib/routing/geo.ts)"""
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def encode_polyline(coordinates) -> str:
+    """[(lat, lng), ...] at precision 5 (encodePolyline in src/lib/routeUtils.ts)"""
+    output, previous = [], (0, 0)
+    for lat, lng in coordinates:
+        current = (math.floor(lat * 1e5 + 0.5), math.floor(lng * 1e5 + 0.5))  # Math.round
+        for delta in (current[0] - previous[0], current[1] - previous[1]):
+            value = ~(delta << 1) if delta < 0 else delta << 1
+            while value >= 0x20:
+                output.append(chr((0x20 | (value & 0x1f)) + 63))
+                value >>= 5
+            output.append(chr(value + 63))
+        previous = current
+    return ''.join(output)
+
+
+class RoadGraph:
+    def __init__(self, coords: List[Point], edges: List[Tuple[int, int, float, Optional[str]]]):
+        self.coords = coords
+        self.edge_u = [e[0] for e in edges]
+        self.edge_v = [e[1] for e in edges]
+        self.edge_length = [e[2] for e in edges]  # metres
+        self.edge_highway = [e[3] for e in edges]
+        # adjacency[u] = [(v, edge index), ...]
+        self.adjacency: List[List[Tuple[int, int]]] = [[] for _ in coords]
+        for i, (u, v, _, _) in enumerate(edges):
+            self.adjacency[u].append((v, i))
+            self.adjacency[v].append((u, i))
+        self._points: Optional[PointIndex] = None
+
+    @classmethod
+    def load(cls, path: str = ROADS_PATH) -> 'RoadGraph':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_geojson(json.load(f))
+
+    @classmethod
+    def from_geojson(cls, network: dict) -> 'RoadGraph':
+        node_ids: Dict[Point, int] = {}
+        coords: List[Point] = []
+        edges = []
+
+        def node(c) -> int:
+            key = (c[0], c[1])
+            if key not in node_ids:
+                node_ids[key] = len(coords)
+                coords.append(key)
+            return node_ids[key]
+
+        for feature in network.get('features', []):
+            geom = feature.get('geometry') or {}
+            if geom.get('type') != 'LineString':
+                continue
+            highway = (feature.get('properties') or {}).get('highway')
+            line = geom['coordinates']
+            for a, b in zip(line, line[1:]):
+                u, v = node(a), node(b)
+                if u != v:
+                    edges.append((u, v, haversine_m(a[0], a[1], b[0], b[1]), highway))
+        return cls(coords, edges)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.coords)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edge_u)
+
+    def nearest_node(self, lat: float, lng: float, max_distance_m: float = MAX_SNAP_M) -> Optional[int]:
+        """Closest graph vertex within max_distance_m (the client snaps to vertices too)"""
+        if self._points is None:
+            self._points = PointIndex(cell_deg=0.002)
+            for i, (node_lng, node_lat) in enumerate(self.coords):
+                self._points.add(node_lat, node_lng, i)
+        found = self._points.nearest(lat, lng, max_distance_m)
+        return found[1] if found else None
+
+    def dijkstra(
+        self,
+        sources: Dict[int, float],
+        target: Optional[int] = None,
+        max_cost: float = math.inf,
+        edge_cost: Optional[Callable[[int], float]] = None,
+    ) -> Tuple[Dict[int, float], int]:
+        """Plain Dijkstra from one or more sources; returns (settled costs, settled count)
+
+        Stops at target when given, and never settles a node beyond max_cost.
+        edge_cost maps an edge index to its cost (default: length in metres).
+        """
+        cost_of = edge_cost or self.edge_length.__getitem__
+        dist: Dict[int, float] = {}
+        best = dict(sources)
+        heap = [(d, n) for n, d in sources.items()]
+        heapq.heapify(heap)
+        while heap:
+            d, u = heapq.heappop(heap)
+            if u in dist:
+                continue
+            if d > max_cost:
+                break
+            dist[u] = d
+            if u == target:
+                break
+            for v, e in self.adjacency[u]:
+                nd = d + cost_of(e)
+                if v not in dist and nd < best.get(v, math.inf):
+                    best[v] = nd
+                    heapq.heappush(heap, (nd, v))
+        return dist, len(dist)
@@ -0,0 +1,136 @@
+"""
+Stage timing, counters and optional profiling for the location scripts
+
+    metrics = RunMetrics('find-new-osm-locations')
+    with metrics.span('fetch'):
+        response = requests.get(...)
+    metrics.count('results', len(results))
+    metrics.report()
+
+Profiling is off unless LOCATION_PROFILE is set (or a script passes its
+--profile flag): "cprofile" dumps a .prof file, "pyinstrument" an HTML
+report, both under .profiles/ when report() is called.
+LOCATION_METRICS=<path> also writes the timing summary as JSON.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+PROFILE_DIR = os.path.join(os.path.dirname(__file__), '..', '.profiles')
+
+
+class RunMetrics:
+    """Accumulates wall time per stage and named counters for one run"""
+
+    def __init__(self, name: str, profile: Optional[str] = None):
+        self.name = name
+        self.started = time.perf_counter()
+        self.stage_seconds: Dict[str, float] = {}
+        self.stage_calls: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+        mode = profile or os.environ.get('LOCATION_PROFILE')
+        self.profiler = _Profiler(name, mode) if mode else None
+
+    @contextmanager
+    def span(self, stage: str):
+        """Time a block and add it to the stage's total"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + elapsed
+                self.stage_calls[stage] = self.stage_calls.get(stage, 0) + 1
+
+    def count(self, counter: str, n: int = 1):
+        """Increment a named counter"""
+        with self.lock:
+            self.counters[counter] = self.counters.get(counter, 0) + n
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def to_dict(self) -> dict:
+        total = self.elapsed()
+        return {
+            'run': self.name,
+            'finished_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'total_seconds': round(total, 4),
+            'stages': {
+                stage: {
+                    'seconds': round(seconds, 4),
+                    'calls': self.stage_calls[stage],
+                    'share': round(seconds / total, 4) if total else 0,
+                }
+                for stage, seconds in self.stage_seconds.items()
+            },
+            'counters': dict(self.counters),
+            'throughput': {
+                counter: round(value / total, 2) if total else 0
+                for counter, value in self.counters.items()
+            },
+        }
+
+    def report(self, json_path: Optional[str] = None):
+        """Print the per-stage timing/throughput summary (and optionally save it)"""
+        if self.profiler:
+            path = self.profiler.stop()
+            self.profiler = None
+            print(f"🔬 Profile written to {path}")
+
+        summary = self.to_dict()
+        total = summary['total_seconds']
+
+        print(f"\n⏱️ Timing Summary ({self.name}): {total:.2f}s total")
+        for stage, info in sorted(summary['stages'].items(), key=lambda kv: -kv[1]['seconds']):
+            per_call = info['seconds'] / info['calls'] * 1000 if info['calls'] else 0
+            print(f"  {stage:<12} {info['seconds']:8.3f}s {info['share'] * 100:5.1f}%  "
+                  f"{info['calls']:>7} calls  {per_call:8.2f} ms/call")
+        for counter, value in sorted(summary['counters'].items()):
+            print(f"  {counter:<12} {value:>8}  ({summary['throughput'][counter]:,.1f}/s)")
+
+        json_path = json_path or os.environ.get('LOCATION_METRICS')
+        if json_path:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2)
+            print(f"  Metrics written to {json_path}")
+
+
+class _Profiler:
+    """cProfile or pyinstrument session that dumps to .profiles/ when stopped"""
+
+    def __init__(self, name: str, mode: str):
+        self.name = name
+        self.mode = mode
+        if mode == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler  # type: ignore
+            except ImportError:
+                raise SystemExit("❌ pyinstrument is not installed: pip install pyinstrument")
+            self.profiler = Profiler()
+            self.profiler.start()
+        else:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop(self) -> str:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        if self.mode == 'pyinstrument':
+            self.profiler.stop()
+            path = os.path.join(PROFILE_DIR, f"{self.name}-{stamp}.html")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.profiler.output_html())
+        else:
+            self.profiler.disable()
+            path = os.path.join(PROFILE_DIR, f"{self.name}-{stamp}.prof")
+            self.profiler.dump_stats(path)
+        return path
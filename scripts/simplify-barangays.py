@@ -0,0 +1,114 @@
+"""
+Topology-preserving simplification of Barangay.shp.json
+Builds the shared-arc topology, simplifies each arc once and writes one
+GeoJSON (and optionally TopoJSON) file per level of detail, reporting size
+against the Hausdorff error of each level. A level is a maximum error in
+metres: each arc drops every vertex it can while staying within it. Shared
+arcs stay identical, but borders that were never noded together can move
+into new near-misses, so every level is also run through the boundary
+checks and its gap and overlap counts are reported next to the source's.
+Each file records its method, level, measured maximum error and those
+counts.
+
+Usage:
+    python scripts/simplify-barangays.py                          # levels 5,20,50 m
+    python scripts/simplify-barangays.py --levels 10,40 --method douglas-peucker --topojson
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from barangay_boundaries import BARANGAY_GEOJSON_PATH
+from barangay_topology import METHODS, build_topology, vertex_weights
+from boundary_validation import validate_boundaries
+
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'barangays')
+
+
+def _dump(data: dict) -> str:
+    return json.dumps(data, separators=(',', ':'))
+
+
+def _defect_counts(features: list) -> dict:
+    """Gap and overlap counts from boundary_validation"""
+    kinds = validate_boundaries(features).by_kind()
+    return {'gaps': len(kinds.get('gap', [])), 'overlaps': len(kinds.get('overlap', []))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simplify barangay boundaries without opening gaps')
+    parser.add_argument('--input', default=BARANGAY_GEOJSON_PATH)
+    parser.add_argument('--output-dir', default=OUTPUT_DIR)
+    parser.add_argument('--levels', default='5,20,50', help='maximum errors in metres, one output per level')
+    parser.add_argument('--method', choices=METHODS, default='visvalingam')
+    parser.add_argument('--topojson', action='store_true', help='also write quantised TopoJSON per level')
+    parser.add_argument('--quantization', type=int, default=100_000, help='TopoJSON grid size per axis')
+    parser.add_argument('--precision', type=int, default=6, help='GeoJSON decimal places')
+    parser.add_argument('--dry-run', action='store_true', help='report only, write nothing')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Basey Fare Check - BARANGAY BOUNDARY SIMPLIFICATION")
+    print("=" * 60)
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        source = json.load(f)
+    source_bytes = os.path.getsize(args.input)
+    topology = build_topology(source['features'])
+    weights = vertex_weights(topology, args.method)
+
+    print(f"\n🧩 {len(topology.features)} barangays -> {len(topology.arcs)} arcs "
+          f"({topology.shared_arc_count()} shared), {topology.vertex_count()} vertices")
+    source_counts = _defect_counts(source['features'])
+    print(f"📄 Source: {source_bytes / 1024:.0f} KB on disk, method: {args.method}, "
+          f"{source_counts['gaps']} gaps, {source_counts['overlaps']} overlaps\n")
+
+    header = f"  {'level':>6} {'vertices':>9} {'geojson':>9} {'saved':>7}"
+    if args.topojson:
+        header += f" {'topojson':>9} {'saved':>7}"
+    print(header + f" {'hausdorff max':>14} {'median':>7} {'gaps':>5} {'overlaps':>8}")
+
+    if not args.dry_run:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    for level in sorted(float(v) for v in args.levels.split(',') if v):
+        masks = topology.masks_within(weights, level) if level > 0 else None
+        errors = topology.feature_errors(topology.arc_errors(masks)) if masks else [0.0] * len(topology.features)
+        name = f"barangays-{level:g}m"
+        features = topology.to_features(masks, args.precision)
+        counts = _defect_counts(features)
+        simplification = {'method': args.method, 'maxErrorLimitM': level, 'maxErrorM': round(max(errors), 2),
+                          **counts, 'sourceGaps': source_counts['gaps'], 'sourceOverlaps': source_counts['overlaps']}
+
+        geojson = _dump({
+            'type': 'FeatureCollection',
+            'name': source.get('name', 'Barangay'),
+            'simplification': simplification,
+            'features': features,
+        })
+        row = (f"  {level:>5g}m {topology.vertex_count(masks):>9} {len(geojson) / 1024:>7.0f}KB "
+               f"{1 - len(geojson) / source_bytes:>6.0%}")
+        outputs = {f"{name}.geojson": geojson}
+        if args.topojson:
+            topojson = _dump({**topology.to_topojson(masks, args.quantization), 'simplification': simplification})
+            row += f" {len(topojson) / 1024:>7.0f}KB {1 - len(topojson) / source_bytes:>6.0%}"
+            outputs[f"{name}.topojson"] = topojson
+        print(row + f" {max(errors):>12.1f} m {float(np.median(errors)):>5.1f} m "
+                    f"{counts['gaps']:>5} {counts['overlaps']:>8}")
+
+        if not args.dry_run:
+            for filename, body in outputs.items():
+                with open(os.path.join(args.output_dir, filename), 'w', encoding='utf-8') as f:
+                    f.write(body)
+
+    print("\n  hausdorff = largest distance from an original vertex to the simplified boundary, per barangay")
+    print("  gaps/overlaps = boundary_validation warnings and errors, compare with the source's")
+    if not args.dry_run:
+        print(f"💾 Wrote {args.output_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Grid spatial indexes for nearest-point and nearest-segment lookups
+A uniform lat/lng grid; queries search outward ring by ring and stop once
+no unvisited cell can hold anything closer. Distances use a local
+equirectangular projection, which is well within a metre at Basey's scale.
+"""
+
+import math
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+EARTH_RADIUS_M = 6371000
+METRES_PER_DEGREE = EARTH_RADIUS_M * math.pi / 180
+DEFAULT_CELL_DEG = 0.005  # ~550 m
+
+
+class GridIndex:
+    """Items bucketed by every grid cell their bbox overlaps"""
+
+    def __init__(self, cell_deg: float = DEFAULT_CELL_DEG, ref_lat: float = 11.28):
+        self.cell_deg = cell_deg
+        self.cells: Dict[Tuple[int, int], List[Any]] = {}
+        self.lng_scale = math.cos(math.radians(ref_lat))
+        # Smallest metric size of a cell, bounding how far a ring reaches
+        self.cell_m = cell_deg * METRES_PER_DEGREE * min(1.0, self.lng_scale)
+        self.size = 0
+
+    def _key(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg))
+
+    def insert(self, item: Any, lat_min: float, lng_min: float, lat_max: float, lng_max: float):
+        r0, c0 = self._key(lat_min, lng_min)
+        r1, c1 = self._key(lat_max, lng_max)
+        for r in range(r0, r1 + 1):
+            for c in range(c0, c1 + 1):
+                self.cells.setdefault((r, c), []).append(item)
+        self.size += 1
+
+    def at(self, lat: float, lng: float) -> List[Any]:
+        """Items whose bbox overlaps the cell containing the point"""
+        return self.cells.get(self._key(lat, lng), [])
+
+    def within(self, lat_min: float, lng_min: float, lat_max: float, lng_max: float) -> List[Any]:
+        """Items whose bbox overlaps a cell the query bbox touches, each once"""
+        r0, c0 = self._key(lat_min, lng_min)
+        r1, c1 = self._key(lat_max, lng_max)
+        seen, items = set(), []
+        for r in range(r0, r1 + 1):
+            for c in range(c0, c1 + 1):
+                for item in self.cells.get((r, c), ()):
+                    if id(item) not in seen:
+                        seen.add(id(item))
+                        items.append(item)
+        return items
+
+    def rings(self, lat: float, lng: float, max_rings: int) -> Iterator[Tuple[int, List[Any]]]:
+        """Yield (ring number, items) for square rings of cells around the point"""
+        r0, c0 = self._key(lat, lng)
+        for k in range(max_rings + 1):
+            items = []
+            for r in range(r0 - k, r0 + k + 1):
+                if abs(r - r0) == k:
+                    cols = range(c0 - k, c0 + k + 1)
+                else:
+                    cols = (c0 - k, c0 + k) if k else (c0,)
+                for c in cols:
+                    bucket = self.cells.get((r, c))
+                    if bucket:
+                        items.extend(bucket)
+            yield k, items
+
+    def to_metres(self, lat: float, lng: float, ref_lat: float, ref_lng: float) -> Tuple[float, float]:
+        return (
+            (lng - ref_lng) * METRES_PER_DEGREE * self.lng_scale,
+            (lat - ref_lat) * METRES_PER_DEGREE,
+        )
+
+
+class PointIndex(GridIndex):
+    """Nearest neighbour over (lat, lng, payload) points"""
+
+    def add(self, lat: float, lng: float, payload: Any):
+        self.insert((lat, lng, payload), lat, lng, lat, lng)
+
+    def nearest(self, lat: float, lng: float, max_distance_m: float = 5000) -> Optional[Tuple[float, Any]]:
+        """(distance in metres, payload) of the closest point, or None"""
+        best: Optional[Tuple[float, Any]] = None
+        max_rings = int(max_distance_m / self.cell_m) + 1
+        for k, items in self.rings(lat, lng, max_rings):
+            for p_lat, p_lng, payload in items:
+                dx, dy = self.to_metres(p_lat, p_lng, lat, lng)
+                d = math.hypot(dx, dy)
+                if d <= max_distance_m and (best is None or d < best[0]):
+                    best = (d, payload)
+            # Anything in ring k+1 is at least k cells away
+            if best is not None and best[0] <= k * self.cell_m:
+                break
+        return best
+
+
+class SegmentIndex(GridIndex):
+    """Nearest line segment (and the snapped point on it)"""
+
+    def add(self, lat1: float, lng1: float, lat2: float, lng2: float, payload: Any):
+        self.insert(
+            (lat1, lng1, lat2, lng2, payload),
+            min(lat1, lat2), min(lng1, lng2), max(lat1, lat2), max(lng1, lng2),
+        )
+
+    def add_linestring(self, coordinates: List[List[float]], payload: Any):
+        """Index every segment of a GeoJSON [lng, lat] LineString"""
+        for (lng1, lat1, *_), (lng2, lat2, *_) in zip(coordinates, coordinates[1:]):
+            self.add(lat1, lng1, lat2, lng2, payload)
+
+    def nearest(
+        self, lat: float, lng: float, max_distance_m: float = 1000,
+    ) -> Optional[Tuple[float, float, float, Any]]:
+        """(distance in metres, snapped lat, snapped lng, payload), or None"""
+        best = None
+        max_rings = int(max_distance_m / self.cell_m) + 1
+        for k, items in self.rings(lat, lng, max_rings):
+            for lat1, lng1, lat2, lng2, payload in items:
+                ax, ay = self.to_metres(lat1, lng1, lat, lng)
+                bx, by = self.to_metres(lat2, lng2, lat, lng)
+                dx, dy = bx - ax, by - ay
+                length2 = dx * dx + dy * dy
+                t = 0.0 if length2 == 0 else max(0.0, min(1.0, -(ax * dx + ay * dy) / length2))
+                d = math.hypot(ax + t * dx, ay + t * dy)
+                if d <= max_distance_m and (best is None or d < best[0]):
+                    best = (d, lat1 + t * (lat2 - lat1), lng1 + t * (lng2 - lng1), payload)
+            if best is not None and best[0] <= k * self.cell_m:
+                break
+        return best
@@ -0,0 +1,248 @@
+"""
+Sync basey-locations.json into the Prisma `locations` table
+Diffs the gazetteer against the database and writes changes in bulk:
+one COPY into a staging table, one INSERT ... ON CONFLICT, one COPY of
+LocationValidation rows - instead of a round-trip per location.
+
+Usage:
+    python scripts/sync-locations.py --dry-run
+    python scripts/sync-locations.py [--database-url postgresql://...]
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+
+from barangay_boundaries import BarangayIndex
+from location_db import connect, find_admin_user_id, new_id
+from location_validation import LOCATION_TYPES, validate_location, validation_status
+from run_metrics import RunMetrics
+
+LOCATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'basey-locations.json')
+
+# Columns compared to decide whether an existing row needs an update
+DIFF_COLUMNS = [
+    'type', 'coordinates', 'barangay', 'description',
+    'isWithinMunicipality', 'isWithinBarangay', 'actualBarangay', 'validationStatus',
+]
+
+STAGING_DDL = """
+CREATE TEMP TABLE location_sync (
+    id TEXT, name TEXT, type TEXT, coordinates TEXT, barangay TEXT, description TEXT,
+    "isWithinMunicipality" BOOLEAN, "isWithinBarangay" BOOLEAN, "actualBarangay" TEXT,
+    "validationStatus" TEXT, "verifiedBy" TEXT
+) ON COMMIT DROP
+"""
+
+UPSERT_SQL = """
+INSERT INTO locations (
+    id, name, type, coordinates, barangay, description, "isActive", "createdBy",
+    "isWithinMunicipality", "isWithinBarangay", "actualBarangay", "validationStatus",
+    "verifiedBy", "verifiedAt", "lastValidated", "createdAt", "updatedAt"
+)
+SELECT
+    id, name, type::"LocationType", coordinates, barangay, description, true, %(admin)s::text,
+    "isWithinMunicipality", "isWithinBarangay", "actualBarangay",
+    "validationStatus"::"LocationValidationStatus",
+    "verifiedBy", CASE WHEN "verifiedBy" IS NULL THEN NULL ELSE %(now)s::timestamp END,
+    %(now)s::timestamp, %(now)s::timestamp, %(now)s::timestamp
+FROM location_sync
+ON CONFLICT (name) DO UPDATE SET
+    type = EXCLUDED.type,
+    coordinates = EXCLUDED.coordinates,
+    barangay = EXCLUDED.barangay,
+    description = EXCLUDED.description,
+    "isWithinMunicipality" = EXCLUDED."isWithinMunicipality",
+    "isWithinBarangay" = EXCLUDED."isWithinBarangay",
+    "actualBarangay" = EXCLUDED."actualBarangay",
+    "validationStatus" = EXCLUDED."validationStatus",
+    -- keep verification an admin recorded; only stamp rows that are not verified yet
+    "verifiedBy" = COALESCE(locations."verifiedBy", EXCLUDED."verifiedBy"),
+    "verifiedAt" = CASE WHEN locations."verifiedBy" IS NULL THEN EXCLUDED."verifiedAt" ELSE locations."verifiedAt" END,
+    "lastValidated" = EXCLUDED."lastValidated",
+    "updatedAt" = EXCLUDED."updatedAt"
+RETURNING id, name
+"""
+
+VALIDATION_COLUMNS = [
+    'id', 'locationId', 'validatedBy', 'validationType', 'isValid',
+    'validationErrors', 'validationWarnings', 'withinMunicipality', 'withinBarangay',
+    'detectedBarangay', 'validatedCoordinates', 'validatedAt',
+]
+
+
+def load_locations(filepath=LOCATIONS_PATH):
+    """Load the gazetteer JSON"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_rows(data, index):
+    """Flatten the gazetteer into `locations` rows with local validation applied"""
+    rows = {}
+    duplicates = []
+
+    for loc_type, locs in data.get('locations', {}).items():
+        prisma_type = LOCATION_TYPES.get(loc_type, 'LANDMARK')
+        for loc in locs:
+            name = loc['name'].strip()
+            if name in rows:
+                duplicates.append(name)
+                continue
+
+            lat = loc['coordinates']['lat']
+            lng = loc['coordinates']['lng']
+            expected = name if prisma_type == 'BARANGAY' else None
+            result = validate_location(name, prisma_type, lat, lng, index, expected_barangay=expected)
+            status = validation_status(result, verified=loc.get('verified', False))
+
+            if prisma_type == 'BARANGAY':
+                barangay = name
+                description = f"Barangay {name}, verified from {loc.get('source', 'unknown')}"
+            else:
+                barangay = result.detected_barangay.title() if result.detected_barangay else None
+                description = loc.get('address') or None
+
+            rows[name] = {
+                'name': name,
+                'type': prisma_type,
+                'coordinates': f"{lat},{lng}",
+                'barangay': barangay,
+                'description': description,
+                'isWithinMunicipality': result.within_municipality,
+                'isWithinBarangay': result.within_barangay,
+                'actualBarangay': result.detected_barangay,
+                'validationStatus': status,
+                'validation': result,
+            }
+
+    return rows, duplicates
+
+
+def fetch_existing(conn):
+    """Load the synced columns of every existing location, keyed by name"""
+    columns = ', '.join(f'"{c}"' for c in ['id', 'name'] + DIFF_COLUMNS)
+    with conn.cursor() as cur:
+        cur.execute(f'SELECT {columns} FROM locations')
+        names = [d.name for d in cur.description]
+        return {row[1]: dict(zip(names, row)) for row in cur.fetchall()}
+
+
+def diff_rows(rows, existing):
+    """Split gazetteer rows into (created, updated, unchanged) and DB-only names"""
+    created, updated, unchanged = [], [], []
+    for name, row in rows.items():
+        current = existing.get(name)
+        if current is None:
+            created.append(row)
+        elif any(current[c] != row[c] for c in DIFF_COLUMNS):
+            row['id'] = current['id']
+            updated.append(row)
+        else:
+            unchanged.append(row)
+    only_in_db = sorted(set(existing) - set(rows))
+    return created, updated, unchanged, only_in_db
+
+
+def apply_changes(conn, created, updated, admin_id):
+    """Upsert changed rows and write their LocationValidation log in bulk"""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    changed = created + updated
+    if not changed:
+        return 0
+
+    for row in created:
+        row['id'] = new_id()
+
+    with conn.cursor() as cur:
+        cur.execute(STAGING_DDL)
+        with cur.copy(
+            'COPY location_sync (id, name, type, coordinates, barangay, description, '
+            '"isWithinMunicipality", "isWithinBarangay", "actualBarangay", "validationStatus", "verifiedBy") '
+            'FROM STDIN'
+        ) as copy:
+            for row in changed:
+                copy.write_row([
+                    row['id'], row['name'], row['type'], row['coordinates'], row['barangay'],
+                    row['description'], row['isWithinMunicipality'], row['isWithinBarangay'],
+                    row['actualBarangay'], row['validationStatus'],
+                    admin_id if row['validationStatus'] == 'VALIDATED' else None,
+                ])
+
+        cur.execute(UPSERT_SQL, {'admin': admin_id, 'now': now})
+        ids = {name: location_id for location_id, name in cur.fetchall()}
+
+        columns = ', '.join(f'"{c}"' for c in VALIDATION_COLUMNS)
+        with cur.copy(f'COPY location_validations ({columns}) FROM STDIN') as copy:
+            for validation_type, batch in (('CREATION', created), ('UPDATE', updated)):
+                for row in batch:
+                    result = row['validation']
+                    copy.write_row([
+                        new_id(), ids[row['name']], admin_id, validation_type, result.is_valid,
+                        result.errors, result.warnings, result.within_municipality,
+                        result.within_barangay, result.detected_barangay, result.coordinates, now,
+                    ])
+
+    conn.commit()
+    return len(changed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sync basey-locations.json into the locations table')
+    parser.add_argument('--input', default=LOCATIONS_PATH, help='gazetteer JSON to sync')
+    parser.add_argument('--database-url', help='defaults to DIRECT_DATABASE_URL / DATABASE_URL')
+    parser.add_argument('--dry-run', action='store_true', help='show the diff without writing')
+    parser.add_argument('--profile', choices=['cprofile', 'pyinstrument'], help='dump a profile of the run')
+    args = parser.parse_args()
+
+    metrics = RunMetrics('sync-locations', profile=args.profile)
+
+    print("=" * 60)
+    print("Basey Fare Check - LOCATION DATABASE SYNC")
+    print("=" * 60)
+
+    with metrics.span('parse'):
+        index = BarangayIndex.load()
+        data = load_locations(args.input)
+    with metrics.span('verify'):
+        rows, duplicates = build_rows(data, index)
+    metrics.count('locations', len(rows))
+    print(f"\n📋 Loaded {len(rows)} gazetteer locations")
+    for name in duplicates:
+        print(f"  ⚠️ Duplicate name skipped: {name}")
+
+    with connect(args.database_url) as conn:
+        with metrics.span('fetch'):
+            existing = fetch_existing(conn)
+        with metrics.span('dedupe'):
+            created, updated, unchanged, only_in_db = diff_rows(rows, existing)
+
+        print("\n📊 Diff against database:")
+        print(f"  New: {len(created)}")
+        print(f"  Changed: {len(updated)}")
+        print(f"  Unchanged: {len(unchanged)}")
+        print(f"  Only in database: {len(only_in_db)}")
+
+        if args.dry_run:
+            for row in created:
+                print(f"  + {row['name']} ({row['type']}, {row['validationStatus']})")
+            for row in updated:
+                current = existing[row['name']]
+                changes = ', '.join(c for c in DIFF_COLUMNS if current[c] != row[c])
+                print(f"  ~ {row['name']}: {changes}")
+            print("\n👋 Dry run - no changes written")
+            metrics.report()
+            return
+
+        admin_id = find_admin_user_id(conn)
+        with metrics.span('write'):
+            written = apply_changes(conn, created, updated, admin_id)
+        metrics.count('written', written)
+
+    print(f"\n✅ Synced {written} locations")
+    metrics.report()
+
+
+if __name__ == '__main__':
+    main()
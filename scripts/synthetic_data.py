@@ -0,0 +1,197 @@
+"""
+Seeded synthetic data generators for benchmarking the location tools
+Gazetteers, barangay polygons and road networks inside the Basey bounds
+"""
+
+import random
+from typing import Optional
+
+from barangay_boundaries import BASEY_BBOX
+
+LOCATION_TYPES = ['barangay', 'sitio', 'landmark', 'poi']
+TYPE_WEIGHTS = [1, 4, 4, 1]
+SOURCES = ['geojson', 'google', 'osm', 'manual']
+SYLLABLES = ['ba', 'sey', 'san', 'ta', 'lo', 'og', 'can', 'ma', 'bi', 'nu', 'gu', 'ri', 'so', 'ho', 'ton', 'pa', 'lay']
+SUFFIXES = ['', ' Elementary School', ' Chapel', ' Bridge', ' Barangay Hall', ' Store', ' Falls', ' Cave']
+HIGHWAY_CLASSES = ['secondary', 'tertiary', 'unclassified', 'residential', 'track', 'path']
+HIGHWAY_WEIGHTS = [1, 2, 4, 6, 3, 2]
+
+
+def _name_pool(rng: random.Random, size: int = 4096) -> list:
+    words = {''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title() for _ in range(size)}
+    return [word + suffix for word in sorted(words) for suffix in SUFFIXES]
+
+
+def _point(rng: random.Random, bbox: dict):
+    return (
+        round(rng.uniform(bbox['lat_min'], bbox['lat_max']), 6),
+        round(rng.uniform(bbox['lng_min'], bbox['lng_max']), 6),
+    )
+
+
+def synthetic_gazetteer(
+    count: int,
+    seed: int = 42,
+    duplicate_rate: float = 0.02,
+    out_of_bounds_rate: float = 0.01,
+    bbox: Optional[dict] = None,
+) -> dict:
+    """A basey-locations.json document with `count` locations
+
+    A small share of entries repeat an earlier name or fall outside the
+    bounds so the duplicate and bounds checks have something to find.
+    """
+    rng = random.Random(seed)
+    bbox = bbox or BASEY_BBOX
+    locations = {t: [] for t in LOCATION_TYPES}
+    pool = _name_pool(rng)
+    types = [t for t, weight in zip(LOCATION_TYPES, TYPE_WEIGHTS) for _ in range(weight)]
+    names = []
+
+    for i in range(count):
+        if names and rng.random() < duplicate_rate:
+            name = rng.choice(names)
+        else:
+            name = f"{pool[int(rng.random() * len(pool))]} {i}"
+            names.append(name)
+
+        lat, lng = _point(rng, bbox)
+        if rng.random() < out_of_bounds_rate:
+            lat += 1.0
+
+        loc_type = types[int(rng.random() * len(types))]
+        locations[loc_type].append({
+            'name': name,
+            'type': loc_type,
+            'coordinates': {'lat': lat, 'lng': lng},
+            'source': SOURCES[i % len(SOURCES)],
+            'address': f"{name}, Basey, Samar",
+            'verified': rng.random() < 0.8,
+        })
+
+    return {
+        'metadata': {
+            'municipality': 'Basey',
+            'province': 'Samar',
+            'total_locations': count,
+            'last_updated': '2000-01-01 00:00:00',
+            'sources': SOURCES,
+        },
+        'locations': {t: locs for t, locs in locations.items() if locs},
+    }
+
+
+def synthetic_barangay_geojson(
+    rows: int,
+    cols: int,
+    seed: int = 42,
+    vertices_per_edge: int = 20,
+    bbox: Optional[dict] = None,
+) -> dict:
+    """A Barangay.shp.json-shaped grid of rows x cols jittered polygons
+
+    Neighbouring cells share their edge vertices exactly, like real
+    barangay boundaries digitised from one source.
+    """
+    rng = random.Random(seed)
+    bbox = bbox or BASEY_BBOX
+    dlat = (bbox['lat_max'] - bbox['lat_min']) / rows
+    dlng = (bbox['lng_max'] - bbox['lng_min']) / cols
+    jitter = min(dlat, dlng) / (vertices_per_edge * 4)
+
+    def vertex(r: float, c: float):
+        return [round(bbox['lng_min'] + c * dlng, 7), round(bbox['lat_min'] + r * dlat, 7)]
+
+    # Shared, jittered edges keyed by their grid endpoints
+    edges = {}
+
+    def edge(a, b):
+        key = (a, b) if a < b else (b, a)
+        if key not in edges:
+            (r0, c0), (r1, c1) = key
+            points = []
+            for k in range(vertices_per_edge + 1):
+                t = k / vertices_per_edge
+                lng, lat = vertex(r0 + (r1 - r0) * t, c0 + (c1 - c0) * t)
+                if 0 < k < vertices_per_edge:
+                    lng += rng.uniform(-jitter, jitter) if r0 == r1 else 0
+                    lat += rng.uniform(-jitter, jitter) if c0 == c1 else 0
+                points.append([round(lng, 7), round(lat, 7)])
+            edges[key] = points
+        points = edges[key]
+        return points if key == (a, b) else points[::-1]
+
+    features = []
+    for r in range(rows):
+        for c in range(cols):
+            corners = [(r, c), (r, c + 1), (r + 1, c + 1), (r + 1, c), (r, c)]
+            ring = []
+            for a, b in zip(corners, corners[1:]):
+                ring.extend(edge(a, b)[:-1])
+            ring.append(ring[0])
+            index = r * cols + c + 1
+            features.append({
+                'type': 'Feature',
+                'properties': {'Name': f"brgy-{index}", 'BARANGAY': f"BARANGAY {index}", 'BRGY_INDEX': index},
+                'geometry': {'type': 'Polygon', 'coordinates': [ring]},
+            })
+
+    return {'type': 'FeatureCollection', 'name': 'Barangay', 'features': features}
+
+
+def synthetic_road_network(
+    nodes: int,
+    seed: int = 42,
+    extra_edge_rate: float = 0.15,
+    bbox: Optional[dict] = None,
+) -> dict:
+    """A basey-roads.geojson-shaped network of roughly `nodes` intersections
+
+    Nodes sit on a jittered grid; each is joined to its right and lower
+    neighbour (plus some diagonals) by a short multi-vertex LineString.
+    """
+    rng = random.Random(seed)
+    bbox = bbox or BASEY_BBOX
+    side = max(2, int(nodes ** 0.5))
+    dlat = (bbox['lat_max'] - bbox['lat_min']) / side
+    dlng = (bbox['lng_max'] - bbox['lng_min']) / side
+
+    grid = [
+        [
+            (
+                round(bbox['lng_min'] + (c + 0.5 + rng.uniform(-0.3, 0.3)) * dlng, 5),
+                round(bbox['lat_min'] + (r + 0.5 + rng.uniform(-0.3, 0.3)) * dlat, 5),
+            )
+            for c in range(side)
+        ]
+        for r in range(side)
+    ]
+
+    def line(a, b):
+        mid = (
+            round((a[0] + b[0]) / 2 + rng.uniform(-0.1, 0.1) * dlng, 5),
+            round((a[1] + b[1]) / 2 + rng.uniform(-0.1, 0.1) * dlat, 5),
+        )
+        return [list(a), list(mid), list(b)]
+
+    features = []
+    for r in range(side):
+        for c in range(side):
+            neighbours = []
+            if c + 1 < side:
+                neighbours.append(grid[r][c + 1])
+            if r + 1 < side:
+                neighbours.append(grid[r + 1][c])
+            if r + 1 < side and c + 1 < side and rng.random() < extra_edge_rate:
+                neighbours.append(grid[r + 1][c + 1])
+            for other in neighbours:
+                features.append({
+                    'type': 'Feature',
+                    'properties': {
+                        'highway': rng.choices(HIGHWAY_CLASSES, HIGHWAY_WEIGHTS)[0],
+                        'oneway': None,
+                    },
+                    'geometry': {'type': 'LineString', 'coordinates': line(grid[r][c], other)},
+                })
+
+    return {'type': 'FeatureCollection', 'features': features}
@@ -0,0 +1,76 @@
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+import { NextRequest } from "next/server";
+
+const reverseGeocodeMock = vi.hoisted(() => vi.fn());
+
+vi.mock("@googlemaps/google-maps-services-js", () => ({
+  Client: vi.fn().mockImplementation(() => ({ reverseGeocode: reverseGeocodeMock })),
+}));
+
+import { POST } from "@/app/api/geocode/reverse/route";
+
+function reverseRequest(body: unknown) {
+  return new NextRequest("http://localhost/api/geocode/reverse", {
+    method: "POST",
+    body: JSON.stringify(body),
+  });
+}
+
+beforeEach(() => {
+  vi.clearAllMocks();
+});
+
+afterEach(() => {
+  vi.unstubAllEnvs();
+  vi.unstubAllGlobals();
+});
+
+describe("POST /api/geocode/reverse with LOCAL_GEOCODER_URL", () => {
+  it("forwards the lookup to the local geocoder and relays its status and body", async () => {
+    vi.stubEnv("LOCAL_GEOCODER_URL", "http://127.0.0.1:8765/");
+    vi.stubEnv("GOOGLE_MAPS_SERVER_API_KEY", "google-key");
+    const localBody = {
+      success: true,
+      result: { status: "OK", results: [{ formatted_address: "Amandayehan, Basey, Samar" }] },
+    };
+    const fetchMock = vi.fn().mockResolvedValue(new Response(JSON.stringify(localBody), { status: 200 }));
+    vi.stubGlobal("fetch", fetchMock);
+
+    const res = await POST(reverseRequest({ lat: 11.278823, lng: 125.001194 }));
+
+    expect(res.status).toBe(200);
+    expect(await res.json()).toEqual(localBody);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    const [url, init] = fetchMock.mock.calls[0];
+    expect(url).toBe("http://127.0.0.1:8765/api/geocode/reverse");
+    expect(JSON.parse(init.body as string)).toEqual({ lat: 11.278823, lng: 125.001194 });
+    expect(init.signal).toBeInstanceOf(AbortSignal);
+    expect(reverseGeocodeMock).not.toHaveBeenCalled();
+  });
+
+  it("relays a local geocoder error status", async () => {
+    vi.stubEnv("LOCAL_GEOCODER_URL", "http://127.0.0.1:8765");
+    vi.stubGlobal("fetch", vi.fn().mockResolvedValue(
+      new Response(JSON.stringify({ error: "Geocoding failed: ZERO_RESULTS" }), { status: 400 }),
+    ));
+
+    const res = await POST(reverseRequest({ lat: 11.278823, lng: 125.001194 }));
+
+    expect(res.status).toBe(400);
+    expect((await res.json()).error).toContain("ZERO_RESULTS");
+    expect(reverseGeocodeMock).not.toHaveBeenCalled();
+  });
+
+  it("returns 504 when the local geocoder does not answer in time", async () => {
+    vi.stubEnv("LOCAL_GEOCODER_URL", "http://127.0.0.1:8765");
+    vi.stubGlobal("fetch", vi.fn().mockRejectedValue(
+      Object.assign(new Error("The operation was aborted"), { name: "AbortError" }),
+    ));
+
+    const res = await POST(reverseRequest({ lat: 11.278823, lng: 125.001194 }));
+
+    expect(res.status).toBe(504);
+    expect((await res.json()).error).toContain("timed out");
+    expect(reverseGeocodeMock).not.toHaveBeenCalled();
+  });
+});
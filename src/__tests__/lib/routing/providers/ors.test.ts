@@ -144,3 +144,39 @@ describe("OrsProvider.calculate", () => {
     } satisfies Partial<RoutingServiceError>);
   });
 });
+
+describe("OrsProvider endpoint", () => {
+  const origin = { lat: 11.278823, lng: 125.001194 };
+  const dest   = { lat: 11.304796, lng: 125.108990 };
+
+  // ROUTING_ORS_URL is read when the module loads, so each case re-imports it.
+  async function requestedUrl(): Promise<string> {
+    vi.stubEnv("OPENROUTESERVICE_API_KEY", "test-key");
+    const fetchMock = vi.fn().mockResolvedValue({
+      ok: true,
+      json: () => Promise.resolve({
+        routes: [{ summary: { distance: 1000, duration: 60 }, geometry: null }],
+      }),
+    });
+    vi.stubGlobal("fetch", fetchMock);
+
+    vi.resetModules();
+    const { OrsProvider: FreshOrsProvider } = await import("@/lib/routing/providers/ors");
+    await new FreshOrsProvider().calculate(origin, dest);
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    return fetchMock.mock.calls[0][0] as string;
+  }
+
+  it("posts to ROUTING_ORS_URL when it is set", async () => {
+    vi.stubEnv("ROUTING_ORS_URL", "http://localhost:8080/ors/v2/directions/driving-car");
+    expect(await requestedUrl()).toBe("http://localhost:8080/ors/v2/directions/driving-car");
+  });
+
+  it("posts to the public ORS endpoint when ROUTING_ORS_URL is unset", async () => {
+    vi.stubEnv("ROUTING_ORS_URL", "");
+    expect(await requestedUrl()).toBe(
+      "https://api.openrouteservice.org/v2/directions/driving-car"
+    );
+  });
+});
@@ -0,0 +1,49 @@
+import { beforeAll, describe, expect, it, vi } from "vitest";
+
+import { routePairKey } from "@/lib/offline/routeCache";
+import { OFFLINE_GRAPH_REASON, resolveOfflineRoute } from "@/lib/routing/offlineRoute";
+import { lookupWarmRoute } from "@/lib/routing/warmRoutes";
+
+// Known Basey coordinates from src/data/basey-locations.json
+const AMANDAYEHAN = { lat: 11.278823, lng: 125.001194 };
+const BALUD = { lat: 11.292884, lng: 125.129768 };
+
+const WARM = { distanceKm: 17.25, durationMin: 34.5, polyline: "_p~iF~ps|U_ulLnnqC" };
+
+beforeAll(() => {
+  // Serve a one-route warm-routes.json in the precompute-routes.py format.
+  vi.stubGlobal("fetch", async (url: string) => {
+    if (String(url).includes("warm-routes")) {
+      const routes = [
+        { key: routePairKey(AMANDAYEHAN, BALUD), from: "Amandayehan", to: "Balud", trips: 12, ...WARM },
+      ];
+      return new Response(JSON.stringify({ version: 1, routes }), { status: 200 });
+    }
+    return new Response("", { status: 404 });
+  });
+});
+
+describe("lookupWarmRoute", () => {
+  it("finds a precomputed pair by routePairKey", async () => {
+    expect(await lookupWarmRoute(AMANDAYEHAN, BALUD)).toEqual(WARM);
+  });
+
+  it("returns null for a pair that was not precomputed", async () => {
+    expect(await lookupWarmRoute(BALUD, AMANDAYEHAN)).toBeNull();
+  });
+});
+
+describe("resolveOfflineRoute", () => {
+  it("prefers a warm route over building the road graph", async () => {
+    const result = await resolveOfflineRoute({
+      origin: AMANDAYEHAN,
+      destination: BALUD,
+      passengerType: "REGULAR",
+    });
+
+    expect(result.fallbackReason).toBe(OFFLINE_GRAPH_REASON);
+    expect(result.distanceKm).toBe(WARM.distanceKm);
+    expect(result.durationMin).toBe(WARM.durationMin);
+    expect(result.polyline).toBe(WARM.polyline);
+  });
+});
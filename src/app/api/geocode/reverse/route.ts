@@ -4,6 +4,9 @@ import { Client } from '@googlemaps/google-maps-services-js';
 
 const client = new Client({});
 
+/** Give up on the local geocoder after this long, like the routing providers do. */
+const LOCAL_GEOCODER_TIMEOUT_MS = 5000;
+
 export async function POST(request: NextRequest) {
   try {
     const { lat, lng } = await request.json();
@@ -15,6 +18,34 @@ export async function POST(request: NextRequest) {
       );
     }
 
+    // Local stand-in for Google (python scripts/geocode-server.py)
+    const localGeocoderUrl = process.env.LOCAL_GEOCODER_URL;
+
+    if (localGeocoderUrl) {
+      const controller = new AbortController();
+      const timeoutId = setTimeout(() => controller.abort(), LOCAL_GEOCODER_TIMEOUT_MS);
+      try {
+        const localResponse = await fetch(`${localGeocoderUrl.replace(/\/$/, '')}/api/geocode/reverse`, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ lat, lng }),
+          signal: controller.signal,
+        });
+        const data = await localResponse.json();
+        return NextResponse.json(data, { status: localResponse.status });
+      } catch (error) {
+        if (error instanceof Error && error.name === 'AbortError') {
+          return NextResponse.json(
+            { error: `Local geocoder timed out after ${LOCAL_GEOCODER_TIMEOUT_MS}ms` },
+            { status: 504 }
+          );
+        }
+        throw error;
+      } finally {
+        clearTimeout(timeoutId);
+      }
+    }
+
     const apiKey = process.env.GOOGLE_MAPS_SERVER_API_KEY;
 
     if (!apiKey) {
@@ -37,6 +37,14 @@ self.addEventListener("install", (event) => {
       } catch {
         // Graph not fetched yet — offline routing falls back to straight-line.
       }
+
+      try {
+        // Precomputed popular routes (scripts/precompute-routes.py).
+        const cache = await caches.open(DATA_CACHE);
+        await cache.add("/data/warm-routes.json");
+      } catch {
+        // Not generated for this build — offline routing uses the road graph.
+      }
     })(),
   );
 });
@@ -349,8 +349,8 @@ const RoutePlannerCalculator = ({
     const farePolicy = loadLastFarePolicy()
     const offlineInput = { origin: originCoord, destination: destCoord, passengerType, farePolicy }
 
-    // Resolution order: exact cached online result -> on-device road graph ->
-    // straight-line heuristic.
+    // Resolution order: exact cached online result -> precomputed warm route ->
+    // on-device road graph -> straight-line heuristic.
     let estimate: CalculatedRouteResponse
     const cached = await loadCachedRoute(routePairKey(originCoord, destCoord))
     if (cached) {
@@ -8,10 +8,11 @@ import { estimatedRoadKm } from "./geo";
 import { routeOffline } from "./offlineGraph";
 import type { Coordinates } from "./providers/base";
 import type { CalculatedRouteResponse, PassengerType } from "./types";
+import { lookupWarmRoute } from "./warmRoutes";
 
 /** Straight-line × road-factor heuristic (pin off-network or graph missing). */
 export const OFFLINE_FALLBACK_REASON = "offline_estimate";
-/** On-device road-graph route — road-accurate distance + polyline. */
+/** On-device road-graph route (or its precomputed warm copy) — road-accurate distance + polyline. */
 export const OFFLINE_GRAPH_REASON = "offline_graph";
 /** Exact replay of a route previously computed online (most accurate offline). */
 export const OFFLINE_CACHE_REASON = "offline_cache";
@@ -95,13 +96,22 @@ export function buildOfflineRouteFromCache(
 }
 
 /**
- * Resolve an offline route with road accuracy when possible: try the on-device
- * road graph first (real distance + polyline), and fall back to the
- * straight-line heuristic when the pin is off-network or the graph is missing.
+ * Resolve an offline route with road accuracy when possible: use a warm route
+ * precomputed for a popular pair, then the on-device road graph (real
+ * distance + polyline), and fall back to the straight-line heuristic when the
+ * pin is off-network or the graph is missing.
  */
 export async function resolveOfflineRoute(
   input: OfflineRouteInput,
 ): Promise<CalculatedRouteResponse> {
+  try {
+    const warm = await lookupWarmRoute(input.origin, input.destination);
+    if (warm) {
+      return buildResponse(input, { ...warm, fallbackReason: OFFLINE_GRAPH_REASON });
+    }
+  } catch {
+    // Fall through to the road graph.
+  }
   try {
     const graph = await routeOffline(input.origin, input.destination);
     if (graph) {
@@ -6,7 +6,9 @@ import {
 } from "../types";
 import type { Coordinates, RoutingProvider } from "./base";
 
+/** ROUTING_ORS_URL points at a self-hosted ORS or a load-test stub. */
 const ORS_ENDPOINT =
+  process.env.ROUTING_ORS_URL ||
   "https://api.openrouteservice.org/v2/directions/driving-car";
 const ORS_SHORTEST_PREFERENCE = "shortest" as const;
 
@@ -0,0 +1,48 @@
+import { routePairKey } from "@/lib/offline/routeCache";
+
+import type { Coordinates } from "./providers/base";
+
+/** Written by scripts/precompute-routes.py; absent until that script has run. */
+const WARM_ROUTES_URL = "/data/warm-routes.json";
+
+export interface WarmRoute {
+  distanceKm: number;
+  durationMin: number;
+  polyline: string | null;
+}
+
+let routesPromise: Promise<Map<string, WarmRoute> | null> | null = null;
+
+/** Lazy-load the precomputed routes once, keyed by routePairKey. */
+function getWarmRoutes(): Promise<Map<string, WarmRoute> | null> {
+  if (!routesPromise) {
+    routesPromise = (async () => {
+      try {
+        const res = await fetch(WARM_ROUTES_URL);
+        if (!res.ok) return null;
+        const data = (await res.json()) as { routes?: (WarmRoute & { key: string })[] };
+        const routes = new Map<string, WarmRoute>();
+        for (const { key, distanceKm, durationMin, polyline } of data.routes ?? []) {
+          routes.set(key, { distanceKm, durationMin, polyline });
+        }
+        return routes;
+      } catch {
+        return null;
+      }
+    })();
+  }
+  return routesPromise;
+}
+
+/**
+ * Precomputed road route for a popular pair, or null when the pair (or the
+ * file) is missing. Routes come from the same road graph and average speed
+ * as routeOffline, so a hit saves building the graph on the device.
+ */
+export async function lookupWarmRoute(
+  origin: Coordinates,
+  destination: Coordinates,
+): Promise<WarmRoute | null> {
+  const routes = await getWarmRoutes();
+  return routes?.get(routePairKey(origin, destination)) ?? null;
+}